@@ -0,0 +1,59 @@
+"""Decode/encode time of the installed JSON codecs on the tests/data mock responses.
+
+Run from the repository root: PYTHONPATH=. python benchmarks/bench_json_codecs.py
+"""
+from cschwabpy.json_codec import JSON_CODECS, IJsonCodec, get_json_codec
+from cschwabpy.models.trade_models import Order
+from pathlib import Path
+from typing import Any, Callable, List
+import timeit
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def bench(func: Callable[[], Any], number: int) -> float:
+    return min(timeit.repeat(func, number=number, repeat=5)) / number * 1e6
+
+
+def installed_codecs() -> List[IJsonCodec]:
+    codecs: List[IJsonCodec] = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            print(f"{name}: not installed")
+    return codecs
+
+
+def main() -> None:
+    codecs = installed_codecs()
+    stdlib = get_json_codec("json")
+    for file_name in ("mock_schwab_api_resp.json", "AAPL_options.json"):
+        raw = (DATA_DIR / file_name).read_bytes()
+        decoded = stdlib.loads(raw)
+        number = max(10, 20_000_000 // len(raw))
+        print(f"\n{file_name} ({len(raw) / 1024:.0f} KB)")
+        for codec in codecs:
+            loads_us = bench(lambda: codec.loads(raw), number)
+            dumps_us = bench(lambda: codec.dumps(decoded), number)
+            print(
+                f"  {codec.name:<8} loads {loads_us:>10.1f} us   dumps {dumps_us:>10.1f} us"
+            )
+
+    mock_responses = stdlib.loads((DATA_DIR / "mock_schwab_api_resp.json").read_bytes())
+    order = Order(**mock_responses["filled_order"])
+    expected = order.to_json_bytes()
+    print("\norder payload")
+    print(
+        f"  {'pydantic':<8} to_json_bytes {bench(order.to_json_bytes, 5000):>6.1f} us"
+    )
+    for codec in codecs:
+        same = codec.dumps(order.to_json()) == expected
+        dumps_us = bench(lambda: codec.dumps(order.to_json()), 5000)
+        print(
+            f"  {codec.name:<8} dumps(to_json) {dumps_us:>5.1f} us   same bytes: {same}"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,73 @@
+"""Serialization cost of orders and option chains: the former dump-then-walk to_json vs the single-pass one.
+
+Run from the repository root: PYTHONPATH=. python benchmarks/bench_serialization.py
+"""
+from cschwabpy.models import JSONSerializableBaseModel, OptionChain
+from cschwabpy.models.trade_models import Order
+from datetime import date, datetime
+from enum import Enum
+from pathlib import Path
+from typing import Any, Callable, MutableMapping
+import json
+import timeit
+
+DATA_DIR = Path(__file__).parent.parent / "tests" / "data"
+
+
+def legacy_to_json(model: JSONSerializableBaseModel) -> MutableMapping[str, Any]:
+    """to_json before the single-pass rewrite: model_dump, then a Python walk dropping None values."""
+
+    def del_none(d: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
+        for key, value in list(d.items()):
+            if value is None:
+                del d[key]
+            elif isinstance(value, MutableMapping):
+                d[key] = del_none(value)
+        return d
+
+    def handle_item(item: Any) -> Any:
+        if isinstance(item, dict):
+            return del_none(item)
+        elif isinstance(item, list):
+            return [handle_item(itm) for itm in item]
+        elif isinstance(item, set):
+            return {handle_item(itm) for itm in item}
+        elif isinstance(item, Enum):
+            return item.value
+        elif isinstance(item, (datetime, date)):
+            return str(item)
+        return item
+
+    return {
+        k: handle_item(v)
+        for k, v in model.model_dump(by_alias=True).items()
+        if v is not None
+    }
+
+
+def bench(name: str, func: Callable[[], Any], number: int) -> float:
+    seconds = min(timeit.repeat(func, number=number, repeat=5)) / number
+    print(f"{name:<45} {seconds * 1e6:>12.1f} us")
+    return seconds
+
+
+def main() -> None:
+    mock_responses = json.loads((DATA_DIR / "mock_schwab_api_resp.json").read_text())
+    order = Order(**mock_responses["filled_order"])
+    chain = OptionChain(**json.loads((DATA_DIR / "AAPL_options.json").read_text()))
+
+    for label, model, number in (("order", order, 2000), ("option chain", chain, 20)):
+        before = bench(
+            f"{label}: json.dumps(legacy to_json())",
+            lambda: json.dumps(legacy_to_json(model)).encode(),
+            number,
+        )
+        bench(f"{label}: to_json()", lambda: model.to_json(), number)
+        after = bench(
+            f"{label}: to_json_bytes()", lambda: model.to_json_bytes(), number
+        )
+        print(f"{label}: request body {before / after:.1f}x faster\n")
+
+
+if __name__ == "__main__":
+    main()
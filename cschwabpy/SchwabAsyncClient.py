@@ -1,16 +1,31 @@
-from cschwabpy.models.token import Tokens, IAsyncTokenStore, AsyncLocalTokenStore
+from cschwabpy.models.token import (
+    Tokens,
+    IAsyncTokenStore,
+    AsyncLocalTokenStore,
+    TokensNotAvailableError,
+    ACCESS_TOKEN_REFRESH_MARGIN_SECONDS,
+    get_shared_refresh_lock,
+)
 from cschwabpy.models import (
     OptionChainQueryFilter,
     OptionContractType,
     OptionChain,
+    OptionChainDownloadResult,
+    OptionChainExpiration,
+    OptionContract,
+    OPTION_CHAIN_EXP_DATE_MAP_KEYS,
     OptionExpiration,
     OptionExpirationChainResponse,
     MarketType,
     MarketHourInfo,
+    expiration_windows,
+    merge_option_chains,
 )
 from cschwabpy.models.trade_models import (
     AccountNumberWithHashID,
     AccountInstrument,
+    AccountSnapshotEntry,
+    AccountsSnapshot,
     SecuritiesAccount,
     Account,
     OrderStatus,
@@ -19,8 +34,55 @@ from cschwabpy.models.trade_models import (
 )
 import cschwabpy.util as util
 
+from cschwabpy.account_cache import (
+    AccountRef,
+    AccountHashCache,
+    AccountNotFoundError,
+)
+from cschwabpy.expiration_cache import (
+    OptionExpirationCache,
+    OptionExpirationSchedule,
+)
+from cschwabpy.json_codec import IJsonCodec, default_json_codec
+from cschwabpy.json_stream import JsonItem, iter_json_items_async
+from cschwabpy.instrument_cache import (
+    InstrumentCache,
+    BATCHABLE_PROJECTIONS,
+    INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST,
+)
+from cschwabpy.market_calendar import MarketHoursCache
+from cschwabpy.rate_limit import IRateLimiter
+from cschwabpy.retry import RetryPolicy
+from cschwabpy.transport import (
+    PoolConfig,
+    PoolStats,
+    AuthHeaders,
+    EMPTY_HEADERS,
+    JSON_CONTENT_TYPE_HEADER,
+    read_connection_counts,
+)
+from cschwabpy.concurrency import (
+    iter_bounded,
+    LoopLocalLock,
+    DEFAULT_MAX_CONCURRENCY,
+)
+from cschwabpy.pagination import iter_bisected_windows_async, DEFAULT_ORDERS_PAGE_SIZE
+
+from contextlib import asynccontextmanager
 from datetime import datetime, timedelta, date
-from typing import Optional, List, Mapping
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    List,
+    Mapping,
+    MutableMapping,
+    Any,
+    AsyncIterator,
+    Iterable,
+    Set,
+    Tuple,
+    Union,
+)
 from cschwabpy.costants import (
     SCHWAB_API_BASE_URL,
     SCHWAB_MARKET_DATA_API_BASE_URL,
@@ -28,16 +90,22 @@ from cschwabpy.costants import (
     SCHWAB_AUTH_PATH,
     SCHWAB_TOKEN_PATH,
 )
+import asyncio
 import backoff
 import httpx
 import re
 import base64
-import json
+
+if TYPE_CHECKING:
+    from cschwabpy.models.frames import OptionChainDataFrames
 
 HEADER_ORDER_ID_PATTERN = re.compile(r"orders/(\d+)")
+AUTO_REFRESH_RETRY_SECONDS = 5
 
 
 class SchwabAsyncClient(object):
+    """Async client. Use `async with SchwabAsyncClient(...)` to share one pooled connection set across calls."""
+
     def __init__(
         self,
         app_client_id: str,
@@ -45,33 +113,319 @@ class SchwabAsyncClient(object):
         token_store: IAsyncTokenStore = AsyncLocalTokenStore(),
         tokens: Optional[Tokens] = None,
         http_client: Optional[httpx.AsyncClient] = None,
+        pool_config: Optional[PoolConfig] = None,
+        rate_limiter: Optional[IRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        market_hours_cache: Optional[MarketHoursCache] = None,
+        expiration_cache: Optional[OptionExpirationCache] = None,
+        instrument_cache: Optional[InstrumentCache] = None,
+        account_hash_cache: Optional[AccountHashCache] = None,
+        json_codec: Optional[IJsonCodec] = None,
+        refresh_margin_seconds: float = ACCESS_TOKEN_REFRESH_MARGIN_SECONDS,
+        share_refresh_across_clients: bool = False,
+        auto_refresh: bool = False,
     ) -> None:
+        """
+        @param rate_limiter: throttles requests client-side, share one SchwabRateLimiter across clients of an app.
+        @param retry_policy: retries idempotent requests on 429/5xx/connection errors, default RetryPolicy().
+        @param market_hours_cache: market hours by (market type, date), default an in-memory MarketHoursCache.
+        @param expiration_cache: option expirations by underlying, default an OptionExpirationCache with 6h TTL.
+        @param instrument_cache: instruments by (symbol, projection), default an InstrumentCache (LRU, 24h TTL).
+        @param account_hash_cache: accountNumber -> hashValue, lets trader methods take plain account numbers.
+        @param json_codec: decodes responses, default the fastest installed of orjson, msgspec and json.
+        @param refresh_margin_seconds: access token is refreshed in background this long before it expires.
+        @param share_refresh_across_clients: single-flight refresh per token store for all clients in the process.
+        @param auto_refresh: keep a background task refreshing the access token while the client is opened.
+        """
         self.__client_id = app_client_id
         self.__client_secret = app_secret
         self.__token_store = token_store
         self.__client = http_client
-        self.__keep_client_alive = http_client is not None
-        self.__tokens = tokens
+        self.__owns_client = False
+        # batches sharing a client opened by __pooled_async, which closes it when the last one exits
+        self.__batch_pool_users = 0
+        self.__batch_owns_client = False
+        self.__batch_pool_lock = LoopLocalLock()
+        self.__pool_config = pool_config if pool_config is not None else PoolConfig()
+        self.__pool_stats = PoolStats()
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.__auth_headers: Optional[AuthHeaders] = None
+        self.__set_tokens(tokens)
+        self.market_hours_cache = (
+            market_hours_cache if market_hours_cache is not None else MarketHoursCache()
+        )
+        self.expiration_cache = (
+            expiration_cache
+            if expiration_cache is not None
+            else OptionExpirationCache()
+        )
+        self.instrument_cache = (
+            instrument_cache if instrument_cache is not None else InstrumentCache()
+        )
+        self.account_hash_cache = (
+            account_hash_cache if account_hash_cache is not None else AccountHashCache()
+        )
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.__account_numbers_lock = LoopLocalLock()
+        self.__refresh_margin_seconds = refresh_margin_seconds
+        self.__share_refresh = share_refresh_across_clients
+        self.__own_refresh_lock = LoopLocalLock()
+        self.__refresh_flight: Optional[asyncio.Future] = None
+        self.__auto_refresh = auto_refresh
+        self.__auto_refresh_task: Optional[asyncio.Task] = None
+        self.__background_refresh_task: Optional[asyncio.Task] = None
+
+    async def __aenter__(self) -> "SchwabAsyncClient":
+        self.open()
+        if self.__auto_refresh:
+            self.start_auto_refresh()
+        return self
+
+    async def __aexit__(self, *exc_info: Any) -> None:
+        await self.aclose()
+
+    def open(self) -> None:
+        """Opens the pooled http client owned by this client; no-op if a client is already in use."""
+        # opened explicitly while batches share a temporary client: it stays open after they finish
+        self.__batch_owns_client = False
+        if self.__client is not None:
+            return
+        self.__client = self.__pool_config.create_async_client(
+            headers=None if self.__auth_headers is None else self.__auth_headers.default
+        )
+        self.__owns_client = True
+        self.__pool_stats.clients_created += 1
+
+    async def aclose(self) -> None:
+        """Closes the pooled http client if it is owned by this client. Injected clients are left open."""
+        await self.stop_auto_refresh()
+        await self.__close_owned_client()
+
+    async def __close_owned_client(self) -> None:
+        if self.__owns_client and self.__client is not None:
+            await self.__client.aclose()
+            self.__client = None
+            self.__owns_client = False
+
+    @asynccontextmanager
+    async def __pooled_async(self) -> AsyncIterator[None]:
+        """
+        Shares one pooled client across a batch of calls, opening it just for the batch if needed.
+        Concurrent batches share that client, it is closed when the last of them exits.
+        """
+        async with self.__batch_pool_lock:
+            if self.__client is None:
+                self.open()
+                self.__batch_owns_client = True
+            joined = self.__batch_owns_client
+            if joined:
+                self.__batch_pool_users += 1
+        try:
+            yield
+        finally:
+            if joined:
+                async with self.__batch_pool_lock:
+                    self.__batch_pool_users -= 1
+                    if self.__batch_pool_users == 0 and self.__batch_owns_client:
+                        self.__batch_owns_client = False
+                        await self.__close_owned_client()
+
+    @property
+    def is_pooled(self) -> bool:
+        """Whether calls share one long-lived http client (owned or injected)."""
+        return self.__client is not None and not self.__client.is_closed
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        stats = self.__pool_stats
+        stats.pooled = self.is_pooled
+        stats.http2 = self.__owns_client and self.__pool_config.use_http2
+        stats.max_connections = self.__pool_config.max_connections
+        stats.max_keepalive_connections = self.__pool_config.max_keepalive_connections
+        stats.open_connections, stats.idle_connections = read_connection_counts(
+            self.__client
+        )
+        return stats
+
+    async def __send_async(
+        self, method: str, url: str, stream: bool = False, **kwargs: Any
+    ) -> httpx.Response:
+        """
+        Sends a request over the pooled client (or a one-off client when not pooled), retrying per retry policy.
+        @param stream: leave the body unread, the caller closes the response (see __stream_async).
+        """
+        one_off_client: Optional[httpx.AsyncClient] = None
+        try:
+            attempt = 0
+            while True:
+                if self.__rate_limiter is not None:
+                    await self.__rate_limiter.acquire_async(url)
+                # read on every attempt, the pooled client may have been closed while waiting to retry
+                client = self.__client
+                if client is None or client.is_closed:
+                    if one_off_client is None:
+                        one_off_client = self.__pool_config.create_async_client()
+                        self.__pool_stats.clients_created += 1
+                    client = one_off_client
+                try:
+                    if stream:
+                        response = await client.send(
+                            client.build_request(method, url, **kwargs), stream=True
+                        )
+                    else:
+                        response = await client.request(method, url, **kwargs)
+                except httpx.TransportError as ex:
+                    if not self.__retry_policy.should_retry_exception(
+                        method, ex, attempt
+                    ):
+                        raise
+                    delay = self.__retry_policy.delay_for(attempt)
+                else:
+                    self.__pool_stats.record_response(response)
+                    if not self.__retry_policy.should_retry_response(
+                        method, response, attempt
+                    ):
+                        return response
+                    delay = self.__retry_policy.delay_for(attempt, response)
+                    if stream:
+                        await response.aclose()
+                attempt += 1
+                self.__pool_stats.retries += 1
+                await asyncio.sleep(delay)
+        finally:
+            if one_off_client is not None:
+                await one_off_client.aclose()
+
+    @asynccontextmanager
+    async def __stream_async(
+        self, method: str, url: str, **kwargs: Any
+    ) -> AsyncIterator[httpx.Response]:
+        """__send_async with the body read by the caller as it arrives, the response is closed on exit."""
+        async with self.__pooled_async():
+            response = await self.__send_async(method, url, stream=True, **kwargs)
+            try:
+                yield response
+            finally:
+                await response.aclose()
 
     @property
     def token_url(self) -> str:
         return f"{SCHWAB_API_BASE_URL}/{SCHWAB_TOKEN_PATH}"
 
-    @backoff.on_exception(backoff.expo, Exception, max_tries=3, max_time=10)
+    @property
+    def __refresh_lock(self) -> asyncio.Lock:
+        if self.__share_refresh:
+            return get_shared_refresh_lock(self.__token_store)
+        return self.__own_refresh_lock.get()
+
+    @backoff.on_exception(
+        backoff.expo,
+        Exception,
+        max_tries=3,
+        max_time=10,
+        giveup=lambda ex: isinstance(ex, TokensNotAvailableError),
+    )
     async def _ensure_valid_access_token(self, force_refresh: bool = False) -> bool:
         if self.__tokens is None:
-            self.__tokens = await self.__token_store.get_tokens()
+            async with self.__refresh_lock:
+                if self.__tokens is None:
+                    self.__set_tokens(await self.__token_store.get_tokens())
 
         if self.__tokens is None:
-            raise Exception(
+            raise TokensNotAvailableError(
                 "Tokens are not available. Please use get_tokens_manually() to get tokens first."
             )
         if self.__tokens.is_access_token_valid and not force_refresh:
+            if self.__tokens.expires_within(self.__refresh_margin_seconds):
+                self.__schedule_background_refresh()
+            return True
+
+        return await self.__refresh_single_flight(self.__tokens)
+
+    def __schedule_background_refresh(self) -> None:
+        """Refreshes the soon-to-expire access token without blocking the caller."""
+        task = self.__background_refresh_task
+        if task is not None and not task.done():
+            return
+        self.__background_refresh_task = asyncio.ensure_future(
+            self.__refresh_single_flight(self.__tokens)
+        )
+
+    async def __refresh_single_flight(self, seen_tokens: Tokens) -> bool:
+        """
+        Only one refresh is in flight, other callers wait for it and get its result, failed or not,
+        so a rejected refresh token costs one POST. Callers arriving after it finished start a new one.
+        """
+        if self.__tokens is not seen_tokens:
             return True
-        client = httpx.AsyncClient() if self.__client is None else self.__client
+        flight = self.__refresh_flight
+        if (
+            flight is None
+            or flight.done()
+            or flight.get_loop() is not asyncio.get_running_loop()
+        ):
+            flight = asyncio.ensure_future(self.__refresh_under_lock(seen_tokens))
+            self.__refresh_flight = flight
+        # shielded, so a cancelled caller does not cancel the refresh the others wait for
+        return await asyncio.shield(flight)
+
+    async def __refresh_under_lock(self, seen_tokens: Tokens) -> bool:
+        async with self.__refresh_lock:
+            if self.__tokens is not seen_tokens:
+                # refreshed by another caller while waiting for the lock
+                return True
+            if self.__share_refresh:
+                stored_tokens = await self.__token_store.get_tokens()
+                if (
+                    stored_tokens is not None
+                    and stored_tokens.created_timestamp > seen_tokens.created_timestamp
+                    and stored_tokens.is_access_token_valid
+                ):
+                    # refreshed and saved by another client sharing the token store
+                    self.__set_tokens(stored_tokens)
+                    return True
+            return await self.__refresh_access_token()
+
+    def start_auto_refresh(self) -> None:
+        """Starts a background task refreshing the access token `refresh_margin_seconds` before it expires."""
+        if self.__auto_refresh_task is None or self.__auto_refresh_task.done():
+            self.__auto_refresh_task = asyncio.ensure_future(self.__auto_refresh_loop())
+
+    async def stop_auto_refresh(self) -> None:
+        for task in (self.__auto_refresh_task, self.__background_refresh_task):
+            if task is not None and not task.done():
+                task.cancel()
+                try:
+                    await task
+                except asyncio.CancelledError:
+                    pass
+        self.__auto_refresh_task = None
+        self.__background_refresh_task = None
+
+    async def __auto_refresh_loop(self) -> None:
+        while True:
+            if self.__tokens is None:
+                self.__set_tokens(await self.__token_store.get_tokens())
+            if self.__tokens is None:
+                await asyncio.sleep(AUTO_REFRESH_RETRY_SECONDS)
+                continue
+
+            delay = self.__tokens.seconds_until_expiry - self.__refresh_margin_seconds
+            if delay > 0:
+                await asyncio.sleep(delay)
+                continue
+
+            if not await self.__refresh_single_flight(self.__tokens):
+                await asyncio.sleep(AUTO_REFRESH_RETRY_SECONDS)
+
+    async def __refresh_access_token(self) -> bool:
         try:
             key_sec_encoded = self.__encode_app_key_secret()
-            response = await client.post(
+            response = await self.__send_async(
+                "POST",
                 url=self.token_url,
                 headers={
                     "Authorization": f"Basic {key_sec_encoded}",
@@ -84,8 +438,8 @@ class SchwabAsyncClient(object):
             )
 
             if response.status_code == 200:
-                json_res = response.json()
-                self.__tokens = Tokens(**json_res)
+                json_res = self.json_codec.loads(response.content)
+                self.__set_tokens(Tokens(**json_res))
                 await self.__token_store.save_tokens(self.__tokens)
                 return True
             else:
@@ -96,9 +450,6 @@ class SchwabAsyncClient(object):
         except Exception as ex:
             print("Failed to refresh access token. Please try again. exception: ", ex)
             return False
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
 
     def __encode_app_key_secret(self) -> str:
         key_sec = f"{self.__client_id}:{self.__client_secret}"
@@ -107,74 +458,104 @@ class SchwabAsyncClient(object):
         # refresh access token
         # doc: https://developer.schwab.com/products/trader-api--individual/details/documentation/Retail%20Trader%20API%20Production
 
-    def __auth_header(self) -> Mapping[str, str]:
-        return {
-            # "Content-Type": "application/json",
-            "Authorization": f"{self.__tokens.token_type} {self.__tokens.access_token}",
-            "Accept": "application/json",
-        }
+    def __set_tokens(self, tokens: Optional[Tokens]) -> None:
+        """The only place auth headers are rendered; swapped in one assignment when tokens change."""
+        self.__tokens = tokens
+        self.__auth_headers = (
+            None
+            if tokens is None
+            else AuthHeaders.render(tokens.token_type, tokens.access_token)
+        )
+        if self.__owns_client and self.__auth_headers is not None:
+            self.__client.headers.update(self.__auth_headers.default)
+
+    def __auth_header(self, json_content: bool = False) -> Mapping[str, str]:
+        """Pre-rendered headers; auth is already a default header of the owned pooled client."""
+        if self.__owns_client:
+            return JSON_CONTENT_TYPE_HEADER if json_content else EMPTY_HEADERS
+        if json_content:
+            return self.__auth_headers.json_content
+        return self.__auth_headers.default
 
     async def get_account_numbers_async(self) -> List[AccountNumberWithHashID]:
         await self._ensure_valid_access_token()
 
         target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/accountNumbers"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            json_res = response.json()
-            account_numbers: List[AccountNumberWithHashID] = []
-            for account_json in json_res:
-                account_numbers.append(AccountNumberWithHashID(**account_json))
-            return account_numbers
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        json_res = self.json_codec.loads(response.content)
+        account_numbers: List[AccountNumberWithHashID] = []
+        for account_json in json_res:
+            account_numbers.append(AccountNumberWithHashID(**account_json))
+        self.account_hash_cache.update(account_numbers)
+        return account_numbers
+
+    async def resolve_account_async(
+        self, account: AccountRef
+    ) -> AccountNumberWithHashID:
+        """
+        AccountNumberWithHashID of a plain account number (or known hash value), resolved from account_hash_cache.
+        The cache is filled by one get_account_numbers_async call on first use or after a miss.
+        """
+        if isinstance(account, AccountNumberWithHashID):
+            return account
+
+        resolved = self.account_hash_cache.get(account)
+        if resolved is None:
+            async with self.__account_numbers_lock:
+                resolved = self.account_hash_cache.get(account)
+                if resolved is None:
+                    await self.get_account_numbers_async()
+                    resolved = self.account_hash_cache.get(account)
+        if resolved is None:
+            raise AccountNotFoundError(f"Account {account} is not linked to this app")
+        return resolved
+
+    async def __account_hash_value_async(self, account: AccountRef) -> str:
+        return (await self.resolve_account_async(account)).hashValue
+
+    def invalidate_account_hashes(self, account_number: Optional[str] = None) -> None:
+        """Drops cached account hash resolutions, all of them when no account number is given."""
+        self.account_hash_cache.invalidate(account_number)
 
     async def get_accounts_async(
         self,
         include_positions: bool = True,
-        with_account_number_hash: Optional[AccountNumberWithHashID] = None,
+        with_account_number_hash: Optional[AccountRef] = None,
     ) -> List[Account]:
         """get all accounts except a specific account_number is provided."""
         await self._ensure_valid_access_token()
         target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts"
         if with_account_number_hash is not None:
-            target_url = f"{target_url}/{with_account_number_hash.hashValue}"
+            hash_value = await self.__account_hash_value_async(with_account_number_hash)
+            target_url = f"{target_url}/{hash_value}"
 
         if include_positions:
             target_url = f"{target_url}?fields=positions"
 
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            if response.status_code == 200:
-                json_res = response.json()
-                if with_account_number_hash is None:
-                    accounts: List[SecuritiesAccount] = []
-                    for account_json in json_res:
-                        securities_account = SecuritiesAccount(
-                            **account_json
-                        ).securitiesAccount
-                        accounts.append(securities_account)
-                    return accounts
-                else:
-                    securities_account = SecuritiesAccount(**json_res).securitiesAccount
-                    return [securities_account]
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            if with_account_number_hash is None:
+                accounts: List[SecuritiesAccount] = []
+                for account_json in json_res:
+                    securities_account = SecuritiesAccount(
+                        **account_json
+                    ).securitiesAccount
+                    accounts.append(securities_account)
+                return accounts
             else:
-                raise Exception(
-                    "Failed to get accounts. Status: ", response.status_code
-                )
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+                securities_account = SecuritiesAccount(**json_res).securitiesAccount
+                return [securities_account]
+        else:
+            raise Exception("Failed to get accounts. Status: ", response.status_code)
 
     async def get_single_account_async(
         self,
-        with_account_number_hash: AccountNumberWithHashID,
+        with_account_number_hash: AccountRef,
         include_positions: bool = True,
     ) -> Optional[Account]:
         """Convenience method to get a single account by account number's encrypted ID."""
@@ -187,153 +568,477 @@ class SchwabAsyncClient(object):
 
         return account[0]
 
+    async def get_accounts_snapshot_async(
+        self,
+        account_number_hashes: Iterable[AccountRef],
+        include_positions: bool = True,
+        balances_only: Iterable[AccountRef] = (),
+        previous: Optional[AccountsSnapshot] = None,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AccountsSnapshot:
+        """
+        Fetches the given accounts concurrently over the pooled connections, one request per account,
+        each entry stamped with its fetch time. A failed account, or one not linked to the app, gets an entry
+        with `error` set.
+        @param balances_only: accounts whose positions are known not to have changed, fetched without positions;
+            their positions are carried over from `previous` when it has them.
+        """
+
+        def ref_key(account_ref: AccountRef) -> str:
+            if isinstance(account_ref, AccountNumberWithHashID):
+                return account_ref.accountNumber
+            return account_ref
+
+        account_refs: MutableMapping[str, AccountRef] = {}
+        for account_ref in account_number_hashes:
+            account_refs.setdefault(ref_key(account_ref), account_ref)
+        # matched against both account number and hash value, so these need no resolution
+        without_positions = {ref_key(account_ref) for account_ref in balances_only}
+
+        async def fetch_account(account_ref: AccountRef) -> AccountSnapshotEntry:
+            # resolved here, so an account that is not linked fails only its own entry
+            account = await self.resolve_account_async(account_ref)
+            with_positions = (
+                include_positions
+                and account.accountNumber not in without_positions
+                and account.hashValue not in without_positions
+            )
+            found = await self.get_accounts_async(
+                include_positions=with_positions, with_account_number_hash=account
+            )
+            fetched_at = util.now()
+            entry = AccountSnapshotEntry(
+                account_number=account,
+                account=found[0] if len(found) > 0 else None,
+                fetched_at=fetched_at,
+                positions_fetched_at=fetched_at if with_positions else None,
+            )
+            previous_entry = (
+                None
+                if previous is None
+                else previous.entries.get(account.accountNumber)
+            )
+            if (
+                include_positions
+                and not with_positions
+                and entry.account is not None
+                and previous_entry is not None
+                and previous_entry.account is not None
+                and previous_entry.positions_fetched_at is not None
+            ):
+                entry.account = entry.account.model_copy(
+                    update={"positions": previous_entry.account.positions}
+                )
+                entry.positions_fetched_at = previous_entry.positions_fetched_at
+            return entry
+
+        snapshot = AccountsSnapshot(started_at=util.now(), completed_at=util.now())
+        results: MutableMapping[str, Union[AccountSnapshotEntry, Exception]] = {}
+        async with self.__pooled_async():
+            async for account_ref, result in iter_bounded(
+                account_refs.values(),
+                fetch_account,
+                max_concurrency=max_concurrency,
+                return_exceptions=True,
+            ):
+                results[ref_key(account_ref)] = result  # type: ignore
+
+        for key, account_ref in account_refs.items():
+            result = results[key]
+            if isinstance(result, Exception):
+                account_number = (
+                    account_ref
+                    if isinstance(account_ref, AccountNumberWithHashID)
+                    else self.account_hash_cache.get(account_ref)
+                )
+                if account_number is None:
+                    # not linked to this app, so there is no hash value to report
+                    account_number = AccountNumberWithHashID(
+                        accountNumber=key, hashValue=""
+                    )
+                result = AccountSnapshotEntry(
+                    account_number=account_number, error=result
+                )
+            # a hash value and its account number in the same request share one entry
+            snapshot.entries.setdefault(result.account_number.accountNumber, result)
+        snapshot.completed_at = util.now()
+        return snapshot
+
     async def get_instruments_async(
         self,
         symbol: str,
         projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> List[AccountInstrument]:
+        return await self.__request_instruments_async(symbol, projection)
+
+    async def __request_instruments_async(
+        self, symbol: str, projection: InstrumentProjection
     ) -> List[AccountInstrument]:
         await self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/instruments?symbol={symbol}&projection={projection.value}"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        json_res = self.json_codec.loads(response.content)
+        instruments: List[AccountInstrument] = []
+        if "instruments" in json_res:
+            for instrument in json_res["instruments"]:
+                instruments.append(AccountInstrument(**instrument))
+        return instruments
 
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            json_res = response.json()
-            instruments: List[AccountInstrument] = []
-            if "instruments" in json_res:
-                for instrument in json_res["instruments"]:
-                    instruments.append(AccountInstrument(**instrument))
-            return instruments
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+    async def get_instruments_by_symbols_async(
+        self,
+        symbols: Iterable[str],
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        use_cache: bool = True,
+    ) -> Mapping[str, AccountInstrument]:
+        """
+        Instruments of many symbols by upper-cased symbol, in input order. Symbols missing from instrument_cache
+        are requested comma-joined, INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST per request, with requests run concurrently.
+        Symbols Schwab does not know are left out.
+        @param projection: InstrumentProjection.Fundamental or SymbolSearch, the projections that match symbols exactly.
+        """
+        projection = InstrumentProjection(projection)
+        if projection.value not in BATCHABLE_PROJECTIONS:
+            raise ValueError(f"{projection.value} lookups cannot be batched by symbol")
+
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        to_fetch = (
+            self.instrument_cache.missing(symbols, projection) if use_cache else symbols
+        )
+        fetched: MutableMapping[str, AccountInstrument] = {}
+        batches = util.chunked(to_fetch, INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST)
+        if len(batches) > 0:
+            async with self.__pooled_async():
+                async for _, instruments in iter_bounded(
+                    batches,
+                    lambda batch: self.__request_instruments_async(
+                        ",".join(batch), projection
+                    ),
+                    max_concurrency=max_concurrency,
+                ):
+                    for instrument in instruments:  # type: ignore
+                        self.instrument_cache.put(instrument, projection)
+                        if instrument.symbol is not None:
+                            fetched[instrument.symbol.upper()] = instrument
+
+        result: MutableMapping[str, AccountInstrument] = {}
+        for symbol in symbols:
+            instrument = fetched.get(symbol)
+            if instrument is None and use_cache:
+                instrument = self.instrument_cache.get(symbol, projection)
+            if instrument is not None:
+                result[symbol] = instrument
+        return result
 
     async def cancel_order_async(
-        self, account_number_hash: AccountNumberWithHashID, order_id: int
+        self, account_number_hash: AccountRef, order_id: int
     ) -> bool:
         """Cancel an order by order ID."""
         await self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders/{order_id}"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.delete(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
+        hash_value = await self.__account_hash_value_async(account_number_hash)
+        target_url = (
+            f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders/{order_id}"
+        )
+        response = await self.__send_async(
+            "DELETE", url=target_url, headers=self.__auth_header()
+        )
 
-            return response.status_code == 200
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        return response.status_code == 200
 
     async def place_order_async(
-        self, account_number_hash: AccountNumberWithHashID, order: Order
+        self, account_number_hash: AccountRef, order: Order
     ) -> int:
         """Place an order (Equity or Option) for a specific account, returns order id (int)."""
         await self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            _header = self.__auth_header()
-            _header["Content-Type"] = "application/json"
-            response = await client.post(
-                url=target_url,
-                data=json.dumps(order.to_json()),
-                headers=_header,
-            )
-            if response.status_code == 201:
-                location_url = response.headers.get("Location")
-                if location_url is not None:
-                    needle = re.search(HEADER_ORDER_ID_PATTERN, location_url)
-                    if needle:
-                        return int(needle.group(1))
-                    else:
-                        raise Exception("Failed to locate order ID in response")
+        hash_value = await self.__account_hash_value_async(account_number_hash)
+        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders"
+        response = await self.__send_async(
+            "POST",
+            url=target_url,
+            content=order.to_json_bytes(),
+            headers=self.__auth_header(json_content=True),
+        )
+        if response.status_code == 201:
+            location_url = response.headers.get("Location")
+            if location_url is not None:
+                needle = re.search(HEADER_ORDER_ID_PATTERN, location_url)
+                if needle:
+                    return int(needle.group(1))
+                else:
+                    raise Exception("Failed to locate order ID in response")
 
-            raise Exception("Failed to place order. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        raise Exception("Failed to place order. Status: ", response.status_code)
 
     async def get_order_by_id_async(
         self,
-        account_number_hash: AccountNumberWithHashID,
+        account_number_hash: AccountRef,
         order_id: int,
     ) -> Optional[Order]:
         """Get a specific order by order ID."""
         await self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders/{order_id}"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            if response.status_code == 200:
-                order_json = response.json()
-                return Order(**order_json)
-            elif response.status_code == 404:
-                # order not found
-                return None
-            else:
-                raise Exception("Failed to get order. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        hash_value = await self.__account_hash_value_async(account_number_hash)
+        target_url = (
+            f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders/{order_id}"
+        )
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code == 200:
+            order_json = self.json_codec.loads(response.content)
+            return Order(**order_json)
+        elif response.status_code == 404:
+            # order not found
+            return None
+        else:
+            raise Exception("Failed to get order. Status: ", response.status_code)
+
+    async def iter_orders_by_ids_async(
+        self,
+        account_number_hash: AccountRef,
+        order_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+    ) -> AsyncIterator[Tuple[int, Optional[Order]]]:
+        """Streams (order ID, order) pairs as lookups complete, order is None if not found."""
+        await self._ensure_valid_access_token()
+        account_number_hash = await self.resolve_account_async(account_number_hash)
+        async with self.__pooled_async():
+            async for order_id, order in iter_bounded(
+                dict.fromkeys(order_ids),
+                lambda order_id: self.get_order_by_id_async(
+                    account_number_hash, order_id
+                ),
+                max_concurrency=max_concurrency,
+                requests_per_second=requests_per_second,
+            ):
+                yield order_id, order
+
+    async def get_orders_by_ids_async(
+        self,
+        account_number_hash: AccountRef,
+        order_ids: Iterable[int],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        requests_per_second: Optional[float] = None,
+    ) -> Mapping[int, Optional[Order]]:
+        """Get many orders concurrently, keyed by order ID in the given order (None if not found)."""
+        order_ids = list(dict.fromkeys(order_ids))
+        found: MutableMapping[int, Optional[Order]] = {}
+        async for order_id, order in self.iter_orders_by_ids_async(
+            account_number_hash,
+            order_ids,
+            max_concurrency=max_concurrency,
+            requests_per_second=requests_per_second,
+        ):
+            found[order_id] = order
+        return {order_id: found[order_id] for order_id in order_ids}
 
     async def get_orders_async(
         self,
-        account_number_hash: AccountNumberWithHashID,
+        account_number_hash: AccountRef,
         from_entered_time: datetime,
         to_entered_time: datetime,
         max_count: int = 1000,
         status: Optional[OrderStatus] = None,
     ) -> List[Order]:
-        """Get orders for a specific account within a time range."""
+        """Get orders for a specific account within a time range, at most max_count (see get_all_orders_async)."""
+        await self._ensure_valid_access_token()
+        hash_value = await self.__account_hash_value_async(account_number_hash)
+        target_url = self.__orders_url(
+            hash_value, from_entered_time, to_entered_time, max_count, status
+        )
+
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            orders: List[Order] = []
+            for order_json in json_res:
+                order = Order(**order_json)
+                orders.append(order)
+            return orders
+        else:
+            raise Exception("Failed to get orders. Status: ", response.status_code)
+
+    async def stream_orders_async(
+        self,
+        account_number_hash: AccountRef,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        max_count: int = 1000,
+        status: Optional[OrderStatus] = None,
+    ) -> AsyncIterator[Order]:
+        """
+        get_orders_async yielding each order as soon as its JSON has arrived, instead of decoding
+        the whole response first; only about one order of undecoded text is held at a time.
+        """
         await self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders"
+        hash_value = await self.__account_hash_value_async(account_number_hash)
+        target_url = self.__orders_url(
+            hash_value, from_entered_time, to_entered_time, max_count, status
+        )
+
+        async with self.__stream_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        ) as response:
+            if response.status_code != 200:
+                raise Exception("Failed to get orders. Status: ", response.status_code)
+            async for _, order_json in iter_json_items_async(response.aiter_bytes()):
+                yield Order(**order_json)
+
+    def __orders_url(
+        self,
+        hash_value: str,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        max_count: int,
+        status: Optional[OrderStatus],
+    ) -> str:
+        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders"
         target_url += f"?fromEnteredTime={util.to_iso8601_str(from_entered_time)}&toEnteredTime={util.to_iso8601_str(to_entered_time)}&maxResults={max_count}"
         if status is not None:
             target_url += f"&status={status.value}"
+        return target_url
 
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+    async def iter_all_orders_async(
+        self,
+        account_number_hash: AccountRef,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        status: Optional[OrderStatus] = None,
+        page_size: int = DEFAULT_ORDERS_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[Order]:
+        """
+        Streams every order entered in the time range, unlike get_orders_async which stops at max_count.
+        A full page makes the range split in halves, fetched concurrently; orders are de-duplicated by orderId.
+        Only the orderIds seen so far are kept, so memory stays flat for long histories.
+        """
+        account = await self.resolve_account_async(account_number_hash)
+        seen_order_ids: Set[int] = set()
+        async with self.__pooled_async():
+            async for orders in iter_bisected_windows_async(
+                lambda from_time, to_time: self.get_orders_async(
+                    account, from_time, to_time, max_count=page_size, status=status
+                ),
+                from_entered_time,
+                to_entered_time,
+                page_size=page_size,
+                max_concurrency=max_concurrency,
+            ):
+                for order in orders:
+                    if order.orderId is not None:
+                        if order.orderId in seen_order_ids:
+                            continue
+                        seen_order_ids.add(order.orderId)
+                    yield order
+
+    async def get_all_orders_async(
+        self,
+        account_number_hash: AccountRef,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        status: Optional[OrderStatus] = None,
+        page_size: int = DEFAULT_ORDERS_PAGE_SIZE,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> List[Order]:
+        """Complete list of orders entered in the time range, see iter_all_orders_async."""
+        return [
+            order
+            async for order in self.iter_all_orders_async(
+                account_number_hash,
+                from_entered_time,
+                to_entered_time,
+                status=status,
+                page_size=page_size,
+                max_concurrency=max_concurrency,
             )
-            if response.status_code == 200:
-                json_res = response.json()
-                orders: List[Order] = []
-                for order_json in json_res:
-                    order = Order(**order_json)
-                    orders.append(order)
-                return orders
-            else:
-                raise Exception("Failed to get orders. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        ]
 
     async def get_option_expirations_async(
-        self, underlying_symbol: str
+        self, underlying_symbol: str, use_cache: bool = True
     ) -> List[OptionExpiration]:
+        """Listed expirations of an underlying, served from expiration_cache until its TTL passes."""
+        schedule = await self.get_option_expiration_schedule_async(
+            underlying_symbol, use_cache=use_cache
+        )
+        return list(schedule.expirations)
+
+    async def get_option_expiration_schedule_async(
+        self, underlying_symbol: str, use_cache: bool = True
+    ) -> OptionExpirationSchedule:
+        """
+        Cached expirations of an underlying with next N / ExpirationType / days-to-expiration lookups.
+        @param use_cache: False always requests the API (a successful response still refreshes the cache).
+        """
+        if use_cache:
+            schedule = self.expiration_cache.get(underlying_symbol)
+            if schedule is not None:
+                return schedule
+
         await self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/expirationchain?symbol={underlying_symbol}"
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code != 200:
+            # an error must not look like (or be cached as) an underlying without expirations
+            raise Exception(
+                "Failed to get option expirations. Status: ", response.status_code
             )
-            json_res = response.json()
-            expiration_resp = OptionExpirationChainResponse(**json_res)
-            return expiration_resp.expirationList
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        json_res = self.json_codec.loads(response.content)
+        expiration_resp = OptionExpirationChainResponse(**json_res)
+        return self.expiration_cache.put(
+            underlying_symbol, expiration_resp.expirationList
+        )
+
+    async def warm_option_expirations_async(
+        self,
+        underlying_symbols: Iterable[str],
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        refresh: bool = False,
+    ) -> Mapping[str, OptionExpirationSchedule]:
+        """
+        Loads expiration_cache for a symbol universe with concurrent requests, skipping symbols already cached
+        unless refresh. Returns schedules by upper-cased symbol; symbols whose request failed are left out.
+        """
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in underlying_symbols))
+        to_fetch = symbols if refresh else self.expiration_cache.missing(symbols)
+        if len(to_fetch) > 0:
+            async with self.__pooled_async():
+                async for _, _ in iter_bounded(
+                    to_fetch,
+                    lambda symbol: self.get_option_expiration_schedule_async(
+                        symbol, use_cache=False
+                    ),
+                    max_concurrency=max_concurrency,
+                    return_exceptions=True,
+                ):
+                    pass
+
+        schedules: MutableMapping[str, OptionExpirationSchedule] = {}
+        for symbol in symbols:
+            schedule = self.expiration_cache.get(symbol)
+            if schedule is not None:
+                schedules[symbol] = schedule
+        return schedules
 
     async def get_market_hour_info_async(
-        self, market_type: Optional[MarketType] = None, on_date: Optional[date] = None
+        self,
+        market_type: Optional[MarketType] = None,
+        on_date: Optional[date] = None,
+        use_cache: bool = True,
     ) -> MarketHourInfo:
+        """
+        Market hours of a date (default today), served from market_hours_cache after the first request.
+        @param use_cache: False always requests the API (the fresh response still refreshes the cache).
+        """
+        if use_cache:
+            cached_info = self.market_hours_cache.get(market_type, on_date)
+            if cached_info is not None:
+                return cached_info
 
         await self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/markets"
@@ -344,48 +1049,257 @@ class SchwabAsyncClient(object):
         if on_date is not None:
             target_url += f"?date={util.date_to_str(on_date)}"
 
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code != 200:
+            # error bodies parse as an all-None MarketHourInfo, which must not be cached as "closed"
+            raise Exception(
+                "Failed to get market hours. Status: ", response.status_code
             )
-            json_res = response.json()
-            return MarketHourInfo(**json_res)
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+        json_res = self.json_codec.loads(response.content)
+        market_hour_info = MarketHourInfo(**json_res)
+        self.market_hours_cache.put(market_hour_info, market_type, on_date)
+        return market_hour_info
 
-    async def download_option_chain_async(
+    async def is_market_open_at_async(
+        self,
+        ts: Optional[Union[datetime, float]] = None,
+        market_type: MarketType = MarketType.Equity,
+        include_extended: bool = False,
+    ) -> bool:
+        """Whether market_type is open at ts (default now); requests the hours of ts's date at most once per day."""
+        moment = util.as_aware_datetime(ts)
+        market_hour_info = await self.get_market_hour_info_async(
+            market_type, moment.astimezone(util.eastern_tz).date()
+        )
+        return market_hour_info.is_open_at(moment, market_type, include_extended)
+
+    def __option_chain_url(
         self,
         underlying_symbol: str,
         from_date: str,
         to_date: str,
         contract_type: str = "ALL",
-    ) -> OptionChain:
-        await self._ensure_valid_access_token()
-
+    ) -> str:
         query_filter = OptionChainQueryFilter(
             symbol=underlying_symbol,
             contractType=OptionContractType(contract_type),
             fromDate=from_date,
             toDate=to_date,
         )
-        target_url = (
+        return (
             f"{SCHWAB_MARKET_DATA_API_BASE_URL}/chains?{query_filter.to_query_params()}"
         )
 
-        client = httpx.AsyncClient() if self.__client is None else self.__client
-        try:
-            response = await client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+    async def download_option_chain_async(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        streaming: bool = False,
+    ) -> OptionChain:
+        """
+        @param streaming: build contracts per expiration while the response arrives, so the raw dict tree
+        of the whole chain is never held next to the models (lower peak memory on multi-MB chains).
+        """
+        await self._ensure_valid_access_token()
+
+        target_url = self.__option_chain_url(
+            underlying_symbol, from_date, to_date, contract_type
+        )
+
+        if streaming:
+            chain_json: MutableMapping[str, Any] = {
+                key: {} for key in OPTION_CHAIN_EXP_DATE_MAP_KEYS
+            }
+            async for path, value in self.__iter_option_chain_items_async(target_url):
+                if len(path) == 2:
+                    chain_json[path[0]][path[1]] = {
+                        strike: [OptionContract(**contract) for contract in contracts]
+                        for strike, contracts in value.items()
+                    }
+                else:
+                    chain_json[path[0]] = value
+            return OptionChain(**chain_json)
+
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            return OptionChain(**json_res)
+        else:
+            raise Exception(
+                "Failed to download option chain. Status: ", response.status_code
             )
-            if response.status_code == 200:
-                json_res = response.json()
-                return OptionChain(**json_res)
-            else:
+
+    async def stream_option_chain_async(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+    ) -> AsyncIterator[OptionChainExpiration]:
+        """
+        Option chain yielded per expiration and contract type as the response arrives, so processing
+        overlaps the download and only one expiration's contracts need to be held at a time.
+        Chain level fields (underlying quote, volatility, ...) are skipped, see download_option_chain_async.
+        """
+        await self._ensure_valid_access_token()
+        target_url = self.__option_chain_url(
+            underlying_symbol, from_date, to_date, contract_type
+        )
+        async for path, value in self.__iter_option_chain_items_async(target_url):
+            if len(path) == 2:
+                yield OptionChainExpiration.from_json(
+                    underlying_symbol,
+                    OPTION_CHAIN_EXP_DATE_MAP_KEYS[path[0]],  # type: ignore
+                    path[1],  # type: ignore
+                    value,
+                )
+
+    async def __iter_option_chain_items_async(
+        self, target_url: str
+    ) -> AsyncIterator[JsonItem]:
+        """Chain level fields as ((key,), value), expirations as ((exp date map key, expiration), strikes)."""
+        async with self.__stream_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        ) as response:
+            if response.status_code != 200:
                 raise Exception(
                     "Failed to download option chain. Status: ", response.status_code
                 )
-        finally:
-            if not self.__keep_client_alive:
-                await client.aclose()
+            async for item in iter_json_items_async(
+                response.aiter_bytes(), split_keys=OPTION_CHAIN_EXP_DATE_MAP_KEYS
+            ):
+                yield item
+
+    async def iter_option_chain_chunks_async(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        expirations_per_chunk: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> AsyncIterator[OptionChain]:
+        """
+        Downloads the option chain in per-expiration sub-requests (see get_option_expirations_async),
+        fetched concurrently and yielded as they arrive, so each response stays small.
+        """
+        expirations = await self.get_option_expirations_async(underlying_symbol)
+        windows = expiration_windows(
+            expirations, from_date, to_date, expirations_per_chunk
+        )
+        if len(windows) == 0:
+            windows = [(from_date, to_date)]
+
+        async with self.__pooled_async():
+            async for _, chain in iter_bounded(
+                windows,
+                lambda window: self.download_option_chain_async(
+                    underlying_symbol, window[0], window[1], contract_type
+                ),
+                max_concurrency=max_concurrency,
+            ):
+                yield chain
+
+    async def download_option_chain_chunked_async(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        expirations_per_chunk: int = 1,
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    ) -> OptionChain:
+        """Same result as download_option_chain_async, downloaded as concurrent per-expiration sub-requests."""
+        chains = [
+            chain
+            async for chain in self.iter_option_chain_chunks_async(
+                underlying_symbol,
+                from_date,
+                to_date,
+                contract_type=contract_type,
+                expirations_per_chunk=expirations_per_chunk,
+                max_concurrency=max_concurrency,
+            )
+        ]
+        return merge_option_chains(chains)
+
+    async def download_option_chains_async(
+        self,
+        underlying_symbols: Iterable[str],
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+        as_frames: bool = False,
+    ) -> AsyncIterator[OptionChainDownloadResult]:
+        """
+        Downloads option chains of many underlyings concurrently over one pooled connection set,
+        yielding results as they complete. A failed symbol yields a result with `error` set instead of aborting.
+        @param as_frames: parse into dataframe pairs (see download_option_chain_frame_async) instead of OptionChain.
+        """
+        await self._ensure_valid_access_token()
+
+        async def download(symbol: str) -> Any:
+            if as_frames:
+                return await self.download_option_chain_frame_async(
+                    symbol, from_date, to_date, contract_type
+                )
+            return await self.download_option_chain_async(
+                symbol, from_date, to_date, contract_type
+            )
+
+        async with self.__pooled_async():
+            async for symbol, result in iter_bounded(
+                dict.fromkeys(underlying_symbols),
+                download,
+                max_concurrency=max_concurrency,
+                return_exceptions=True,
+            ):
+                if isinstance(result, Exception):
+                    yield OptionChainDownloadResult(symbol=symbol, error=result)
+                elif as_frames:
+                    yield OptionChainDownloadResult(symbol=symbol, frames=result)
+                else:
+                    yield OptionChainDownloadResult(symbol=symbol, chain=result)
+
+    async def download_option_chain_frame_async(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        strip_space: bool = False,
+        use_compression: bool = False,
+        strict: bool = False,
+    ) -> List["OptionChainDataFrames"]:
+        """
+        Option chain as call/put dataframe pairs by expiration, parsed straight from the JSON response
+        without building OptionChain/OptionContract models.
+        @param strict: validate a sample of contracts per expiration as OptionContract.
+        """
+        await self._ensure_valid_access_token()
+        target_url = self.__option_chain_url(
+            underlying_symbol, from_date, to_date, contract_type
+        )
+        response = await self.__send_async(
+            "GET", url=target_url, headers=self.__auth_header()
+        )
+        if response.status_code == 200:
+            from cschwabpy.models.frames import option_chain_json_to_dataframe_pairs
+
+            return option_chain_json_to_dataframe_pairs(
+                self.json_codec.loads(response.content),
+                strip_space=strip_space,
+                use_compression=use_compression,
+                strict=strict,
+            )
+        else:
+            raise Exception(
+                "Failed to download option chain. Status: ", response.status_code
+            )
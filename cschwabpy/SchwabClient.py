@@ -1,4 +1,9 @@
-from cschwabpy.models.token import Tokens, ITokenStore, LocalTokenStore
+from cschwabpy.models.token import (
+    Tokens,
+    ITokenStore,
+    LocalTokenStore,
+    TokensNotAvailableError,
+)
 from cschwabpy.models import (
     OptionChainQueryFilter,
     OptionContractType,
@@ -17,10 +22,48 @@ from cschwabpy.models.trade_models import (
     Order,
     InstrumentProjection,
 )
+from cschwabpy.account_cache import (
+    AccountRef,
+    AccountHashCache,
+    AccountNotFoundError,
+)
+from cschwabpy.expiration_cache import (
+    OptionExpirationCache,
+    OptionExpirationSchedule,
+)
+from cschwabpy.json_codec import IJsonCodec, default_json_codec
+from cschwabpy.instrument_cache import (
+    InstrumentCache,
+    BATCHABLE_PROJECTIONS,
+    INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST,
+)
+from cschwabpy.market_calendar import MarketHoursCache
+from cschwabpy.pagination import iter_bisected_windows, DEFAULT_ORDERS_PAGE_SIZE
+from cschwabpy.rate_limit import IRateLimiter
+from cschwabpy.retry import RetryPolicy
+from cschwabpy.transport import (
+    PoolConfig,
+    PoolStats,
+    AuthHeaders,
+    EMPTY_HEADERS,
+    JSON_CONTENT_TYPE_HEADER,
+    read_connection_counts,
+)
 import cschwabpy.util as util
 import backoff
 from datetime import datetime, timedelta
-from typing import Optional, List, Mapping
+from typing import (
+    Optional,
+    List,
+    Mapping,
+    MutableMapping,
+    Any,
+    Iterable,
+    Iterator,
+    Set,
+    Union,
+    TYPE_CHECKING,
+)
 from cschwabpy.costants import (
     SCHWAB_API_BASE_URL,
     SCHWAB_MARKET_DATA_API_BASE_URL,
@@ -31,14 +74,21 @@ from cschwabpy.costants import (
 
 import httpx
 import re
+import time
+import threading
 import base64
-import json
+
+if TYPE_CHECKING:
+    from cschwabpy.models.frames import OptionChainDataFrames
 
 HEADER_ORDER_ID_PATTERN = re.compile(r"orders/(\d+)")
 
 
 class SchwabClient(object):
-    """This is regular sync client. For async client, use SchwabClientAsync."""
+    """This is regular sync client. For async client, use SchwabClientAsync.
+
+    Use `with SchwabClient(...)` to share one pooled connection set across calls.
+    """
 
     def __init__(
         self,
@@ -47,34 +97,146 @@ class SchwabClient(object):
         token_store: ITokenStore = LocalTokenStore(),
         tokens: Optional[Tokens] = None,
         http_client: Optional[httpx.Client] = None,
+        pool_config: Optional[PoolConfig] = None,
+        rate_limiter: Optional[IRateLimiter] = None,
+        retry_policy: Optional[RetryPolicy] = None,
+        market_hours_cache: Optional[MarketHoursCache] = None,
+        expiration_cache: Optional[OptionExpirationCache] = None,
+        instrument_cache: Optional[InstrumentCache] = None,
+        account_hash_cache: Optional[AccountHashCache] = None,
+        json_codec: Optional[IJsonCodec] = None,
     ) -> None:
         self.__client_id = app_client_id
         self.__client_secret = app_secret
         self.__token_store = token_store
         self.__client = http_client
-        self.__keep_client_alive = http_client is not None
-        self.__tokens = tokens
+        self.__owns_client = False
+        self.__pool_config = pool_config if pool_config is not None else PoolConfig()
+        self.__pool_stats = PoolStats()
+        self.__rate_limiter = rate_limiter
+        self.__retry_policy = (
+            retry_policy if retry_policy is not None else RetryPolicy()
+        )
+        self.__auth_headers: Optional[AuthHeaders] = None
+        self.__set_tokens(tokens)
+        self.market_hours_cache = (
+            market_hours_cache if market_hours_cache is not None else MarketHoursCache()
+        )
+        self.expiration_cache = (
+            expiration_cache
+            if expiration_cache is not None
+            else OptionExpirationCache()
+        )
+        self.instrument_cache = (
+            instrument_cache if instrument_cache is not None else InstrumentCache()
+        )
+        self.account_hash_cache = (
+            account_hash_cache if account_hash_cache is not None else AccountHashCache()
+        )
+        self.json_codec = json_codec if json_codec is not None else default_json_codec()
+        self.__account_numbers_lock = threading.Lock()
+
+    def __enter__(self) -> "SchwabClient":
+        self.open()
+        return self
+
+    def __exit__(self, *exc_info: Any) -> None:
+        self.close()
+
+    def open(self) -> None:
+        """Opens the pooled http client owned by this client; no-op if a client is already in use."""
+        if self.__client is not None:
+            return
+        self.__client = self.__pool_config.create_client(
+            headers=None if self.__auth_headers is None else self.__auth_headers.default
+        )
+        self.__owns_client = True
+        self.__pool_stats.clients_created += 1
+
+    def close(self) -> None:
+        """Closes the pooled http client if it is owned by this client. Injected clients are left open."""
+        if self.__owns_client and self.__client is not None:
+            self.__client.close()
+            self.__client = None
+            self.__owns_client = False
+
+    @property
+    def is_pooled(self) -> bool:
+        """Whether calls share one long-lived http client (owned or injected)."""
+        return self.__client is not None and not self.__client.is_closed
+
+    @property
+    def pool_stats(self) -> PoolStats:
+        stats = self.__pool_stats
+        stats.pooled = self.is_pooled
+        stats.http2 = self.__owns_client and self.__pool_config.use_http2
+        stats.max_connections = self.__pool_config.max_connections
+        stats.max_keepalive_connections = self.__pool_config.max_keepalive_connections
+        stats.open_connections, stats.idle_connections = read_connection_counts(
+            self.__client
+        )
+        return stats
+
+    def __send(self, method: str, url: str, **kwargs: Any) -> httpx.Response:
+        """Sends a request over the pooled client (or a one-off client when not pooled), retrying per retry policy."""
+        client = self.__client
+        one_off = client is None
+        if one_off:
+            client = self.__pool_config.create_client()
+            self.__pool_stats.clients_created += 1
+        try:
+            attempt = 0
+            while True:
+                if self.__rate_limiter is not None:
+                    self.__rate_limiter.acquire(url)
+                try:
+                    response = client.request(method, url, **kwargs)
+                except httpx.TransportError as ex:
+                    if not self.__retry_policy.should_retry_exception(
+                        method, ex, attempt
+                    ):
+                        raise
+                    delay = self.__retry_policy.delay_for(attempt)
+                else:
+                    self.__pool_stats.record_response(response)
+                    if not self.__retry_policy.should_retry_response(
+                        method, response, attempt
+                    ):
+                        return response
+                    delay = self.__retry_policy.delay_for(attempt, response)
+                attempt += 1
+                self.__pool_stats.retries += 1
+                time.sleep(delay)
+        finally:
+            if one_off:
+                client.close()
 
     @property
     def token_url(self) -> str:
         return f"{SCHWAB_API_BASE_URL}/{SCHWAB_TOKEN_PATH}"
 
-    @backoff.on_exception(backoff.expo, Exception, max_tries=3, max_time=10)
+    @backoff.on_exception(
+        backoff.expo,
+        Exception,
+        max_tries=3,
+        max_time=10,
+        giveup=lambda ex: isinstance(ex, TokensNotAvailableError),
+    )
     def _ensure_valid_access_token(self, force_refresh: bool = False) -> bool:
         if self.__tokens is None:
-            self.__tokens = self.__token_store.get_tokens()
+            self.__set_tokens(self.__token_store.get_tokens())
         if self.__tokens is None:
-            raise Exception(
+            raise TokensNotAvailableError(
                 "Tokens are not available. Please use get_tokens_manually() to get tokens first."
             )
 
         if self.__tokens.is_access_token_valid and not force_refresh:
             return True
 
-        client = httpx.Client() if self.__client is None else self.__client
         try:
             key_sec_encoded = self.__encode_app_key_secret()
-            response = client.post(
+            response = self.__send(
+                "POST",
                 url=self.token_url,
                 headers={
                     "Authorization": f"Basic {key_sec_encoded}",
@@ -87,8 +249,8 @@ class SchwabClient(object):
             )
 
             if response.status_code == 200:
-                json_res = response.json()
-                self.__tokens = Tokens(**json_res)
+                json_res = self.json_codec.loads(response.content)
+                self.__set_tokens(Tokens(**json_res))
                 self.__token_store.save_tokens(self.__tokens)
                 return True
             else:
@@ -99,9 +261,6 @@ class SchwabClient(object):
         except Exception as ex:
             print("Failed to refresh access token. Please try again. exception: ", ex)
             return False
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
 
     def __encode_app_key_secret(self) -> str:
         key_sec = f"{self.__client_id}:{self.__client_secret}"
@@ -110,74 +269,98 @@ class SchwabClient(object):
         # refresh access token
         # doc: https://developer.schwab.com/products/trader-api--individual/details/documentation/Retail%20Trader%20API%20Production
 
-    def __auth_header(self) -> Mapping[str, str]:
-        return {
-            # "Content-Type": "application/json",
-            "Authorization": f"{self.__tokens.token_type} {self.__tokens.access_token}",
-            "Accept": "application/json",
-        }
+    def __set_tokens(self, tokens: Optional[Tokens]) -> None:
+        """The only place auth headers are rendered; swapped in one assignment when tokens change."""
+        self.__tokens = tokens
+        self.__auth_headers = (
+            None
+            if tokens is None
+            else AuthHeaders.render(tokens.token_type, tokens.access_token)
+        )
+        if self.__owns_client and self.__auth_headers is not None:
+            self.__client.headers.update(self.__auth_headers.default)
+
+    def __auth_header(self, json_content: bool = False) -> Mapping[str, str]:
+        """Pre-rendered headers; auth is already a default header of the owned pooled client."""
+        if self.__owns_client:
+            return JSON_CONTENT_TYPE_HEADER if json_content else EMPTY_HEADERS
+        if json_content:
+            return self.__auth_headers.json_content
+        return self.__auth_headers.default
 
     def get_account_numbers(self) -> List[AccountNumberWithHashID]:
         self._ensure_valid_access_token()
 
         target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/accountNumbers"
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            json_res = response.json()
-            account_numbers: List[AccountNumberWithHashID] = []
-            for account_json in json_res:
-                account_numbers.append(AccountNumberWithHashID(**account_json))
-            return account_numbers
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        json_res = self.json_codec.loads(response.content)
+        account_numbers: List[AccountNumberWithHashID] = []
+        for account_json in json_res:
+            account_numbers.append(AccountNumberWithHashID(**account_json))
+        self.account_hash_cache.update(account_numbers)
+        return account_numbers
+
+    def resolve_account(self, account: AccountRef) -> AccountNumberWithHashID:
+        """
+        AccountNumberWithHashID of a plain account number (or known hash value), resolved from account_hash_cache.
+        The cache is filled by one get_account_numbers call on first use or after a miss.
+        """
+        if isinstance(account, AccountNumberWithHashID):
+            return account
+
+        resolved = self.account_hash_cache.get(account)
+        if resolved is None:
+            with self.__account_numbers_lock:
+                resolved = self.account_hash_cache.get(account)
+                if resolved is None:
+                    self.get_account_numbers()
+                    resolved = self.account_hash_cache.get(account)
+        if resolved is None:
+            raise AccountNotFoundError(f"Account {account} is not linked to this app")
+        return resolved
+
+    def __account_hash_value(self, account: AccountRef) -> str:
+        return self.resolve_account(account).hashValue
+
+    def invalidate_account_hashes(self, account_number: Optional[str] = None) -> None:
+        """Drops cached account hash resolutions, all of them when no account number is given."""
+        self.account_hash_cache.invalidate(account_number)
 
     def get_accounts(
         self,
         include_positions: bool = True,
-        with_account_number_hash: Optional[AccountNumberWithHashID] = None,
+        with_account_number_hash: Optional[AccountRef] = None,
     ) -> List[Account]:
         """get all accounts except a specific account_number is provided."""
         self._ensure_valid_access_token()
         target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts"
         if with_account_number_hash is not None:
-            target_url = f"{target_url}/{with_account_number_hash.hashValue}"
+            hash_value = self.__account_hash_value(with_account_number_hash)
+            target_url = f"{target_url}/{hash_value}"
 
         if include_positions:
             target_url = f"{target_url}?fields=positions"
 
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            if response.status_code == 200:
-                json_res = response.json()
-                if with_account_number_hash is None:
-                    accounts: List[SecuritiesAccount] = []
-                    for account_json in json_res:
-                        securities_account = SecuritiesAccount(
-                            **account_json
-                        ).securitiesAccount
-                        accounts.append(securities_account)
-                    return accounts
-                else:
-                    securities_account = SecuritiesAccount(**json_res).securitiesAccount
-                    return [securities_account]
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            if with_account_number_hash is None:
+                accounts: List[SecuritiesAccount] = []
+                for account_json in json_res:
+                    securities_account = SecuritiesAccount(
+                        **account_json
+                    ).securitiesAccount
+                    accounts.append(securities_account)
+                return accounts
             else:
-                raise Exception(
-                    "Failed to get accounts. Status: ", response.status_code
-                )
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+                securities_account = SecuritiesAccount(**json_res).securitiesAccount
+                return [securities_account]
+        else:
+            raise Exception("Failed to get accounts. Status: ", response.status_code)
 
     def get_single_account(
         self,
-        with_account_number_hash: AccountNumberWithHashID,
+        with_account_number_hash: AccountRef,
         include_positions: bool = True,
     ) -> Optional[Account]:
         """Convenience method to get a single account by account number's encrypted ID."""
@@ -194,148 +377,233 @@ class SchwabClient(object):
         self,
         symbol: str,
         projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> List[AccountInstrument]:
+        return self.__request_instruments(symbol, projection)
+
+    def __request_instruments(
+        self, symbol: str, projection: InstrumentProjection
     ) -> List[AccountInstrument]:
         self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/instruments?symbol={symbol}&projection={projection.value}"
-        client = httpx.Client() if self.__client is None else self.__client
-
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            json_res = response.json()
-            instruments: List[AccountInstrument] = []
-            if "instruments" in json_res:
-                for instrument in json_res["instruments"]:
-                    instruments.append(AccountInstrument(**instrument))
-            return instruments
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
-
-    def cancel_order(
-        self, account_number_hash: AccountNumberWithHashID, order_id: int
-    ) -> bool:
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        json_res = self.json_codec.loads(response.content)
+        instruments: List[AccountInstrument] = []
+        if "instruments" in json_res:
+            for instrument in json_res["instruments"]:
+                instruments.append(AccountInstrument(**instrument))
+        return instruments
+
+    def get_instruments_by_symbols(
+        self,
+        symbols: Iterable[str],
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+        use_cache: bool = True,
+    ) -> Mapping[str, AccountInstrument]:
+        """
+        Instruments of many symbols by upper-cased symbol, in input order. Symbols missing from instrument_cache
+        are requested comma-joined, INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST per request. Symbols Schwab does not know are left out.
+        @param projection: InstrumentProjection.Fundamental or SymbolSearch, the projections that match symbols exactly.
+        """
+        projection = InstrumentProjection(projection)
+        if projection.value not in BATCHABLE_PROJECTIONS:
+            raise ValueError(f"{projection.value} lookups cannot be batched by symbol")
+
+        symbols = list(dict.fromkeys(symbol.upper() for symbol in symbols))
+        to_fetch = (
+            self.instrument_cache.missing(symbols, projection) if use_cache else symbols
+        )
+        fetched: MutableMapping[str, AccountInstrument] = {}
+        for batch in util.chunked(to_fetch, INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST):
+            for instrument in self.__request_instruments(",".join(batch), projection):
+                self.instrument_cache.put(instrument, projection)
+                if instrument.symbol is not None:
+                    fetched[instrument.symbol.upper()] = instrument
+
+        result: MutableMapping[str, AccountInstrument] = {}
+        for symbol in symbols:
+            instrument = fetched.get(symbol)
+            if instrument is None and use_cache:
+                instrument = self.instrument_cache.get(symbol, projection)
+            if instrument is not None:
+                result[symbol] = instrument
+        return result
+
+    def cancel_order(self, account_number_hash: AccountRef, order_id: int) -> bool:
         """Cancel an order by order ID."""
         self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders/{order_id}"
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.delete(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
+        hash_value = self.__account_hash_value(account_number_hash)
+        target_url = (
+            f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders/{order_id}"
+        )
+        response = self.__send("DELETE", url=target_url, headers=self.__auth_header())
 
-            return response.status_code == 200
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        return response.status_code == 200
 
-    def place_order(
-        self, account_number_hash: AccountNumberWithHashID, order: Order
-    ) -> int:
+    def place_order(self, account_number_hash: AccountRef, order: Order) -> int:
         self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders"
-        client = httpx.Client() if self.__client is None else self.__client
+        hash_value = self.__account_hash_value(account_number_hash)
+        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders"
+        response = self.__send(
+            "POST",
+            url=target_url,
+            content=order.to_json_bytes(),
+            headers=self.__auth_header(json_content=True),
+        )
+        if response.status_code == 201:
+            location_url = response.headers.get("Location")
+            if location_url is not None:
+                needle = re.search(HEADER_ORDER_ID_PATTERN, location_url)
+                if needle:
+                    return int(needle.group(1))
+                else:
+                    raise Exception("Failed to locate order ID in response")
 
-        try:
-            _header = self.__auth_header()
-            _header["Content-Type"] = "application/json"
-            response = client.post(
-                url=target_url,
-                json=json.dumps(order.to_json()),
-                headers=_header,
-            )
-            if response.status_code == 201:
-                location_url = response.headers.get("Location")
-                if location_url is not None:
-                    needle = re.search(HEADER_ORDER_ID_PATTERN, location_url)
-                    if needle:
-                        return int(needle.group(1))
-                    else:
-                        raise Exception("Failed to locate order ID in response")
-
-            raise Exception("Failed to place order. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        raise Exception("Failed to place order. Status: ", response.status_code)
 
     def get_order_by_id(
         self,
-        account_number_hash: AccountNumberWithHashID,
+        account_number_hash: AccountRef,
         order_id: int,
     ) -> Optional[Order]:
         """Get a specific order by order ID."""
         self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders/{order_id}"
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
-            )
-            if response.status_code == 200:
-                order_json = response.json()
-                return Order(**order_json)
-            elif response.status_code == 404:
-                # order not found
-                return None
-            else:
-                raise Exception("Failed to get order. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        hash_value = self.__account_hash_value(account_number_hash)
+        target_url = (
+            f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders/{order_id}"
+        )
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code == 200:
+            order_json = self.json_codec.loads(response.content)
+            return Order(**order_json)
+        elif response.status_code == 404:
+            # order not found
+            return None
+        else:
+            raise Exception("Failed to get order. Status: ", response.status_code)
 
     def get_orders(
         self,
-        account_number_hash: AccountNumberWithHashID,
+        account_number_hash: AccountRef,
         from_entered_time: datetime,
         to_entered_time: datetime,
         max_count: int = 1000,
         status: Optional[OrderStatus] = None,
     ) -> List[Order]:
         self._ensure_valid_access_token()
-        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{account_number_hash.hashValue}/orders"
+        hash_value = self.__account_hash_value(account_number_hash)
+        target_url = f"{SCHWAB_TRADER_API_BASE_URL}/accounts/{hash_value}/orders"
         target_url += f"?fromEnteredTime={util.to_iso8601_str(from_entered_time)}&toEnteredTime={util.to_iso8601_str(to_entered_time)}&maxResults={max_count}"
         if status is not None:
             target_url += f"&status={status.value}"
 
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            orders: List[Order] = []
+            for order_json in json_res:
+                order = Order(**order_json)
+                orders.append(order)
+            return orders
+        else:
+            raise Exception("Failed to get orders. Status: ", response.status_code)
+
+    def iter_all_orders(
+        self,
+        account_number_hash: AccountRef,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        status: Optional[OrderStatus] = None,
+        page_size: int = DEFAULT_ORDERS_PAGE_SIZE,
+    ) -> Iterator[Order]:
+        """
+        Yields every order entered in the time range, unlike get_orders which stops at max_count.
+        A full page makes the range split in halves; orders are de-duplicated by orderId.
+        """
+        account = self.resolve_account(account_number_hash)
+        seen_order_ids: Set[int] = set()
+        for orders in iter_bisected_windows(
+            lambda from_time, to_time: self.get_orders(
+                account, from_time, to_time, max_count=page_size, status=status
+            ),
+            from_entered_time,
+            to_entered_time,
+            page_size=page_size,
+        ):
+            for order in orders:
+                if order.orderId is not None:
+                    if order.orderId in seen_order_ids:
+                        continue
+                    seen_order_ids.add(order.orderId)
+                yield order
+
+    def get_all_orders(
+        self,
+        account_number_hash: AccountRef,
+        from_entered_time: datetime,
+        to_entered_time: datetime,
+        status: Optional[OrderStatus] = None,
+        page_size: int = DEFAULT_ORDERS_PAGE_SIZE,
+    ) -> List[Order]:
+        """Complete list of orders entered in the time range, see iter_all_orders."""
+        return list(
+            self.iter_all_orders(
+                account_number_hash,
+                from_entered_time,
+                to_entered_time,
+                status=status,
+                page_size=page_size,
             )
-            if response.status_code == 200:
-                json_res = response.json()
-                orders: List[Order] = []
-                for order_json in json_res:
-                    order = Order(**order_json)
-                    orders.append(order)
-                return orders
-            else:
-                raise Exception("Failed to get orders. Status: ", response.status_code)
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        )
+
+    def get_option_expirations(
+        self, underlying_symbol: str, use_cache: bool = True
+    ) -> List[OptionExpiration]:
+        """Listed expirations of an underlying, served from expiration_cache until its TTL passes."""
+        schedule = self.get_option_expiration_schedule(
+            underlying_symbol, use_cache=use_cache
+        )
+        return list(schedule.expirations)
+
+    def get_option_expiration_schedule(
+        self, underlying_symbol: str, use_cache: bool = True
+    ) -> OptionExpirationSchedule:
+        """
+        Cached expirations of an underlying with next N / ExpirationType / days-to-expiration lookups.
+        @param use_cache: False always requests the API (a successful response still refreshes the cache).
+        """
+        if use_cache:
+            schedule = self.expiration_cache.get(underlying_symbol)
+            if schedule is not None:
+                return schedule
 
-    def get_option_expirations(self, underlying_symbol: str) -> List[OptionExpiration]:
         self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/expirationchain?symbol={underlying_symbol}"
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code != 200:
+            # an error must not look like (or be cached as) an underlying without expirations
+            raise Exception(
+                "Failed to get option expirations. Status: ", response.status_code
             )
-            json_res = response.json()
-            expiration_resp = OptionExpirationChainResponse(**json_res)
-            return expiration_resp.expirationList
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        json_res = self.json_codec.loads(response.content)
+        expiration_resp = OptionExpirationChainResponse(**json_res)
+        return self.expiration_cache.put(
+            underlying_symbol, expiration_resp.expirationList
+        )
 
     def get_market_hour_info(
         self,
         market_type: Optional[MarketType] = None,
         on_date: Optional[datetime] = None,
+        use_cache: bool = True,
     ) -> MarketHourInfo:
+        """
+        Market hours of a date (default today), served from market_hours_cache after the first request.
+        @param use_cache: False always requests the API (the fresh response still refreshes the cache).
+        """
+        if use_cache:
+            cached_info = self.market_hours_cache.get(market_type, on_date)
+            if cached_info is not None:
+                return cached_info
 
         self._ensure_valid_access_token()
         target_url = f"{SCHWAB_MARKET_DATA_API_BASE_URL}/markets"
@@ -346,51 +614,102 @@ class SchwabClient(object):
         if on_date is not None:
             target_url += f"?date={util.date_to_str(on_date)}"
 
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code != 200:
+            # error bodies parse as an all-None MarketHourInfo, which must not be cached as "closed"
+            raise Exception(
+                "Failed to get market hours. Status: ", response.status_code
             )
-            json_res = response.json()
-            return MarketHourInfo(**json_res)
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
+        json_res = self.json_codec.loads(response.content)
+        market_hour_info = MarketHourInfo(**json_res)
+        self.market_hours_cache.put(market_hour_info, market_type, on_date)
+        return market_hour_info
 
-    def download_option_chain(
+    def is_market_open_at(
+        self,
+        ts: Optional[Union[datetime, float]] = None,
+        market_type: MarketType = MarketType.Equity,
+        include_extended: bool = False,
+    ) -> bool:
+        """Whether market_type is open at ts (default now); requests the hours of ts's date at most once per day."""
+        moment = util.as_aware_datetime(ts)
+        market_hour_info = self.get_market_hour_info(
+            market_type, moment.astimezone(util.eastern_tz).date()
+        )
+        return market_hour_info.is_open_at(moment, market_type, include_extended)
+
+    def __option_chain_url(
         self,
         underlying_symbol: str,
         from_date: str,
         to_date: str,
         contract_type: str = "ALL",
-    ) -> OptionChain:
-        self._ensure_valid_access_token()
-
+    ) -> str:
         query_filter = OptionChainQueryFilter(
             symbol=underlying_symbol,
             contractType=OptionContractType(contract_type),
             fromDate=from_date,
             toDate=to_date,
         )
-        target_url = (
+        return (
             f"{SCHWAB_MARKET_DATA_API_BASE_URL}/chains?{query_filter.to_query_params()}"
         )
 
-        client = httpx.Client() if self.__client is None else self.__client
-        try:
-            response = client.get(
-                url=target_url, params={}, headers=self.__auth_header()
+    def download_option_chain(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+    ) -> OptionChain:
+        self._ensure_valid_access_token()
+
+        target_url = self.__option_chain_url(
+            underlying_symbol, from_date, to_date, contract_type
+        )
+
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            return OptionChain(**json_res)
+        else:
+            raise Exception(
+                "Failed to download option chain. Status: ", response.status_code
+            )
+
+    def download_option_chain_frame(
+        self,
+        underlying_symbol: str,
+        from_date: str,
+        to_date: str,
+        contract_type: str = "ALL",
+        strip_space: bool = False,
+        use_compression: bool = False,
+        strict: bool = False,
+    ) -> List["OptionChainDataFrames"]:
+        """
+        Option chain as call/put dataframe pairs by expiration, parsed straight from the JSON response
+        without building OptionChain/OptionContract models.
+        @param strict: validate a sample of contracts per expiration as OptionContract.
+        """
+        self._ensure_valid_access_token()
+        target_url = self.__option_chain_url(
+            underlying_symbol, from_date, to_date, contract_type
+        )
+        response = self.__send("GET", url=target_url, headers=self.__auth_header())
+        if response.status_code == 200:
+            from cschwabpy.models.frames import option_chain_json_to_dataframe_pairs
+
+            return option_chain_json_to_dataframe_pairs(
+                self.json_codec.loads(response.content),
+                strip_space=strip_space,
+                use_compression=use_compression,
+                strict=strict,
+            )
+        else:
+            raise Exception(
+                "Failed to download option chain. Status: ", response.status_code
             )
-            if response.status_code == 200:
-                json_res = response.json()
-                return OptionChain(**json_res)
-            else:
-                raise Exception(
-                    "Failed to download option chain. Status: ", response.status_code
-                )
-        finally:
-            if not self.__keep_client_alive:
-                client.close()
 
     def get_tokens_manually(
         self,
@@ -428,26 +747,26 @@ class SchwabClient(object):
             )
 
         key_sec_encoded = self.__encode_app_key_secret()
-        with httpx.Client() as client:
-            response = client.post(
-                url=self.token_url,
-                headers={
-                    "Authorization": f"Basic {key_sec_encoded}",
-                    "Content-Type": "application/x-www-form-urlencoded",
-                },
-                data={
-                    "grant_type": "authorization_code",
-                    "code": auth_code,
-                    "redirect_uri": redirect_uri,
-                },
-            )
+        response = self.__send(
+            "POST",
+            url=self.token_url,
+            headers={
+                "Authorization": f"Basic {key_sec_encoded}",
+                "Content-Type": "application/x-www-form-urlencoded",
+            },
+            data={
+                "grant_type": "authorization_code",
+                "code": auth_code,
+                "redirect_uri": redirect_uri,
+            },
+        )
 
-            if response.status_code == 200:
-                json_res = response.json()
-                tokens = Tokens(**json_res)
-                self.__token_store.save_tokens(tokens)
-                print(
-                    f"Tokens saved successfully at path: {self.__token_store.token_file_path}"
-                )
-            else:
-                print("Failed to get tokens. Please try again.")
+        if response.status_code == 200:
+            json_res = self.json_codec.loads(response.content)
+            tokens = Tokens(**json_res)
+            self.__token_store.save_tokens(tokens)
+            print(
+                f"Tokens saved successfully at path: {self.__token_store.token_file_path}"
+            )
+        else:
+            print("Failed to get tokens. Please try again.")
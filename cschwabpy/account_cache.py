@@ -0,0 +1,53 @@
+"""Cache of accountNumber -> hashValue resolutions used by trader endpoints."""
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from typing import Iterable, List, MutableMapping, Optional, Union
+import threading
+
+# trader methods accept the AccountNumberWithHashID pair or a plain account number (or its hash value)
+AccountRef = Union[AccountNumberWithHashID, str]
+
+
+class AccountNotFoundError(Exception):
+    """The account number is not among the accounts linked to the app."""
+
+    pass
+
+
+class AccountHashCache(object):
+    """Thread-safe accountNumber -> AccountNumberWithHashID map, filled from GET /accounts/accountNumbers."""
+
+    def __init__(self) -> None:
+        self.__by_number: MutableMapping[str, AccountNumberWithHashID] = {}
+        self.__by_hash: MutableMapping[str, AccountNumberWithHashID] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__by_number)
+
+    @property
+    def account_numbers(self) -> List[AccountNumberWithHashID]:
+        with self.__lock:
+            return list(self.__by_number.values())
+
+    def update(self, account_numbers: Iterable[AccountNumberWithHashID]) -> None:
+        with self.__lock:
+            for account_number in account_numbers:
+                self.__by_number[account_number.accountNumber] = account_number
+                self.__by_hash[account_number.hashValue] = account_number
+
+    def get(self, account: str) -> Optional[AccountNumberWithHashID]:
+        """Resolves an account number, or a hash value that is already known."""
+        with self.__lock:
+            resolved = self.__by_number.get(account)
+            return resolved if resolved is not None else self.__by_hash.get(account)
+
+    def invalidate(self, account_number: Optional[str] = None) -> None:
+        """Forgets one account number, or all of them (e.g. after accounts are linked or unlinked)."""
+        with self.__lock:
+            if account_number is None:
+                self.__by_number.clear()
+                self.__by_hash.clear()
+                return
+            resolved = self.__by_number.pop(account_number, None)
+            if resolved is not None:
+                self.__by_hash.pop(resolved.hashValue, None)
@@ -0,0 +1,105 @@
+"""Helpers for fanning out API calls with bounded parallelism."""
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterable,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
+from weakref import WeakKeyDictionary
+import asyncio
+import time
+
+DEFAULT_MAX_CONCURRENCY = 10
+
+T = TypeVar("T")
+R = TypeVar("R")
+
+
+class LoopLocalLock(object):
+    """
+    asyncio.Lock per event loop, for locks held by long-lived objects: an asyncio.Lock binds to the first
+    loop that waits on it and fails when used from another one (a second asyncio.run, a new test loop).
+    """
+
+    def __init__(self) -> None:
+        self.__locks: "WeakKeyDictionary[asyncio.AbstractEventLoop, asyncio.Lock]" = (
+            WeakKeyDictionary()
+        )
+
+    def get(self) -> asyncio.Lock:
+        """Lock of the running event loop."""
+        loop = asyncio.get_running_loop()
+        lock = self.__locks.get(loop)
+        if lock is None:
+            lock = asyncio.Lock()
+            self.__locks[loop] = lock
+        return lock
+
+    async def __aenter__(self) -> None:
+        await self.get().acquire()
+
+    async def __aexit__(self, *exc_info: object) -> None:
+        self.get().release()
+
+
+class RequestPacer(object):
+    """Spaces request starts so that at most `requests_per_second` requests begin each second."""
+
+    def __init__(self, requests_per_second: float) -> None:
+        if requests_per_second <= 0:
+            raise ValueError("requests_per_second must be positive")
+        self.__interval = 1.0 / requests_per_second
+        self.__next_start = 0.0
+        self.__lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        async with self.__lock:
+            now = time.monotonic()
+            delay = self.__next_start - now
+            if delay > 0:
+                await asyncio.sleep(delay)
+            self.__next_start = max(now, self.__next_start) + self.__interval
+
+
+async def iter_bounded(
+    items: Iterable[T],
+    fetch: Callable[[T], Awaitable[R]],
+    max_concurrency: int = DEFAULT_MAX_CONCURRENCY,
+    requests_per_second: Optional[float] = None,
+    return_exceptions: bool = False,
+) -> AsyncIterator[Tuple[T, Union[R, Exception]]]:
+    """Runs `fetch` for every item with at most `max_concurrency` in flight, yields (item, result) as they complete.
+
+    With return_exceptions, a failed call yields (item, exception) instead of aborting the batch.
+    Pending calls are cancelled if the consumer stops iterating early or a call raises.
+    """
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+    pacer = None if requests_per_second is None else RequestPacer(requests_per_second)
+
+    async def run(item: T) -> Tuple[T, Union[R, Exception]]:
+        async with semaphore:
+            if pacer is not None:
+                await pacer.wait()
+            try:
+                return item, await fetch(item)
+            except Exception as ex:
+                if not return_exceptions:
+                    raise
+                return item, ex
+
+    tasks = [asyncio.ensure_future(run(item)) for item in items]
+    try:
+        for next_done in asyncio.as_completed(tasks):
+            yield await next_done
+    finally:
+        pending = [task for task in tasks if not task.done()]
+        for task in pending:
+            task.cancel()
+        if pending:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,134 @@
+"""Cache of option expiration lists by underlying, with lookups that need no request."""
+from cschwabpy.models import ExpirationType, OptionExpiration
+from dataclasses import dataclass, field
+from datetime import date
+from typing import List, MutableMapping, Optional, Sequence
+import cschwabpy.util as util
+import threading
+import time
+
+# expirations roll off at most daily and new weeklies are listed a few times a week
+DEFAULT_EXPIRATIONS_TTL_SECONDS = 6 * 60 * 60
+
+
+def expiration_date_of(expiration: OptionExpiration) -> date:
+    return date.fromisoformat(expiration.expirationDate[:10])
+
+
+@dataclass
+class OptionExpirationSchedule:
+    """
+    Expiration list of one underlying, sorted by date.
+    Lookups take `as_of` (default today, US eastern) and compute days to expiration from it, so
+    rolled-off expirations drop out and DTEs stay right without re-downloading the list.
+    """
+
+    underlying_symbol: str
+    expirations: List[OptionExpiration]
+    fetched_at: float = field(default_factory=time.monotonic)
+
+    def __post_init__(self) -> None:
+        self.expirations = sorted(self.expirations, key=expiration_date_of)
+        self.__dates = [expiration_date_of(exp) for exp in self.expirations]
+
+    @property
+    def dates(self) -> List[date]:
+        return list(self.__dates)
+
+    def age_seconds(self) -> float:
+        return time.monotonic() - self.fetched_at
+
+    def upcoming(self, as_of: Optional[date] = None) -> List[OptionExpiration]:
+        """Expirations on or after as_of."""
+        as_of = as_of if as_of is not None else util.now().date()
+        return [
+            expiration
+            for expiration_date, expiration in zip(self.__dates, self.expirations)
+            if expiration_date >= as_of
+        ]
+
+    def next(
+        self, count: int = 1, as_of: Optional[date] = None
+    ) -> List[OptionExpiration]:
+        """The next `count` expirations on or after as_of."""
+        return self.upcoming(as_of)[:count]
+
+    def by_type(
+        self, expiration_type: ExpirationType, as_of: Optional[date] = None
+    ) -> List[OptionExpiration]:
+        """Upcoming expirations of a type, e.g. ExpirationType.M for monthlies."""
+        return [
+            expiration
+            for expiration in self.upcoming(as_of)
+            if expiration.expirationType == ExpirationType(expiration_type)
+        ]
+
+    def by_days_to_expiration(
+        self,
+        min_days: int = 0,
+        max_days: Optional[int] = None,
+        as_of: Optional[date] = None,
+    ) -> List[OptionExpiration]:
+        """Expirations with min_days <= days to expiration (from as_of) <= max_days."""
+        as_of = as_of if as_of is not None else util.now().date()
+        return [
+            expiration
+            for expiration_date, expiration in zip(self.__dates, self.expirations)
+            if min_days <= (expiration_date - as_of).days
+            and (max_days is None or (expiration_date - as_of).days <= max_days)
+        ]
+
+
+class OptionExpirationCache(object):
+    """
+    Thread-safe expiration schedules keyed by underlying symbol, each kept for ttl_seconds.
+    Share one instance between clients to warm it once for a symbol universe.
+    """
+
+    def __init__(self, ttl_seconds: float = DEFAULT_EXPIRATIONS_TTL_SECONDS) -> None:
+        self.ttl_seconds = ttl_seconds
+        self.__schedules: MutableMapping[str, OptionExpirationSchedule] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__schedules)
+
+    @property
+    def symbols(self) -> List[str]:
+        return list(self.__schedules.keys())
+
+    def get(self, underlying_symbol: str) -> Optional[OptionExpirationSchedule]:
+        """Schedule of the symbol, None when not cached or older than ttl_seconds."""
+        key = underlying_symbol.upper()
+        with self.__lock:
+            schedule = self.__schedules.get(key)
+            if schedule is not None and schedule.age_seconds() >= self.ttl_seconds:
+                del self.__schedules[key]
+                return None
+            return schedule
+
+    def put(
+        self, underlying_symbol: str, expirations: Sequence[OptionExpiration]
+    ) -> OptionExpirationSchedule:
+        schedule = OptionExpirationSchedule(
+            underlying_symbol=underlying_symbol.upper(), expirations=list(expirations)
+        )
+        with self.__lock:
+            self.__schedules[schedule.underlying_symbol] = schedule
+        return schedule
+
+    def missing(self, underlying_symbols: Sequence[str]) -> List[str]:
+        """Symbols (deduplicated, in order) without a fresh schedule."""
+        return [
+            symbol
+            for symbol in dict.fromkeys(symbol.upper() for symbol in underlying_symbols)
+            if self.get(symbol) is None
+        ]
+
+    def invalidate(self, underlying_symbol: str) -> None:
+        with self.__lock:
+            self.__schedules.pop(underlying_symbol.upper(), None)
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__schedules.clear()
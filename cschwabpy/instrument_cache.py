@@ -0,0 +1,152 @@
+"""LRU/TTL cache of instrument metadata keyed by (symbol, projection), with cusip and instrumentId indexes."""
+from cschwabpy.models.trade_models import AccountInstrument, InstrumentProjection
+from collections import OrderedDict
+from typing import List, MutableMapping, Optional, Sequence, Tuple
+import threading
+import time
+
+DEFAULT_INSTRUMENT_CACHE_SIZE = 10_000
+# descriptions, cusips and ids of a symbol change rarely (corporate actions), fundamentals daily
+DEFAULT_INSTRUMENT_TTL_SECONDS = 24 * 60 * 60
+# symbols per GET /instruments request, keeps the query string well under URL length limits
+INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST = 100
+# projections that return exactly the requested symbols, so results can be cached per symbol
+BATCHABLE_PROJECTIONS = frozenset(
+    {InstrumentProjection.SymbolSearch.value, InstrumentProjection.Fundamental.value}
+)
+
+InstrumentKey = Tuple[str, str]
+
+
+def instrument_key(
+    symbol: str, projection: InstrumentProjection = InstrumentProjection.Fundamental
+) -> InstrumentKey:
+    return (symbol.upper(), InstrumentProjection(projection).value)
+
+
+class InstrumentCache(object):
+    """
+    Thread-safe instruments by (symbol, projection), least recently used evicted beyond max_size,
+    entries expire after ttl_seconds. Share one instance between clients.
+    """
+
+    def __init__(
+        self,
+        max_size: int = DEFAULT_INSTRUMENT_CACHE_SIZE,
+        ttl_seconds: float = DEFAULT_INSTRUMENT_TTL_SECONDS,
+    ) -> None:
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+        self.max_size = max_size
+        self.ttl_seconds = ttl_seconds
+        self.hits = 0
+        self.misses = 0
+        self.__entries: "OrderedDict[InstrumentKey, Tuple[float, AccountInstrument]]" = (
+            OrderedDict()
+        )
+        self.__by_cusip: MutableMapping[Tuple[str, str], InstrumentKey] = {}
+        self.__by_instrument_id: MutableMapping[Tuple[int, str], InstrumentKey] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(
+        self,
+        symbol: str,
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> Optional[AccountInstrument]:
+        with self.__lock:
+            instrument = self.__get(instrument_key(symbol, projection))
+            if instrument is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+            return instrument
+
+    def get_by_cusip(
+        self,
+        cusip: str,
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> Optional[AccountInstrument]:
+        with self.__lock:
+            key = self.__by_cusip.get((cusip, InstrumentProjection(projection).value))
+            return None if key is None else self.__get(key)
+
+    def get_by_instrument_id(
+        self,
+        instrument_id: int,
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> Optional[AccountInstrument]:
+        with self.__lock:
+            key = self.__by_instrument_id.get(
+                (instrument_id, InstrumentProjection(projection).value)
+            )
+            return None if key is None else self.__get(key)
+
+    def put(
+        self,
+        instrument: AccountInstrument,
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> None:
+        if instrument.symbol is None:
+            return
+        key = instrument_key(instrument.symbol, projection)
+        with self.__lock:
+            self.__remove(key)
+            self.__entries[key] = (time.monotonic() + self.ttl_seconds, instrument)
+            if instrument.cusip is not None:
+                self.__by_cusip[(instrument.cusip, key[1])] = key
+            if instrument.instrumentId is not None:
+                self.__by_instrument_id[(instrument.instrumentId, key[1])] = key
+            while len(self.__entries) > self.max_size:
+                self.__remove(next(iter(self.__entries)))
+
+    def missing(
+        self,
+        symbols: Sequence[str],
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> List[str]:
+        """Upper-cased symbols (deduplicated, in order) not in the cache."""
+        with self.__lock:
+            return [
+                symbol
+                for symbol in dict.fromkeys(symbol.upper() for symbol in symbols)
+                if self.__get(instrument_key(symbol, projection)) is None
+            ]
+
+    def invalidate(
+        self,
+        symbol: str,
+        projection: InstrumentProjection = InstrumentProjection.Fundamental,
+    ) -> None:
+        with self.__lock:
+            self.__remove(instrument_key(symbol, projection))
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__by_cusip.clear()
+            self.__by_instrument_id.clear()
+
+    def __get(self, key: InstrumentKey) -> Optional[AccountInstrument]:
+        entry = self.__entries.get(key)
+        if entry is None:
+            return None
+        if entry[0] <= time.monotonic():
+            self.__remove(key)
+            return None
+        self.__entries.move_to_end(key)
+        return entry[1]
+
+    def __remove(self, key: InstrumentKey) -> None:
+        entry = self.__entries.pop(key, None)
+        if entry is None:
+            return
+        instrument = entry[1]
+        cusip_key = (instrument.cusip, key[1])
+        if self.__by_cusip.get(cusip_key) == key:  # type: ignore
+            del self.__by_cusip[cusip_key]  # type: ignore
+        id_key = (instrument.instrumentId, key[1])
+        if self.__by_instrument_id.get(id_key) == key:  # type: ignore
+            del self.__by_instrument_id[id_key]  # type: ignore
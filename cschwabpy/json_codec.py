@@ -0,0 +1,126 @@
+"""JSON codec used by the clients and token stores: orjson or msgspec when installed, else the stdlib json."""
+from typing import Any, Callable, Mapping, Optional, Protocol, Union
+import json
+
+# tried in this order when no codec is named
+JSON_CODEC_PREFERENCE = ("orjson", "msgspec", "json")
+
+
+class IJsonCodec(Protocol):
+    @property
+    def name(self) -> str:
+        """Name of the codec, e.g. orjson."""
+        return ""
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        pass
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        """
+        Compact UTF-8 JSON without spaces after separators. The bytes are not guaranteed to match
+        pydantic's model_dump_json or another codec: float formatting (1e+20 vs 1e20) and non-finite
+        values (NaN, Infinity or null) differ, so compare parsed values, not bytes.
+        @param pretty: indented output for files people may read, e.g. tokens.json.
+        """
+        return b""
+
+
+class StdlibJsonCodec(IJsonCodec):
+    @property
+    def name(self) -> str:
+        return "json"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return json.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        if pretty:
+            return json.dumps(obj, indent=4, ensure_ascii=False).encode("utf-8")
+        return json.dumps(obj, separators=(",", ":"), ensure_ascii=False).encode(
+            "utf-8"
+        )
+
+
+class OrjsonCodec(IJsonCodec):
+    def __init__(self) -> None:
+        import orjson
+
+        self.__orjson = orjson
+
+    @property
+    def name(self) -> str:
+        return "orjson"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.__orjson.loads(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        option = self.__orjson.OPT_NON_STR_KEYS
+        if pretty:
+            option |= self.__orjson.OPT_INDENT_2
+        return self.__orjson.dumps(obj, option=option)
+
+
+class MsgspecJsonCodec(IJsonCodec):
+    def __init__(self) -> None:
+        import msgspec
+
+        self.__msgspec = msgspec
+        self.__encoder = msgspec.json.Encoder()
+        self.__decoder = msgspec.json.Decoder()
+
+    @property
+    def name(self) -> str:
+        return "msgspec"
+
+    def loads(self, data: Union[bytes, str]) -> Any:
+        return self.__decoder.decode(data)
+
+    def dumps(self, obj: Any, pretty: bool = False) -> bytes:
+        encoded = self.__encoder.encode(obj)
+        if pretty:
+            return self.__msgspec.json.format(encoded, indent=4)
+        return encoded
+
+
+JSON_CODECS: Mapping[str, Callable[[], IJsonCodec]] = {
+    "orjson": OrjsonCodec,
+    "msgspec": MsgspecJsonCodec,
+    "json": StdlibJsonCodec,
+}
+
+_default_json_codec: Optional[IJsonCodec] = None
+
+
+def get_json_codec(name: Optional[str] = None) -> IJsonCodec:
+    """
+    New codec by name (raises ImportError if its package is not installed),
+    or the first installed one of JSON_CODEC_PREFERENCE when name is None.
+    """
+    if name is not None:
+        if name not in JSON_CODECS:
+            raise ValueError(
+                f"unknown JSON codec {name}, expected one of {', '.join(JSON_CODECS)}"
+            )
+        return JSON_CODECS[name]()
+
+    for codec_name in JSON_CODEC_PREFERENCE:
+        try:
+            return JSON_CODECS[codec_name]()
+        except ImportError:
+            continue
+    return StdlibJsonCodec()
+
+
+def default_json_codec() -> IJsonCodec:
+    """Codec used when none is passed to a client or token store, picked on first use."""
+    global _default_json_codec
+    if _default_json_codec is None:
+        _default_json_codec = get_json_codec()
+    return _default_json_codec
+
+
+def set_default_json_codec(codec: Union[IJsonCodec, str, None]) -> None:
+    """Sets the process-wide default codec (an instance or a name); None picks the fastest installed again."""
+    global _default_json_codec
+    _default_json_codec = get_json_codec(codec) if isinstance(codec, str) else codec
@@ -0,0 +1,230 @@
+"""Incremental decoding of large JSON responses into their top-level items as the bytes arrive."""
+from json.decoder import JSONDecodeError, scanstring
+from typing import (
+    Any,
+    AsyncIterable,
+    AsyncIterator,
+    Collection,
+    Iterable,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Union,
+)
+import codecs
+import json
+import re
+
+# keys (or array indexes) from the document root down to the item
+JsonPath = Tuple[Union[str, int], ...]
+JsonItem = Tuple[JsonPath, Any]
+
+_WHITESPACE = re.compile(r"[ \t\n\r]*")
+_NUMBER_CHARS = frozenset("0123456789.eE+-")
+
+_KEY_OR_END = 0
+_KEY = 1
+_COLON = 2
+_VALUE = 3
+_VALUE_OR_END = 4
+_COMMA_OR_END = 5
+
+
+class _Container(object):
+    """An object or array being walked member by member."""
+
+    __slots__ = ("is_object", "path", "state", "key", "index")
+
+    def __init__(self, is_object: bool, path: JsonPath) -> None:
+        self.is_object = is_object
+        self.path = path
+        self.state = _KEY_OR_END if is_object else _VALUE_OR_END
+        self.key: str = ""
+        self.index = 0
+
+
+class JsonStreamDecoder(object):
+    """
+    Push decoder of one JSON document that yields its items without holding the whole document.
+    A root array yields ((index,), element) per element, a root object ((key,), value) per member.
+    Members of a root object named in split_keys are objects walked one level further, yielding
+    ((key, member key), member value), e.g. the per-expiration maps of an option chain.
+    Each item is decoded by the stdlib decoder once its last byte has arrived, so the undecoded text
+    held at any time is about one item (at most twice its size while it is still arriving).
+    """
+
+    def __init__(self, split_keys: Collection[str] = ()) -> None:
+        self.__split_keys = frozenset(split_keys)
+        self.__decoder = json.JSONDecoder()
+        self.__text_decoder = codecs.getincrementaldecoder("utf-8")()
+        self.__buffer = ""
+        self.__pos = 0
+        self.__stack: List[_Container] = []
+        self.__started = False
+        self.__done = False
+        # buffer length at which an incomplete item is decoded again, doubling keeps re-decoding linear
+        self.__retry_at = 0
+        self.__last_error: Optional[JSONDecodeError] = None
+
+    @property
+    def done(self) -> bool:
+        """Whether the whole document has been decoded."""
+        return self.__done
+
+    def feed(self, data: Union[bytes, str]) -> List[JsonItem]:
+        """Adds the next chunk of the document and returns the items it completed."""
+        text = self.__text_decoder.decode(data) if isinstance(data, bytes) else data
+        if len(text) == 0:
+            return []
+        self.__buffer += text
+        items = self.__parse(final=False)
+        if self.__pos > 0:
+            self.__buffer = self.__buffer[self.__pos :]
+            self.__retry_at = max(self.__retry_at - self.__pos, 0)
+            self.__pos = 0
+        return items
+
+    def close(self) -> List[JsonItem]:
+        """Ends the document, returning the last items; raises JSONDecodeError if it is incomplete."""
+        self.__buffer += self.__text_decoder.decode(b"", final=True)
+        self.__retry_at = 0
+        items = self.__parse(final=True)
+        if not self.__done:
+            if self.__last_error is not None:
+                raise self.__last_error
+            raise JSONDecodeError(
+                "Unexpected end of JSON document", self.__buffer, self.__pos
+            )
+        return items
+
+    def __parse(self, final: bool) -> List[JsonItem]:
+        items: List[JsonItem] = []
+        buffer = self.__buffer
+        while True:
+            pos = _WHITESPACE.match(buffer, self.__pos).end()  # type: ignore
+            self.__pos = pos
+            if pos >= len(buffer):
+                return items
+            if self.__done:
+                raise JSONDecodeError("Extra data", buffer, pos)
+            char = buffer[pos]
+            if not self.__started:
+                self.__started = True
+                if char in "{[":
+                    self.__stack.append(_Container(char == "{", ()))
+                    self.__pos = pos + 1
+                    continue
+                if not self.__decode_item(items, (), final):
+                    self.__started = False
+                    return items
+                self.__done = True
+                continue
+
+            container = self.__stack[-1]
+            state = container.state
+            if state == _COMMA_OR_END:
+                if char == ",":
+                    container.state = _KEY if container.is_object else _VALUE
+                    self.__pos = pos + 1
+                elif char == ("}" if container.is_object else "]"):
+                    self.__end_container(pos)
+                else:
+                    raise JSONDecodeError("Expecting ',' delimiter", buffer, pos)
+            elif container.is_object and state in (_KEY_OR_END, _KEY):
+                if char == "}" and state == _KEY_OR_END:
+                    self.__end_container(pos)
+                    continue
+                if char != '"':
+                    raise JSONDecodeError(
+                        "Expecting property name enclosed in double quotes",
+                        buffer,
+                        pos,
+                    )
+                try:
+                    container.key, self.__pos = scanstring(buffer, pos + 1)
+                except JSONDecodeError as ex:
+                    self.__last_error = ex
+                    return items
+                container.state = _COLON
+            elif state == _COLON:
+                if char != ":":
+                    raise JSONDecodeError("Expecting ':' delimiter", buffer, pos)
+                container.state = _VALUE
+                self.__pos = pos + 1
+            elif char == "]" and state == _VALUE_OR_END:
+                self.__end_container(pos)
+            elif container.is_object:
+                path = container.path + (container.key,)
+                if (
+                    char == "{"
+                    and len(self.__stack) == 1
+                    and container.key in self.__split_keys
+                ):
+                    container.state = _COMMA_OR_END
+                    self.__stack.append(_Container(True, path))
+                    self.__pos = pos + 1
+                    continue
+                if not self.__decode_item(items, path, final):
+                    return items
+                container.state = _COMMA_OR_END
+            else:
+                if not self.__decode_item(
+                    items, container.path + (container.index,), final
+                ):
+                    return items
+                container.index += 1
+                container.state = _COMMA_OR_END
+
+    def __decode_item(self, items: List[JsonItem], path: JsonPath, final: bool) -> bool:
+        """Decodes the value at the current position, False when it has not fully arrived yet."""
+        buffer = self.__buffer
+        if not final and len(buffer) < self.__retry_at:
+            return False
+        try:
+            value, end = self.__decoder.raw_decode(buffer, self.__pos)
+        except JSONDecodeError as ex:
+            self.__last_error = ex
+            self.__retry_at = 2 * len(buffer) - self.__pos
+            return False
+        # a number ending where the received text ends (or at a partial fraction/exponent) may go on
+        if (
+            not final
+            and type(value) in (int, float)
+            and (end >= len(buffer) or buffer[end] in _NUMBER_CHARS)
+        ):
+            self.__retry_at = len(buffer) + 1
+            return False
+        self.__retry_at = 0
+        self.__last_error = None
+        self.__pos = end
+        items.append((path, value))
+        return True
+
+    def __end_container(self, pos: int) -> None:
+        self.__stack.pop()
+        self.__pos = pos + 1
+        if len(self.__stack) == 0:
+            self.__done = True
+
+
+def iter_json_items(
+    chunks: Iterable[Union[bytes, str]], split_keys: Collection[str] = ()
+) -> Iterator[JsonItem]:
+    """Items of the JSON document read from chunks, see JsonStreamDecoder."""
+    decoder = JsonStreamDecoder(split_keys)
+    for chunk in chunks:
+        yield from decoder.feed(chunk)
+    yield from decoder.close()
+
+
+async def iter_json_items_async(
+    chunks: AsyncIterable[bytes], split_keys: Collection[str] = ()
+) -> AsyncIterator[JsonItem]:
+    """Items of the JSON document as its chunks arrive, e.g. from httpx.Response.aiter_bytes()."""
+    decoder = JsonStreamDecoder(split_keys)
+    async for chunk in chunks:
+        for item in decoder.feed(chunk):
+            yield item
+    for item in decoder.close():
+        yield item
@@ -0,0 +1,136 @@
+"""Cache of market hours keyed by (market type, date), expiring at the end of the cached date."""
+from cschwabpy.models import MarketHourInfo, MarketType
+from datetime import date, datetime, time, timedelta
+from pathlib import Path
+from typing import Any, Mapping, MutableMapping, Optional, Tuple, Union
+import cschwabpy.util as util
+import json
+import threading
+
+# market type None stands for the all-markets response of GET /markets
+MarketHoursKey = Tuple[Optional[str], date]
+
+
+def market_hours_key(
+    market_type: Optional[MarketType], on_date: Optional[Union[date, datetime]]
+) -> MarketHoursKey:
+    """Cache key; no date means today in US eastern time, which is what the API answers for."""
+    if on_date is None:
+        on_date = util.now().date()
+    elif isinstance(on_date, datetime):
+        on_date = on_date.date()
+    return (None if market_type is None else MarketType(market_type).value, on_date)
+
+
+def end_of_day_ts(on_date: date) -> float:
+    """Unix timestamp of the midnight (US eastern) that ends on_date."""
+    next_midnight = datetime.combine(on_date + timedelta(days=1), time())
+    return util.eastern_tz.localize(next_midnight).timestamp()
+
+
+class MarketHoursCache(object):
+    """
+    Thread-safe market hours cache shared by SchwabClient and SchwabAsyncClient.
+    Hours for a date do not change intraday, so an entry lives until the end of its date (US eastern).
+    @param file_path: optional JSON file to persist entries across processes.
+    """
+
+    def __init__(self, file_path: Optional[str] = None) -> None:
+        self.file_path = None if file_path is None else Path(file_path)
+        self.__entries: MutableMapping[
+            MarketHoursKey, Tuple[float, MarketHourInfo]
+        ] = {}
+        self.__lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.__load()
+
+    def __len__(self) -> int:
+        return len(self.__entries)
+
+    def get(
+        self,
+        market_type: Optional[MarketType] = None,
+        on_date: Optional[Union[date, datetime]] = None,
+    ) -> Optional[MarketHourInfo]:
+        key = market_hours_key(market_type, on_date)
+        with self.__lock:
+            entry = self.__entries.get(key)
+            if entry is not None and entry[0] <= util.now_unix_ts():
+                del self.__entries[key]
+                entry = None
+            if entry is None:
+                self.misses += 1
+                return None
+            self.hits += 1
+            return entry[1]
+
+    def put(
+        self,
+        info: MarketHourInfo,
+        market_type: Optional[MarketType] = None,
+        on_date: Optional[Union[date, datetime]] = None,
+    ) -> None:
+        key = market_hours_key(market_type, on_date)
+        with self.__lock:
+            self.__entries[key] = (end_of_day_ts(key[1]), info)
+            self.__save()
+
+    def invalidate(
+        self,
+        market_type: Optional[MarketType] = None,
+        on_date: Optional[Union[date, datetime]] = None,
+    ) -> None:
+        key = market_hours_key(market_type, on_date)
+        with self.__lock:
+            if self.__entries.pop(key, None) is not None:
+                self.__save()
+
+    def clear(self) -> None:
+        with self.__lock:
+            self.__entries.clear()
+            self.__save()
+
+    def is_open_at(
+        self,
+        ts: Optional[Union[datetime, float]] = None,
+        market_type: Optional[MarketType] = None,
+        include_extended: bool = False,
+    ) -> Optional[bool]:
+        """Answers from the cached hours of ts's date (default now); None when that date is not cached."""
+        moment = util.as_aware_datetime(ts)
+        info = self.get(market_type, moment.astimezone(util.eastern_tz).date())
+        if info is None:
+            return None
+        return info.is_open_at(moment, market_type, include_extended)
+
+    def __load(self) -> None:
+        if self.file_path is None or not self.file_path.exists():
+            return
+        try:
+            with open(self.file_path, "r") as cache_file:
+                cached_json: Mapping[str, Any] = json.loads(cache_file.read())
+        except (OSError, ValueError):
+            return
+
+        now_ts = util.now_unix_ts()
+        for entry in cached_json.get("entries", []):
+            if entry["expires_at"] <= now_ts:
+                continue
+            key = (entry["market_type"], date.fromisoformat(entry["date"]))
+            self.__entries[key] = (entry["expires_at"], MarketHourInfo(**entry["info"]))
+
+    def __save(self) -> None:
+        if self.file_path is None:
+            return
+        entries = [
+            {
+                "market_type": market_type,
+                "date": on_date.isoformat(),
+                "expires_at": expires_at,
+                "info": info.model_dump(mode="json", by_alias=True, exclude_none=True),
+            }
+            for (market_type, on_date), (expires_at, info) in self.__entries.items()
+        ]
+        with open(self.file_path, "w") as cache_file:
+            cache_file.write(json.dumps({"entries": entries}, indent=4))
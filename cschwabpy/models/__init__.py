@@ -1,16 +1,74 @@
 """models folder."""
 from datetime import datetime, date
-from dateutil import parser
 from dataclasses import dataclass
-from pydantic import BaseModel, ConfigDict, Field
-from typing import MutableMapping, Mapping, MutableSet, Any, List, Tuple, Optional
+from pydantic import BaseModel, ConfigDict, Field, PrivateAttr
+from typing import (
+    MutableMapping,
+    Mapping,
+    MutableSet,
+    Any,
+    List,
+    Tuple,
+    Optional,
+    Union,
+    TYPE_CHECKING,
+)
 from enum import Enum
 import cschwabpy.util as util
-import pandas as pd
 import pytz
 
+if TYPE_CHECKING:
+    import pandas as pd
+    from cschwabpy.models.frames import OptionChainDataFrames
+
 us_eastern_timezone = pytz.timezone("US/Eastern")
 
+# dataframe helpers live in cschwabpy.models.frames, NumPy backed contracts, chain indexes and deltas in
+# cschwabpy.models.compact, chain_index and chain_delta; they are loaded on first access,
+# so importing models (and the clients) does not import pandas/numpy.
+_LAZY_FRAMES_EXPORTS = {
+    "OptionChainDataFrames",
+    "OptionContract_Dataframe_Fields",
+    "option_contracts_to_dataframe",
+    "option_contract_jsons_to_dataframe",
+    "option_columns_to_dataframe",
+    "option_chain_json_to_dataframe_pairs",
+    "option_exp_map_to_dataframes",
+}
+_LAZY_COMPACT_EXPORTS = {
+    "OptionContractColumns",
+    "CompactOptionContract",
+    "CompactOptionChain",
+}
+_LAZY_CHAIN_INDEX_EXPORTS = {"IndexedOptionChain", "StrikeAlignment"}
+_LAZY_CHAIN_DELTA_EXPORTS = {
+    "ContractChange",
+    "OptionChainDelta",
+    "OptionChainDeltaTracker",
+    "diff_option_chains",
+}
+
+
+def __getattr__(name: str) -> Any:
+    if name in _LAZY_FRAMES_EXPORTS:
+        from cschwabpy.models import frames
+
+        return getattr(frames, name)
+    if name in _LAZY_COMPACT_EXPORTS:
+        from cschwabpy.models import compact
+
+        return getattr(compact, name)
+    if name in _LAZY_CHAIN_INDEX_EXPORTS:
+        from cschwabpy.models import chain_index
+
+        return getattr(chain_index, name)
+    if name in _LAZY_CHAIN_DELTA_EXPORTS:
+        from cschwabpy.models import chain_delta
+
+        return getattr(chain_delta, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
+
+
 OptionChain_Headers = [
     "underlying_price",
     "strike",
@@ -29,53 +87,39 @@ OptionChain_Headers = [
     "volatility",
 ]
 
+OptionChain_Compressed_Dtypes = {
+    "underlying_price": "float32",
+    "strike": "float32",
+    "lastPrice": "float32",
+    "openInterest": "int32",
+    "volume": "int32",
+    "ask": "float32",
+    "bid": "float32",
+    "gamma": "float32",
+    "delta": "float32",
+    "vega": "float32",
+    "volatility": "float32",
+}
+
 
 class JSONSerializableBaseModel(BaseModel):
-    model_config = ConfigDict(use_enum_values=True, populate_by_name=True)
+    # NaN/Infinity (e.g. greeks of illiquid contracts) serialize as in json.dumps rather than null
+    model_config = ConfigDict(
+        use_enum_values=True, populate_by_name=True, ser_json_inf_nan="constants"
+    )
 
     def to_json(self, drop_null_value: bool = True) -> Mapping[str, Any]:
         """Converts the object to a JSON dictionary with options to drop null values from dictionary."""
-        super_json = self.model_dump(by_alias=True)
         if not drop_null_value:
-            return super_json
-
-        result: MutableMapping[str, Any] = {}
-        for k, v in list(super_json.items()):
-            if v is not None:
-                result[k] = self.__handle_item(v)
-
-        return result
-
-    def __handle_item(self, item: Any) -> Any:
-        """Handle item in the dictionary, list or primitive values."""
-        if isinstance(item, dict):
-            return self.__del_none(item)
-        elif isinstance(item, List):
-            result = []
-            for itm in list(item):
-                result.append(self.__handle_item(itm))
-            return result
-        elif isinstance(item, set):
-            result = set()
-            for itm in set(item):
-                result.add(self.__handle_item(itm))
-            return result
-        elif isinstance(item, Enum):
-            return item.value
-        elif isinstance(item, datetime) or isinstance(item, date):
-            return str(item)  # because datetime/date object is not JSON serializable
-        else:
-            return item
-
-    def __del_none(self, d: MutableMapping[str, Any]) -> MutableMapping[str, Any]:
-        """Recursively remove None values from a dictionary."""
-        for key, value in list(d.items()):
-            if value is None:
-                del d[key]
-            elif isinstance(value, MutableMapping):
-                d[key] = self.__del_none(value)
-
-        return d
+            return self.model_dump(by_alias=True)
+        # one pass in pydantic-core: aliases, enum values, dates as ISO strings, None dropped at every level
+        return self.model_dump(mode="json", by_alias=True, exclude_none=True)
+
+    def to_json_bytes(self) -> bytes:
+        """to_json() encoded straight to compact JSON bytes, e.g. for request bodies."""
+        return self.__pydantic_serializer__.to_json(
+            self, by_alias=True, exclude_none=True
+        )
 
 
 class ErrorMessage(JSONSerializableBaseModel):
@@ -131,6 +175,34 @@ class OptionExpirationChainResponse(JSONSerializableBaseModel):
     expirationList: List[OptionExpiration] = []
 
 
+def expiration_windows(
+    expirations: List[OptionExpiration],
+    from_date: str,
+    to_date: str,
+    expirations_per_window: int = 1,
+) -> List[Tuple[str, str]]:
+    """
+    Splits [from_date, to_date] (Y-m-d) into (fromDate, toDate) windows covering `expirations_per_window`
+    listed expirations each, so a wide option chain can be downloaded in smaller requests.
+    """
+    if expirations_per_window < 1:
+        raise ValueError("expirations_per_window must be at least 1")
+    expiration_dates = sorted(
+        {
+            expiration.expirationDate[:10]
+            for expiration in expirations
+            if from_date <= expiration.expirationDate[:10] <= to_date
+        }
+    )
+    return [
+        (chunk[0], chunk[-1])
+        for chunk in (
+            expiration_dates[i : i + expirations_per_window]
+            for i in range(0, len(expiration_dates), expirations_per_window)
+        )
+    ]
+
+
 class OptionContractType(str, Enum):
     """Option contract type."""
 
@@ -176,17 +248,45 @@ class MarketType(str, Enum):
     MutualFund = "MUTUAL_FUND"
 
 
+def parse_iso_datetime(value: str) -> datetime:
+    """Parses an ISO 8601 timestamp, falling back to dateutil for forms datetime.fromisoformat rejects."""
+    try:
+        return datetime.fromisoformat(value)
+    except ValueError:
+        from dateutil import parser
+
+        return parser.parse(value)
+
+
 class MarketHours(JSONSerializableBaseModel):
     start: str
     end: str
+    _start_at: datetime = PrivateAttr()
+    _end_at: datetime = PrivateAttr()
+
+    def model_post_init(self, __context: Any) -> None:
+        self._start_at = parse_iso_datetime(self.start)
+        self._end_at = parse_iso_datetime(self.end)
+
+    @property
+    def start_at(self) -> datetime:
+        """Session start, parsed once when the model is created."""
+        return self._start_at
+
+    @property
+    def end_at(self) -> datetime:
+        """Session end, parsed once when the model is created."""
+        return self._end_at
 
     def open_window(
         self, timezone: pytz.BaseTzInfo = us_eastern_timezone
     ) -> Tuple[datetime, datetime]:
         """Returns the market open window (tuple) in datetime format, defaulted to US eastern timezone.."""
-        start_time = parser.parse(self.start).astimezone(timezone)
-        end_time = parser.parse(self.end).astimezone(timezone)
-        return start_time, end_time
+        return self._start_at.astimezone(timezone), self._end_at.astimezone(timezone)
+
+    def contains(self, moment: datetime) -> bool:
+        """Whether the tz-aware moment falls in [start, end)."""
+        return self._start_at <= moment < self._end_at
 
 
 class SessionHours(JSONSerializableBaseModel):
@@ -194,6 +294,13 @@ class SessionHours(JSONSerializableBaseModel):
     regularMarket: List[MarketHours]
     postMarket: Optional[List[MarketHours]] = None
 
+    def windows(self, include_extended: bool = False) -> List[MarketHours]:
+        """Session windows sorted by start, pre/post market included when include_extended."""
+        sessions = list(self.regularMarket)
+        if include_extended:
+            sessions += (self.preMarket or []) + (self.postMarket or [])
+        return sorted(sessions, key=lambda session: session.start_at)
+
 
 class Market(JSONSerializableBaseModel):
     date: date
@@ -205,6 +312,11 @@ class Market(JSONSerializableBaseModel):
     isOpen: bool
     sessionHours: Optional[SessionHours] = None
 
+    def windows(self, include_extended: bool = False) -> List[MarketHours]:
+        if not self.isOpen or self.sessionHours is None:
+            return []
+        return self.sessionHours.windows(include_extended)
+
 
 class EquityMarket(JSONSerializableBaseModel):
     EQ: Optional[Market] = None
@@ -244,6 +356,59 @@ class MarketHourInfo(JSONSerializableBaseModel):
 
         return self.equity.EQ.sessionHours.regularMarket
 
+    @property
+    def markets(self) -> List[Market]:
+        """All markets (products) present in the response."""
+        candidates: List[Optional[Market]] = []
+        if self.equity is not None:
+            candidates.append(self.equity.EQ)
+        if self.option is not None:
+            candidates += [self.option.EQO, self.option.IND]
+        return [market for market in candidates if market is not None]
+
+    def windows(
+        self,
+        market_type: Optional[MarketType] = None,
+        include_extended: bool = False,
+    ) -> List[MarketHours]:
+        """Open windows of all markets, or only those of market_type, sorted by start."""
+        sessions = [
+            session
+            for market in self.markets
+            if market_type is None or market.marketType == MarketType(market_type)
+            for session in market.windows(include_extended)
+        ]
+        return sorted(sessions, key=lambda session: session.start_at)
+
+    def is_open_at(
+        self,
+        ts: Optional[Union[datetime, float]] = None,
+        market_type: Optional[MarketType] = None,
+        include_extended: bool = False,
+    ) -> bool:
+        """
+        Whether any market (or market_type) is open at ts, answered from the session hours without a request.
+        @param ts: datetime or unix timestamp, defaults to now. Naive datetimes are taken as US eastern.
+        """
+        moment = util.as_aware_datetime(ts)
+        return any(
+            session.contains(moment)
+            for session in self.windows(market_type, include_extended)
+        )
+
+    def next_open(
+        self,
+        after: Optional[Union[datetime, float]] = None,
+        market_type: Optional[MarketType] = None,
+        include_extended: bool = False,
+    ) -> Optional[datetime]:
+        """First session start (US eastern) strictly after `after` (default now) on this date, None if there is none."""
+        moment = util.as_aware_datetime(after)
+        for session in self.windows(market_type, include_extended):
+            if session.start_at > moment:
+                return session.start_at.astimezone(us_eastern_timezone)
+        return None
+
 
 class OptionChainQueryFilter(QueryFilterBase):
     symbol: str
@@ -354,11 +519,60 @@ class Underlying(JSONSerializableBaseModel):
 
 
 @dataclass
-class OptionChainDataFrames:
-    expiration: str
+class OptionChainDownloadResult:
+    """Result of one symbol in a multi-symbol download, error is set instead of raising."""
+
+    symbol: str
+    chain: Optional["OptionChain"] = None
+    frames: Optional[List["OptionChainDataFrames"]] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None
+
+
+# expiration maps of the option chain response and the contract type they hold
+OPTION_CHAIN_EXP_DATE_MAP_KEYS: Mapping[str, str] = {
+    "callExpDateMap": OptionContractType.CALL.value,
+    "putExpDateMap": OptionContractType.PUT.value,
+}
+
+
+@dataclass
+class OptionChainExpiration:
+    """Call or put contracts of one expiration of an option chain, as streamed per expiration."""
+
     underlying_symbol: str
-    call_df: pd.DataFrame
-    put_df: pd.DataFrame
+    put_call: str  # CALL or PUT
+    expiration: str  # exp date map key, e.g. 2024-06-21:27
+    contracts: Mapping[str, List["OptionContract"]]  # by strike, e.g. 450.0
+
+    @classmethod
+    def from_json(
+        cls,
+        underlying_symbol: str,
+        put_call: str,
+        expiration: str,
+        strikes_json: Mapping[str, List[Mapping[str, Any]]],
+    ) -> "OptionChainExpiration":
+        return cls(
+            underlying_symbol=underlying_symbol,
+            put_call=put_call,
+            expiration=expiration,
+            contracts={
+                strike: [OptionContract(**contract) for contract in contracts]
+                for strike, contracts in strikes_json.items()
+            },
+        )
+
+    @property
+    def expiration_date(self) -> str:
+        return self.expiration.split(":")[0]
+
+    @property
+    def days_to_expiration(self) -> int:
+        return int(self.expiration.split(":")[1])
 
 
 class OptionChain(JSONSerializableBaseModel):
@@ -383,13 +597,15 @@ class OptionChain(JSONSerializableBaseModel):
 
     def to_dataframe_pairs_by_expiration(
         self, strip_space: bool = False, use_compression: bool = False
-    ) -> List[OptionChainDataFrames]:
+    ) -> List["OptionChainDataFrames"]:
         """
         List of OptionChainDataFrames by expiration.
         Each OptionChainDataFrames object contains call and put chain in dataframe format.
         @param strip_space: Whether strip spaces in option symbols.
         @param use_compress: Whether to compress the data frame to bare minimum data types.
         """
+        from cschwabpy.models.frames import OptionChainDataFrames
+
         results: List[OptionChainDataFrames] = []
         call_map = self.break_down_option_map(
             self.callExpDateMap,
@@ -420,50 +636,36 @@ class OptionChain(JSONSerializableBaseModel):
         optionExpMap: Mapping[str, Mapping[str, List[OptionContract]]],
         strip_space: bool = False,
         should_compress: bool = False,
-    ) -> Mapping[str, pd.DataFrame]:
+    ) -> Mapping[str, "pd.DataFrame"]:
         """
         Whether strip spaces in option symbols.
         if should_compress is True, cast the data types
         to bare minimum to save memory usage.
         """
-        now_unix_ts = int(util.now_unix_ts())
-        result: MutableMapping[str, pd.DataFrame] = {}
-        for exp_date, strike_map in optionExpMap.items():
-            expiration = exp_date.split(":")[0]
-            if expiration not in result:
-                result[expiration] = {}
-
-            all_rows = []
-            strike_df = pd.DataFrame()
-            for strike_str, option_contracts in strike_map.items():
-                for option_contract in option_contracts:
-                    row = option_contract.to_dataframe_row(strip_space=strip_space)
-                    row.insert(0, self.underlying.mark)
-                    all_rows.append(row)
-
-                strike_df = pd.DataFrame(all_rows)
-                strike_df.columns = OptionChain_Headers
-                # change updated_at to now_unix_ts
-                strike_df["updated_at"] = now_unix_ts
-
-            if should_compress:
-                strike_df = strike_df.astype(
-                    {
-                        "underlying_price": "float32",
-                        "strike": "float32",
-                        "lastPrice": "float32",
-                        "openInterest": "int32",
-                        "volume": "int32",
-                        "ask": "float32",
-                        "bid": "float32",
-                        "lastPrice": "float32",
-                        "gamma": "float32",
-                        "delta": "float32",
-                        "vega": "float32",
-                        "volatility": "float32",
-                    }
-                )
-
-            result[expiration] = strike_df
+        from cschwabpy.models.frames import option_exp_map_to_dataframes
 
-        return result
+        return option_exp_map_to_dataframes(
+            optionExpMap,
+            underlying_price=self.underlying.mark,
+            strip_space=strip_space,
+            should_compress=should_compress,
+        )
+
+
+def merge_option_chains(chains: List[OptionChain]) -> OptionChain:
+    """Merges option chains of the same underlying downloaded for different expirations, ordered by expiration."""
+    if len(chains) == 0:
+        raise ValueError("no option chains to merge")
+    call_exp_date_map: MutableMapping[str, Mapping[str, List[OptionContract]]] = {}
+    put_exp_date_map: MutableMapping[str, Mapping[str, List[OptionContract]]] = {}
+    for chain in chains:
+        call_exp_date_map.update(chain.callExpDateMap)
+        put_exp_date_map.update(chain.putExpDateMap)
+
+    return chains[0].model_copy(
+        update={
+            "callExpDateMap": dict(sorted(call_exp_date_map.items())),
+            "putExpDateMap": dict(sorted(put_exp_date_map.items())),
+            "numberOfContracts": sum(chain.numberOfContracts for chain in chains),
+        }
+    )
@@ -0,0 +1,178 @@
+"""Changes between two option chain snapshots: new, removed and re-quoted contracts, compared column-wise."""
+from cschwabpy.models import OptionChain
+from cschwabpy.models.compact import (
+    NUMERIC_FIELDS,
+    CompactOptionChain,
+    CompactOptionContract,
+)
+from dataclasses import dataclass, field
+from typing import Any, List, MutableMapping, Optional, Sequence, Tuple, Union
+import numpy as np
+import threading
+
+# quote fields compared by default; any numeric OptionContract field (e.g. delta) can be passed instead
+DEFAULT_QUOTE_FIELDS: Tuple[str, ...] = (
+    "bid",
+    "ask",
+    "bidSize",
+    "askSize",
+    "last",
+    "mark",
+    "totalVolume",
+    "openInterest",
+)
+
+ChainSnapshot = Union[OptionChain, CompactOptionChain]
+
+
+@dataclass
+class ContractChange:
+    """A contract in both snapshots whose compared fields differ."""
+
+    contract: CompactOptionContract
+    previous: CompactOptionContract
+    fields: Tuple[str, ...]
+
+    @property
+    def symbol(self) -> str:
+        return self.contract.symbol
+
+    def values(self, name: str) -> Tuple[Any, Any]:
+        """(previous, current) value of a field."""
+        return getattr(self.previous, name), getattr(self.contract, name)
+
+
+@dataclass
+class OptionChainDelta:
+    underlying_symbol: str
+    added: List[CompactOptionContract] = field(default_factory=list)
+    removed: List[CompactOptionContract] = field(default_factory=list)  # of previous
+    changed: List[ContractChange] = field(default_factory=list)
+
+    @property
+    def changed_symbols(self) -> List[str]:
+        """Option symbols of added, removed and changed contracts."""
+        return (
+            [contract.symbol for contract in self.added]
+            + [contract.symbol for contract in self.removed]
+            + [change.symbol for change in self.changed]
+        )
+
+    def __len__(self) -> int:
+        return len(self.added) + len(self.removed) + len(self.changed)
+
+    def __bool__(self) -> bool:
+        return len(self) > 0
+
+
+def _compact(chain: ChainSnapshot) -> CompactOptionChain:
+    if isinstance(chain, OptionChain):
+        return CompactOptionChain.from_chain(chain)
+    return chain
+
+
+def diff_option_chains(
+    previous: Optional[ChainSnapshot],
+    current: ChainSnapshot,
+    fields: Sequence[str] = DEFAULT_QUOTE_FIELDS,
+) -> OptionChainDelta:
+    """
+    Contracts of current that are new or whose fields changed since previous, and contracts of previous
+    no longer listed; contracts are matched by option symbol. Without previous every contract is new.
+    Missing values compare equal to each other (NaN included) and unequal to any value.
+    """
+    for name in fields:
+        if name not in NUMERIC_FIELDS:
+            raise ValueError(f"{name} is not a numeric option contract field")
+    current_chain = _compact(current)
+    current_contracts = current_chain.contracts
+    delta = OptionChainDelta(underlying_symbol=current_chain.symbol)
+    if previous is None:
+        delta.added = list(current_contracts)
+        return delta
+
+    previous_contracts = _compact(previous).contracts
+    previous_rows = {
+        symbol: row for row, symbol in enumerate(previous_contracts.column("symbol"))
+    }
+    matched_previous = np.array(
+        [
+            previous_rows.get(symbol, -1)
+            for symbol in current_contracts.column("symbol")
+        ],
+        dtype=np.intp,
+    )
+    is_matched = matched_previous >= 0
+    current_rows = np.flatnonzero(is_matched)
+    previous_matched_rows = matched_previous[is_matched]
+
+    delta.added = [current_contracts[row] for row in np.flatnonzero(~is_matched)]
+    is_removed = np.ones(len(previous_contracts), dtype=bool)
+    is_removed[previous_matched_rows] = False
+    delta.removed = [previous_contracts[row] for row in np.flatnonzero(is_removed)]
+
+    if len(fields) == 0 or len(current_rows) == 0:
+        return delta
+    # (field, matched contract) matrices
+    current_values = np.stack(
+        [current_contracts.column(name)[current_rows] for name in fields]
+    )
+    previous_values = np.stack(
+        [previous_contracts.column(name)[previous_matched_rows] for name in fields]
+    )
+    current_nulls = np.stack(
+        [current_contracts.null_mask(name)[current_rows] for name in fields]
+    ) | np.isnan(current_values)
+    previous_nulls = np.stack(
+        [previous_contracts.null_mask(name)[previous_matched_rows] for name in fields]
+    ) | np.isnan(previous_values)
+    differs = (current_nulls != previous_nulls) | (
+        ~current_nulls & ~previous_nulls & (current_values != previous_values)
+    )
+
+    names = np.array(fields, dtype=object)
+    for column in np.flatnonzero(differs.any(axis=0)):
+        delta.changed.append(
+            ContractChange(
+                contract=current_contracts[current_rows[column]],
+                previous=previous_contracts[previous_matched_rows[column]],
+                fields=tuple(names[differs[:, column]]),
+            )
+        )
+    return delta
+
+
+class OptionChainDeltaTracker(object):
+    """
+    Last snapshot per underlying, so each downloaded chain is diffed against the previous one of its symbol.
+    Snapshots are kept as CompactOptionChain. Thread-safe; share one instance between clients.
+    """
+
+    def __init__(self, fields: Sequence[str] = DEFAULT_QUOTE_FIELDS) -> None:
+        self.fields = tuple(fields)
+        self.__snapshots: MutableMapping[str, CompactOptionChain] = {}
+        self.__lock = threading.Lock()
+
+    def __len__(self) -> int:
+        return len(self.__snapshots)
+
+    def previous(self, underlying_symbol: str) -> Optional[CompactOptionChain]:
+        with self.__lock:
+            return self.__snapshots.get(underlying_symbol.upper())
+
+    def update(self, chain: ChainSnapshot) -> OptionChainDelta:
+        """Changes since the previous snapshot of the chain's symbol (all contracts on the first one)."""
+        current = _compact(chain)
+        symbol = current.symbol.upper()
+        with self.__lock:
+            previous = self.__snapshots.get(symbol)
+            self.__snapshots[symbol] = current
+        return diff_option_chains(previous, current, self.fields)
+
+    def reset(self, underlying_symbol: Optional[str] = None) -> None:
+        """Forgets the snapshot of one symbol or of all symbols."""
+        with self.__lock:
+            if underlying_symbol is None:
+                self.__snapshots.clear()
+            else:
+                self.__snapshots.pop(underlying_symbol.upper(), None)
@@ -0,0 +1,215 @@
+"""Option chain indexed by expiration and contract type, with sorted strike and delta arrays for lookups."""
+from cschwabpy.models import OptionChain
+from cschwabpy.models.compact import (
+    CompactOptionChain,
+    CompactOptionContract,
+    OptionContractColumns,
+)
+from dataclasses import dataclass
+from typing import List, Mapping, MutableMapping, Optional, Tuple, Union
+import numpy as np
+
+CALL = "CALL"
+PUT = "PUT"
+
+
+def expiration_date_of(expiration: str) -> str:
+    """Y-m-d of an expiration given as date or exp date map key (2024-06-21:27)."""
+    return expiration.split(":")[0]
+
+
+class _SideIndex(object):
+    """Rows of one expiration and contract type, sorted by strike and (non-missing) delta."""
+
+    __slots__ = ("strike_rows", "strikes", "delta_rows", "deltas")
+
+    def __init__(self, rows: np.ndarray, contracts: OptionContractColumns) -> None:
+        strikes = contracts.column("strikePrice")[rows]
+        order = np.argsort(strikes, kind="stable")
+        self.strike_rows = rows[order]
+        self.strikes = strikes[order]
+
+        deltas = contracts.column("delta")[rows]
+        has_delta = ~(contracts.null_mask("delta")[rows] | np.isnan(deltas))
+        delta_rows = rows[has_delta]
+        deltas = deltas[has_delta]
+        order = np.argsort(deltas, kind="stable")
+        self.delta_rows = delta_rows[order]
+        self.deltas = deltas[order]
+        for array in (self.strike_rows, self.strikes, self.delta_rows, self.deltas):
+            array.flags.writeable = False
+
+
+@dataclass
+class StrikeAlignment:
+    """Calls and puts of one expiration side by side: row -1 where a strike has no contract of that type."""
+
+    strikes: np.ndarray
+    call_rows: np.ndarray
+    put_rows: np.ndarray
+    contracts: OptionContractColumns
+
+    def __len__(self) -> int:
+        return len(self.strikes)
+
+    def pairs(
+        self,
+    ) -> List[
+        Tuple[float, Optional[CompactOptionContract], Optional[CompactOptionContract]]
+    ]:
+        return [
+            (
+                float(strike),
+                None if call_row < 0 else self.contracts[call_row],
+                None if put_row < 0 else self.contracts[put_row],
+            )
+            for strike, call_row, put_row in zip(
+                self.strikes, self.call_rows, self.put_rows
+            )
+        ]
+
+
+class IndexedOptionChain(object):
+    """
+    Option chain indexed per (expiration date, CALL/PUT) by sorted strike and delta arrays, built once
+    so strike lookups, strike ranges and delta buckets are binary searches instead of chain scans.
+    Expirations are Y-m-d dates; exp date map keys (2024-06-21:27) are accepted as well.
+    """
+
+    def __init__(self, chain: CompactOptionChain) -> None:
+        self.chain = chain
+        self.contracts = chain.contracts
+        rows_by_side: MutableMapping[Tuple[str, str], List[int]] = {}
+        expiration_dates = {
+            key: expiration_date_of(key) for key in set(chain.expiration_keys)
+        }
+        put_calls = self.contracts.column("putCall")
+        for row, (expiration, put_call) in enumerate(
+            zip(chain.expiration_keys, put_calls)
+        ):
+            rows_by_side.setdefault(
+                (expiration_dates[expiration], put_call), []
+            ).append(row)
+        self.__sides: Mapping[Tuple[str, str], _SideIndex] = {
+            side: _SideIndex(np.array(rows, dtype=np.intp), self.contracts)
+            for side, rows in rows_by_side.items()
+        }
+        self.__expirations = sorted({expiration for expiration, _ in self.__sides})
+
+    @classmethod
+    def from_chain(
+        cls, chain: Union[OptionChain, CompactOptionChain]
+    ) -> "IndexedOptionChain":
+        if isinstance(chain, OptionChain):
+            chain = CompactOptionChain.from_chain(chain)
+        return cls(chain)
+
+    @property
+    def expirations(self) -> List[str]:
+        """Expiration dates in the chain, ascending."""
+        return list(self.__expirations)
+
+    def strikes(self, expiration: str, put_call: str = CALL) -> np.ndarray:
+        """Read-only ascending strikes of an expiration's calls or puts."""
+        return self.__side(expiration, put_call).strikes
+
+    def contracts_by_strike(
+        self, expiration: str, put_call: str = CALL
+    ) -> List[CompactOptionContract]:
+        return [
+            self.contracts[row] for row in self.__side(expiration, put_call).strike_rows
+        ]
+
+    def get(
+        self, expiration: str, strike: float, put_call: str = CALL
+    ) -> Optional[CompactOptionContract]:
+        """Contract at exactly this strike, None if the strike is not listed."""
+        side = self.__side(expiration, put_call)
+        position = _nearest_position(side.strikes, strike)
+        if position is None or not np.isclose(
+            side.strikes[position], strike, rtol=0, atol=1e-9
+        ):
+            return None
+        return self.contracts[side.strike_rows[position]]
+
+    def nearest_strike(
+        self, expiration: str, strike: float, put_call: str = CALL
+    ) -> Optional[CompactOptionContract]:
+        """Contract with the strike closest to the given one (the lower on a tie), None if there are none."""
+        side = self.__side(expiration, put_call)
+        position = _nearest_position(side.strikes, strike)
+        return None if position is None else self.contracts[side.strike_rows[position]]
+
+    def strikes_between(
+        self, expiration: str, low: float, high: float, put_call: str = CALL
+    ) -> List[CompactOptionContract]:
+        """Contracts with low <= strike <= high, by ascending strike."""
+        side = self.__side(expiration, put_call)
+        start = np.searchsorted(side.strikes, low, side="left")
+        end = np.searchsorted(side.strikes, high, side="right")
+        return [self.contracts[row] for row in side.strike_rows[start:end]]
+
+    def nearest_delta(
+        self, expiration: str, delta: float, put_call: str = CALL
+    ) -> Optional[CompactOptionContract]:
+        """Contract with the delta closest to the given one (negative for puts); contracts without delta are skipped."""
+        side = self.__side(expiration, put_call)
+        position = _nearest_position(side.deltas, delta)
+        return None if position is None else self.contracts[side.delta_rows[position]]
+
+    def deltas_between(
+        self, expiration: str, low: float, high: float, put_call: str = CALL
+    ) -> List[CompactOptionContract]:
+        """Contracts with low <= delta <= high, by ascending delta, e.g. the 0.20-0.30 bucket of calls."""
+        side = self.__side(expiration, put_call)
+        start = np.searchsorted(side.deltas, low, side="left")
+        end = np.searchsorted(side.deltas, high, side="right")
+        return [self.contracts[row] for row in side.delta_rows[start:end]]
+
+    def aligned_by_strike(self, expiration: str) -> StrikeAlignment:
+        """Union of call and put strikes of an expiration with the call and put row at each strike."""
+        calls = self.__side(expiration, CALL)
+        puts = self.__side(expiration, PUT)
+        strikes = np.union1d(calls.strikes, puts.strikes)
+        return StrikeAlignment(
+            strikes=strikes,
+            call_rows=_rows_at(calls, strikes),
+            put_rows=_rows_at(puts, strikes),
+            contracts=self.contracts,
+        )
+
+    def __side(self, expiration: str, put_call: str) -> _SideIndex:
+        """Index of one side; an expiration without contracts of that type has an empty one."""
+        expiration = expiration_date_of(expiration)
+        side = self.__sides.get((expiration, put_call))
+        if side is not None:
+            return side
+        if expiration not in self.__expirations:
+            raise KeyError(f"expiration {expiration} is not in the chain")
+        return _EMPTY_SIDE
+
+
+def _nearest_position(values: np.ndarray, target: float) -> Optional[int]:
+    if len(values) == 0:
+        return None
+    position = int(np.searchsorted(values, target))
+    if position == len(values):
+        return position - 1
+    if position > 0 and target - values[position - 1] <= values[position] - target:
+        return position - 1
+    return position
+
+
+def _rows_at(side: _SideIndex, strikes: np.ndarray) -> np.ndarray:
+    """Row of the first contract at each strike, -1 where the side has none."""
+    positions = np.searchsorted(side.strikes, strikes)
+    found = positions < len(side.strikes)
+    found[found] = side.strikes[positions[found]] == strikes[found]
+    rows = np.full(len(strikes), -1, dtype=np.intp)
+    rows[found] = side.strike_rows[positions[found]]
+    return rows
+
+
+_EMPTY_SIDE = _SideIndex(
+    np.empty(0, dtype=np.intp), OptionContractColumns.from_contracts([])
+)
@@ -0,0 +1,287 @@
+"""Compact, read-only option contracts and chains backed by NumPy columns, for holding many chain snapshots."""
+from cschwabpy.models import (
+    OPTION_CHAIN_EXP_DATE_MAP_KEYS,
+    OptionChain,
+    OptionContract,
+)
+from typing import (
+    Any,
+    Iterator,
+    List,
+    Mapping,
+    MutableMapping,
+    Sequence,
+    Tuple,
+    Union,
+    get_args,
+)
+import numpy as np
+import sys
+
+
+def _field_kind(annotation: Any) -> type:
+    """str, int, float or bool of a (possibly Optional) OptionContract field annotation."""
+    for arg in get_args(annotation) or (annotation,):
+        if arg is not type(None):
+            return str if issubclass(arg, str) else arg
+    raise TypeError(f"unsupported field annotation {annotation}")
+
+
+_FIELD_KINDS: Mapping[str, type] = {
+    name: _field_kind(field.annotation)
+    for name, field in OptionContract.model_fields.items()
+}
+# putCall, symbol, description, exchangeName, expirationDate, expirationType, settlementType
+STRING_FIELDS: Tuple[str, ...] = tuple(
+    name for name, kind in _FIELD_KINDS.items() if kind is str
+)
+# prices, sizes, greeks, ... stored as float64 rows; ints (timestamps in ms) stay exact below 2**53
+NUMERIC_FIELDS: Tuple[str, ...] = tuple(
+    name for name, kind in _FIELD_KINDS.items() if kind is not str
+)
+_NUMERIC_ROWS: Mapping[str, int] = {name: i for i, name in enumerate(NUMERIC_FIELDS)}
+
+
+def _read_only(array: np.ndarray) -> np.ndarray:
+    array.flags.writeable = False
+    return array
+
+
+class OptionContractColumns(object):
+    """
+    Struct-of-arrays of option contracts: numeric fields in one float64 array (a row per field),
+    missing values flagged in a parallel bool array, string fields in object arrays of interned
+    strings, so symbols and exchange names are shared by every snapshot holding them.
+    """
+
+    __slots__ = ("__strings", "__numbers", "__nulls")
+
+    def __init__(
+        self,
+        strings: Mapping[str, np.ndarray],
+        numbers: np.ndarray,
+        nulls: np.ndarray,
+    ) -> None:
+        self.__strings = {name: _read_only(strings[name]) for name in STRING_FIELDS}
+        self.__numbers = _read_only(numbers)
+        self.__nulls = _read_only(nulls)
+
+    @classmethod
+    def from_contracts(
+        cls, contracts: Sequence[Union[OptionContract, "CompactOptionContract"]]
+    ) -> "OptionContractColumns":
+        size = len(contracts)
+        strings = {name: np.empty(size, dtype=object) for name in STRING_FIELDS}
+        values = np.empty((len(NUMERIC_FIELDS), size), dtype=object)
+        for row, contract in enumerate(contracts):
+            for name in STRING_FIELDS:
+                strings[name][row] = sys.intern(getattr(contract, name))
+            values[:, row] = [getattr(contract, name) for name in NUMERIC_FIELDS]
+
+        nulls = np.equal(values, None)
+        numbers = np.where(nulls, np.nan, values).astype(np.float64)
+        return cls(strings, numbers, nulls)
+
+    def __len__(self) -> int:
+        return self.__numbers.shape[1]
+
+    def __getitem__(self, row: int) -> "CompactOptionContract":
+        if row < 0:
+            row += len(self)
+        if not 0 <= row < len(self):
+            raise IndexError("contract row out of range")
+        return CompactOptionContract(self, row)
+
+    def __iter__(self) -> Iterator["CompactOptionContract"]:
+        for row in range(len(self)):
+            yield CompactOptionContract(self, row)
+
+    @property
+    def nbytes(self) -> int:
+        """Bytes held by the arrays; the interned strings they point to are shared and not counted."""
+        return (
+            self.__numbers.nbytes
+            + self.__nulls.nbytes
+            + sum(array.nbytes for array in self.__strings.values())
+        )
+
+    def column(self, name: str) -> np.ndarray:
+        """Read-only column of a field, NaN where a numeric value is missing (see null_mask)."""
+        if name in _NUMERIC_ROWS:
+            return self.__numbers[_NUMERIC_ROWS[name]]
+        return self.__strings[name]
+
+    def null_mask(self, name: str) -> np.ndarray:
+        return self.__nulls[_NUMERIC_ROWS[name]]
+
+    def value(self, row: int, name: str) -> Any:
+        position = _NUMERIC_ROWS.get(name)
+        if position is None:
+            strings = self.__strings.get(name)
+            if strings is None:
+                raise AttributeError(f"option contract has no field {name!r}")
+            return strings[row]
+        if self.__nulls[position, row]:
+            return None
+        return _FIELD_KINDS[name](self.__numbers[position, row])
+
+    def take(self, rows: Union[Sequence[int], np.ndarray]) -> "OptionContractColumns":
+        """Columns of the given rows (indexes or a bool mask), in that order."""
+        return OptionContractColumns(
+            {name: array[rows] for name, array in self.__strings.items()},
+            self.__numbers[:, rows],
+            self.__nulls[:, rows],
+        )
+
+    def to_contracts(self) -> List[OptionContract]:
+        return [contract.to_option_contract() for contract in self]
+
+
+class CompactOptionContract(object):
+    """Read-only view of one row of OptionContractColumns with the attributes of OptionContract."""
+
+    __slots__ = ("__columns", "__row")
+
+    def __init__(self, columns: OptionContractColumns, row: int) -> None:
+        object.__setattr__(self, "_CompactOptionContract__columns", columns)
+        object.__setattr__(self, "_CompactOptionContract__row", row)
+
+    def __getattr__(self, name: str) -> Any:
+        if name.startswith("__"):
+            raise AttributeError(name)
+        return self.__columns.value(self.__row, name)
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError("CompactOptionContract is read-only")
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, (CompactOptionContract, OptionContract)):
+            return NotImplemented
+        return all(
+            _same_value(getattr(self, name), getattr(other, name))
+            for name in _FIELD_KINDS
+        )
+
+    __hash__ = None  # type: ignore
+
+    def __repr__(self) -> str:
+        return f"CompactOptionContract(symbol={self.symbol!r}, strikePrice={self.strikePrice!r})"
+
+    def to_dict(self) -> MutableMapping[str, Any]:
+        return {name: getattr(self, name) for name in _FIELD_KINDS}
+
+    def to_option_contract(self) -> OptionContract:
+        return OptionContract(**self.to_dict())
+
+    def to_dataframe_row(self, strip_space: bool = False) -> List[Any]:
+        return self.to_option_contract().to_dataframe_row(strip_space=strip_space)
+
+
+def _same_value(left: Any, right: Any) -> bool:
+    if isinstance(left, float) and isinstance(right, float):
+        return left == right or (left != left and right != right)  # NaN == NaN
+    return left == right
+
+
+# expiration map key (e.g. 2024-06-21:27) -> strike key (e.g. 450.0) -> contracts
+CompactExpDateMap = Mapping[str, Mapping[str, List[CompactOptionContract]]]
+
+
+class CompactOptionChain(object):
+    """
+    OptionChain with its contracts held as OptionContractColumns, a row per contract (calls, then puts)
+    with the expiration and strike keys of the chain's exp date maps. Chain level fields are read as
+    attributes, like on OptionChain; convert with from_chain / to_option_chain.
+    """
+
+    def __init__(
+        self,
+        header: Mapping[str, Any],
+        contracts: OptionContractColumns,
+        expiration_keys: np.ndarray,
+        strike_keys: np.ndarray,
+    ) -> None:
+        self.header = header
+        self.contracts = contracts
+        self.expiration_keys = _read_only(expiration_keys)
+        self.strike_keys = _read_only(strike_keys)
+
+    @classmethod
+    def from_chain(cls, chain: OptionChain) -> "CompactOptionChain":
+        contracts: List[OptionContract] = []
+        expiration_keys: List[str] = []
+        strike_keys: List[str] = []
+        for map_key in OPTION_CHAIN_EXP_DATE_MAP_KEYS:
+            exp_date_map: Mapping[str, Mapping[str, List[OptionContract]]] = getattr(
+                chain, map_key
+            )
+            for expiration, strikes in exp_date_map.items():
+                expiration = sys.intern(expiration)
+                for strike, strike_contracts in strikes.items():
+                    strike = sys.intern(strike)
+                    contracts += strike_contracts
+                    expiration_keys += [expiration] * len(strike_contracts)
+                    strike_keys += [strike] * len(strike_contracts)
+
+        header = {
+            name: getattr(chain, name)
+            for name in OptionChain.model_fields
+            if name not in OPTION_CHAIN_EXP_DATE_MAP_KEYS
+        }
+        return cls(
+            header,
+            OptionContractColumns.from_contracts(contracts),
+            np.array(expiration_keys, dtype=object),
+            np.array(strike_keys, dtype=object),
+        )
+
+    def __getattr__(self, name: str) -> Any:
+        header = self.__dict__.get("header")
+        if header is None or name not in header:
+            raise AttributeError(f"CompactOptionChain has no attribute {name!r}")
+        return header[name]
+
+    def __len__(self) -> int:
+        return len(self.contracts)
+
+    @property
+    def nbytes(self) -> int:
+        return (
+            self.contracts.nbytes
+            + self.expiration_keys.nbytes
+            + self.strike_keys.nbytes
+        )
+
+    @property
+    def callExpDateMap(self) -> CompactExpDateMap:
+        return self.exp_date_map("CALL")
+
+    @property
+    def putExpDateMap(self) -> CompactExpDateMap:
+        return self.exp_date_map("PUT")
+
+    def exp_date_map(self, put_call: str) -> CompactExpDateMap:
+        """Contract views of one side grouped like OptionChain's exp date maps, in chain order."""
+        exp_date_map: MutableMapping[
+            str, MutableMapping[str, List[CompactOptionContract]]
+        ] = {}
+        put_calls = self.contracts.column("putCall")
+        for row in range(len(self.contracts)):
+            if put_calls[row] != put_call:
+                continue
+            strikes = exp_date_map.setdefault(self.expiration_keys[row], {})
+            strikes.setdefault(self.strike_keys[row], []).append(self.contracts[row])
+        return exp_date_map
+
+    def to_option_chain(self) -> OptionChain:
+        exp_date_maps = {
+            map_key: {
+                expiration: {
+                    strike: [contract.to_option_contract() for contract in contracts]
+                    for strike, contracts in strikes.items()
+                }
+                for expiration, strikes in self.exp_date_map(put_call).items()
+            }
+            for map_key, put_call in OPTION_CHAIN_EXP_DATE_MAP_KEYS.items()
+        }
+        return OptionChain(**self.header, **exp_date_maps)
@@ -0,0 +1,227 @@
+"""Pandas dataframe conversions of option chains, imported lazily so that pandas/numpy load only when used."""
+from cschwabpy.models import (
+    OptionChain_Headers,
+    OptionChain_Compressed_Dtypes,
+    OptionContract,
+)
+from dataclasses import dataclass
+from operator import attrgetter
+from typing import Any, List, Mapping, MutableMapping, Optional, Sequence
+import cschwabpy.util as util
+import numpy as np
+import pandas as pd
+
+
+@dataclass
+class OptionChainDataFrames:
+    expiration: str
+    underlying_symbol: str
+    call_df: pd.DataFrame
+    put_df: pd.DataFrame
+
+
+OptionContract_Dataframe_Fields = (
+    "strikePrice",
+    "symbol",
+    "last",
+    "openInterest",
+    "ask",
+    "bid",
+    "expirationDate",
+    "quoteTimeInLong",
+    "totalVolume",
+    "gamma",
+    "delta",
+    "vega",
+    "volatility",
+)
+_dataframe_fields_getter = attrgetter(*OptionContract_Dataframe_Fields)
+DEFAULT_STRICT_SAMPLE_SIZE = 5
+
+
+def option_contracts_to_dataframe(
+    contracts: List[OptionContract],
+    underlying_price: Optional[float],
+    updated_at: int,
+    strip_space: bool = False,
+) -> pd.DataFrame:
+    """
+    Columnar equivalent of OptionContract.to_dataframe_row for a list of contracts,
+    gathers each field in one pass and builds the dataframe once.
+    """
+    return option_columns_to_dataframe(
+        list(zip(*map(_dataframe_fields_getter, contracts))),
+        underlying_price=underlying_price,
+        updated_at=updated_at,
+        strip_space=strip_space,
+    )
+
+
+def option_contract_jsons_to_dataframe(
+    contract_jsons: List[Mapping[str, Any]],
+    underlying_price: Optional[float],
+    updated_at: int,
+    strip_space: bool = False,
+) -> pd.DataFrame:
+    """Same as option_contracts_to_dataframe but reads raw API JSON, skipping OptionContract validation."""
+    return option_columns_to_dataframe(
+        [
+            [contract_json.get(field) for contract_json in contract_jsons]
+            for field in OptionContract_Dataframe_Fields
+        ],
+        underlying_price=underlying_price,
+        updated_at=updated_at,
+        strip_space=strip_space,
+    )
+
+
+def option_columns_to_dataframe(
+    columns: List[Sequence[Any]],
+    underlying_price: Optional[float],
+    updated_at: int,
+    strip_space: bool = False,
+) -> pd.DataFrame:
+    """Builds the option chain dataframe from columns ordered as OptionContract_Dataframe_Fields."""
+    (
+        strikes,
+        symbols,
+        last_prices,
+        open_interests,
+        asks,
+        bids,
+        expiration_dates,
+        quote_times,
+        volumes,
+        gammas,
+        deltas,
+        vegas,
+        volatilities,
+    ) = columns
+
+    if strip_space:
+        symbols = [symbol.strip().replace(" ", "") for symbol in symbols]
+
+    return pd.DataFrame(
+        {
+            "underlying_price": np.full(len(strikes), underlying_price, dtype=float),
+            "strike": np.array(strikes, dtype=float),
+            "symbol": symbols,
+            "lastPrice": np.array(last_prices, dtype=float),
+            "openInterest": list(open_interests),
+            "ask": np.array(asks, dtype=float),
+            "bid": np.array(bids, dtype=float),
+            "expiration_date": [
+                expiration_date[: expiration_date.index("T")]
+                for expiration_date in expiration_dates
+            ],
+            "bid_date": util.ts_array_to_datetime_index(quote_times),
+            "volume": list(volumes),
+            "updated_at": updated_at,
+            "gamma": np.array(gammas, dtype=float),
+            "delta": np.array(deltas, dtype=float),
+            "vega": np.array(vegas, dtype=float),
+            "volatility": np.array(volatilities, dtype=float),
+        },
+        columns=OptionChain_Headers,
+    )
+
+
+def option_chain_json_to_dataframe_pairs(
+    chain_json: Mapping[str, Any],
+    strip_space: bool = False,
+    use_compression: bool = False,
+    strict: bool = False,
+    strict_sample_size: int = DEFAULT_STRICT_SAMPLE_SIZE,
+) -> List[OptionChainDataFrames]:
+    """
+    Fast path of OptionChain(**chain_json).to_dataframe_pairs_by_expiration(), reading the raw
+    putExpDateMap/callExpDateMap JSON straight into columns without building OptionContract models.
+    @param strict: validate `strict_sample_size` contracts of every expiration as OptionContract, raises on invalid data.
+    """
+    now_unix_ts = int(util.now_unix_ts())
+    underlying_json = chain_json.get("underlying") or {}
+    underlying_price = underlying_json.get("mark")
+    frames_by_type: List[MutableMapping[str, pd.DataFrame]] = []
+    for map_key in ("callExpDateMap", "putExpDateMap"):
+        frames: MutableMapping[str, pd.DataFrame] = {}
+        for exp_date, strike_map in chain_json.get(map_key, {}).items():
+            expiration = exp_date.split(":")[0]
+            contract_jsons = [
+                contract_json
+                for contract_jsons in strike_map.values()
+                for contract_json in contract_jsons
+            ]
+            if strict:
+                _validate_contract_sample(contract_jsons, strict_sample_size)
+            if len(contract_jsons) == 0:
+                frames[expiration] = pd.DataFrame()
+                continue
+
+            strike_df = option_contract_jsons_to_dataframe(
+                contract_jsons,
+                underlying_price=underlying_price,
+                updated_at=now_unix_ts,
+                strip_space=strip_space,
+            )
+            if use_compression:
+                strike_df = strike_df.astype(OptionChain_Compressed_Dtypes)
+            frames[expiration] = strike_df
+        frames_by_type.append(frames)
+
+    call_map, put_map = frames_by_type
+    return [
+        OptionChainDataFrames(
+            expiration=expiration,
+            underlying_symbol=chain_json["symbol"],
+            call_df=call_df,
+            put_df=put_map.get(expiration, pd.DataFrame()),
+        )
+        for expiration, call_df in call_map.items()
+    ]
+
+
+def _validate_contract_sample(
+    contract_jsons: List[Mapping[str, Any]], sample_size: int
+) -> None:
+    """Validates evenly spaced contracts, first and last included."""
+    if len(contract_jsons) == 0 or sample_size < 1:
+        return
+    step = max(len(contract_jsons) // sample_size, 1)
+    sample = contract_jsons[::step][:sample_size]
+    sample.append(contract_jsons[-1])
+    for contract_json in sample:
+        OptionContract(**contract_json)
+
+
+def option_exp_map_to_dataframes(
+    option_exp_map: Mapping[str, Mapping[str, List[OptionContract]]],
+    underlying_price: Optional[float],
+    strip_space: bool = False,
+    should_compress: bool = False,
+) -> Mapping[str, pd.DataFrame]:
+    """Dataframe per expiration of a callExpDateMap/putExpDateMap, see OptionChain.break_down_option_map."""
+    now_unix_ts = int(util.now_unix_ts())
+    result: MutableMapping[str, pd.DataFrame] = {}
+    for exp_date, strike_map in option_exp_map.items():
+        expiration = exp_date.split(":")[0]
+        contracts = [
+            option_contract
+            for option_contracts in strike_map.values()
+            for option_contract in option_contracts
+        ]
+        if len(contracts) == 0:
+            result[expiration] = pd.DataFrame()
+            continue
+
+        strike_df = option_contracts_to_dataframe(
+            contracts,
+            underlying_price=underlying_price,
+            updated_at=now_unix_ts,
+            strip_space=strip_space,
+        )
+        if should_compress:
+            strike_df = strike_df.astype(OptionChain_Compressed_Dtypes)
+
+        result[expiration] = strike_df
+
+    return result
@@ -1,17 +1,26 @@
 from cschwabpy.models import JSONSerializableBaseModel
+from cschwabpy.json_codec import IJsonCodec, default_json_codec
+from cschwabpy.concurrency import LoopLocalLock
 from pydantic import ConfigDict, Field
 from typing import Mapping, Any, Protocol, Optional
+from weakref import WeakKeyDictionary
+import asyncio
 import os
-import json
 import time
-import aiofiles as af
 from pathlib import Path
 
 REFRESH_TOKEN_VALIDITY_SECONDS = 7 * 24 * 60 * 60  # 7 days
+ACCESS_TOKEN_REFRESH_MARGIN_SECONDS = (
+    60  # refresh in background this long before expiry
+)
 
 UNIXTIME_FACTORY = time.time
 
 
+class TokensNotAvailableError(Exception):
+    """No tokens in memory nor in the token store; get them manually first."""
+
+
 class Tokens(JSONSerializableBaseModel):
     expires_in: int  # seconds till access__token expires
     token_type: str = "Bearer"
@@ -26,6 +35,15 @@ class Tokens(JSONSerializableBaseModel):
     def is_access_token_valid(self) -> bool:
         return time.time() - self.created_timestamp < self.expires_in
 
+    @property
+    def seconds_until_expiry(self) -> float:
+        """Seconds left before the access token expires, negative if already expired."""
+        return self.created_timestamp + self.expires_in - time.time()
+
+    def expires_within(self, seconds: float) -> bool:
+        """Whether the access token expires within the given number of seconds."""
+        return self.seconds_until_expiry <= seconds
+
     @property
     def is_refresh_token_valid(self) -> bool:
         return time.time() - self.created_timestamp < REFRESH_TOKEN_VALIDITY_SECONDS
@@ -51,9 +69,14 @@ class ITokenStore(Protocol):
 
 class LocalTokenStore(ITokenStore):
     def __init__(
-        self, json_file_name: str = "tokens.json", file_path: Optional[str] = None
+        self,
+        json_file_name: str = "tokens.json",
+        file_path: Optional[str] = None,
+        json_codec: Optional[IJsonCodec] = None,
     ):
+        """@param json_codec: codec of the token file, default the process-wide default_json_codec()."""
         self.file_name = json_file_name
+        self.__json_codec = json_codec
         self.token_file_path = file_path
         if file_path is None:
             self.token_file_path = Path(Path(__file__).parent, json_file_name)
@@ -67,17 +90,23 @@ class LocalTokenStore(ITokenStore):
     def token_output_path(self) -> str:
         return str(self.token_file_path)
 
+    @property
+    def json_codec(self) -> IJsonCodec:
+        return (
+            self.__json_codec if self.__json_codec is not None else default_json_codec()
+        )
+
     def get_tokens(self) -> Optional[Tokens]:
         try:
-            with open(self.token_file_path, "r") as token_file:
-                tokens_json = json.loads(token_file.read())
+            with open(self.token_file_path, "rb") as token_file:
+                tokens_json = self.json_codec.loads(token_file.read())
                 return Tokens(**tokens_json)
         except:
             return None
 
     def save_tokens(self, tokens: Tokens) -> None:
-        with open(self.token_file_path, "w") as token_file:
-            token_file.write(json.dumps(tokens.to_json(), indent=4))
+        with open(self.token_file_path, "wb") as token_file:
+            token_file.write(self.json_codec.dumps(tokens.to_json(), pretty=True))
 
 
 class IAsyncTokenStore(Protocol):
@@ -93,11 +122,33 @@ class IAsyncTokenStore(Protocol):
         pass
 
 
+_shared_refresh_locks: "WeakKeyDictionary[IAsyncTokenStore, LoopLocalLock]" = (
+    WeakKeyDictionary()
+)
+
+
+def get_shared_refresh_lock(token_store: IAsyncTokenStore) -> asyncio.Lock:
+    """
+    Process-wide refresh lock for a token store in the running event loop,
+    so clients sharing a store refresh tokens only once.
+    """
+    lock = _shared_refresh_locks.get(token_store)
+    if lock is None:
+        lock = LoopLocalLock()
+        _shared_refresh_locks[token_store] = lock
+    return lock.get()
+
+
 class AsyncLocalTokenStore(IAsyncTokenStore):
     def __init__(
-        self, json_file_name: str = "tokens.json", file_path: Optional[str] = None
+        self,
+        json_file_name: str = "tokens.json",
+        file_path: Optional[str] = None,
+        json_codec: Optional[IJsonCodec] = None,
     ):
+        """@param json_codec: codec of the token file, default the process-wide default_json_codec()."""
         self.file_name = json_file_name
+        self.__json_codec = json_codec
         self.token_file_path = file_path
         if file_path is None:
             self.token_file_path = Path(Path(__file__).parent, json_file_name)
@@ -111,15 +162,25 @@ class AsyncLocalTokenStore(IAsyncTokenStore):
     def token_output_path(self) -> str:
         return str(self.token_file_path)
 
+    @property
+    def json_codec(self) -> IJsonCodec:
+        return (
+            self.__json_codec if self.__json_codec is not None else default_json_codec()
+        )
+
     async def get_tokens(self) -> Optional[Tokens]:
+        import aiofiles as af
+
         try:
-            async with af.open(self.token_file_path, mode="r") as token_file:
-                token_json_str = await token_file.read()
-                tokens_json = json.loads(token_json_str)
+            async with af.open(self.token_file_path, mode="rb") as token_file:
+                token_json_bytes = await token_file.read()
+                tokens_json = self.json_codec.loads(token_json_bytes)
                 return Tokens(**tokens_json)
         except:
             return None
 
     async def save_tokens(self, tokens: Tokens) -> None:
-        async with af.open(self.token_file_path, mode="w") as token_file:
-            await token_file.write(json.dumps(tokens.to_json(), indent=4))
+        import aiofiles as af
+
+        async with af.open(self.token_file_path, mode="wb") as token_file:
+            await token_file.write(self.json_codec.dumps(tokens.to_json(), pretty=True))
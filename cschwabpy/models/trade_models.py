@@ -1,6 +1,8 @@
 from cschwabpy.models import JSONSerializableBaseModel, OptionContractType
 from typing import Optional, List, Any, Mapping, MutableMapping
 from pydantic import Field
+from dataclasses import dataclass, field
+from datetime import datetime
 from enum import Enum
 
 
@@ -397,6 +399,47 @@ class SecuritiesAccount(JSONSerializableBaseModel):
     securitiesAccount: Account
 
 
+@dataclass
+class AccountSnapshotEntry:
+    """One account in an AccountsSnapshot, error is set instead of raising."""
+
+    account_number: AccountNumberWithHashID
+    account: Optional[Account] = None
+    fetched_at: Optional[datetime] = None
+    # when positions were last read, older than fetched_at if they were carried over from a previous snapshot
+    positions_fetched_at: Optional[datetime] = None
+    error: Optional[Exception] = None
+
+    @property
+    def ok(self) -> bool:
+        return self.error is None and self.account is not None
+
+
+@dataclass
+class AccountsSnapshot:
+    """Accounts fetched together, keyed by account number in request order."""
+
+    started_at: datetime
+    completed_at: datetime
+    entries: MutableMapping[str, AccountSnapshotEntry] = field(default_factory=dict)
+
+    @property
+    def accounts(self) -> List[Account]:
+        return [
+            entry.account
+            for entry in self.entries.values()
+            if entry.ok and entry.account is not None
+        ]
+
+    @property
+    def failed(self) -> List[AccountSnapshotEntry]:
+        return [entry for entry in self.entries.values() if not entry.ok]
+
+    def get(self, account_number: str) -> Optional[Account]:
+        entry = self.entries.get(account_number)
+        return None if entry is None else entry.account
+
+
 # Order models
 class ExecutionLeg(JSONSerializableBaseModel):
     legId: Optional[int] = 0
@@ -0,0 +1,173 @@
+"""Incremental order synchronization with per-account watermarks and change events."""
+from cschwabpy.account_cache import AccountRef
+from cschwabpy.pagination import DEFAULT_ORDERS_PAGE_SIZE
+from cschwabpy.models.trade_models import AccountNumberWithHashID, Order, OrderStatus
+from dataclasses import dataclass, field
+from datetime import datetime, timedelta
+from enum import Enum
+from typing import (
+    Any,
+    Callable,
+    List,
+    Mapping,
+    MutableMapping,
+    Optional,
+    TYPE_CHECKING,
+)
+import cschwabpy.util as util
+
+if TYPE_CHECKING:
+    from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+
+DEFAULT_INITIAL_LOOKBACK = timedelta(days=7)
+# orders entered shortly before the last sync can still change status, so each delta window re-reads them
+DEFAULT_SYNC_OVERLAP = timedelta(minutes=5)
+
+TERMINAL_ORDER_STATUSES = frozenset(
+    {
+        OrderStatus.REJECTED.value,
+        OrderStatus.CANCELED.value,
+        OrderStatus.REPLACED.value,
+        OrderStatus.FILLED.value,
+        OrderStatus.EXPIRED.value,
+    }
+)
+
+
+class OrderChangeType(str, Enum):
+    New = "NEW"
+    StatusChanged = "STATUS_CHANGED"
+    FilledQuantityChanged = "FILLED_QUANTITY_CHANGED"
+    # the API no longer has the order (404 on re-read); order is the last known version
+    Removed = "REMOVED"
+
+
+@dataclass
+class OrderChange:
+    change_type: OrderChangeType
+    order: Order
+    previous: Optional[Order] = None
+
+
+def is_open_order(order: Order) -> bool:
+    return order.status is not None and order.status not in TERMINAL_ORDER_STATUSES
+
+
+def diff_order(previous: Optional[Order], current: Order) -> List[OrderChange]:
+    """Changes between two versions of an order; a fill can be both a status and a filled quantity change."""
+    if previous is None:
+        return [OrderChange(OrderChangeType.New, current)]
+    changes: List[OrderChange] = []
+    if previous.status != current.status:
+        changes.append(OrderChange(OrderChangeType.StatusChanged, current, previous))
+    if (previous.filledQuantity or 0) != (current.filledQuantity or 0):
+        changes.append(
+            OrderChange(OrderChangeType.FilledQuantityChanged, current, previous)
+        )
+    return changes
+
+
+@dataclass
+class OrderSyncState:
+    """Orders known for one account by orderId and the entered-time up to which they were synced."""
+
+    account: AccountNumberWithHashID
+    watermark: Optional[datetime] = None
+    orders: MutableMapping[int, Order] = field(default_factory=dict)
+
+
+class OrderSync(object):
+    """
+    Keeps a local order index per account up to date with SchwabAsyncClient.
+    Each `sync_async` reads only orders entered since the account's watermark (minus `overlap`),
+    re-reads still open orders entered before that window by ID, and reports what changed.
+    Open orders the API no longer finds are dropped from the index (OrderChangeType.Removed).
+    @param on_change: called with every OrderChange as the sync finds it.
+    @param track_open_orders: refresh open orders that fall outside the delta window (e.g. GTC orders).
+    """
+
+    def __init__(
+        self,
+        client: "SchwabAsyncClient",
+        initial_lookback: timedelta = DEFAULT_INITIAL_LOOKBACK,
+        overlap: timedelta = DEFAULT_SYNC_OVERLAP,
+        page_size: int = DEFAULT_ORDERS_PAGE_SIZE,
+        track_open_orders: bool = True,
+        on_change: Optional[Callable[[OrderChange], Any]] = None,
+    ) -> None:
+        self.client = client
+        self.initial_lookback = initial_lookback
+        self.overlap = overlap
+        self.page_size = page_size
+        self.track_open_orders = track_open_orders
+        self.on_change = on_change
+        self.__states: MutableMapping[str, OrderSyncState] = {}
+
+    def state(self, account_number: str) -> Optional[OrderSyncState]:
+        return self.__states.get(account_number)
+
+    def orders(self, account_number: str) -> Mapping[int, Order]:
+        state = self.__states.get(account_number)
+        return {} if state is None else state.orders
+
+    def reset(self, account_number: Optional[str] = None) -> None:
+        """Forgets the watermark and orders of one account or all accounts; the next sync starts over."""
+        if account_number is None:
+            self.__states.clear()
+        else:
+            self.__states.pop(account_number, None)
+
+    async def sync_async(
+        self, account: AccountRef, to_time: Optional[datetime] = None
+    ) -> List[OrderChange]:
+        """Fetches the delta since the last sync of the account, updates the index and returns the changes."""
+        resolved = await self.client.resolve_account_async(account)
+        state = self.__states.get(resolved.accountNumber)
+        if state is None:
+            state = OrderSyncState(account=resolved)
+            self.__states[resolved.accountNumber] = state
+
+        to_time = to_time if to_time is not None else util.now()
+        from_time = (
+            to_time - self.initial_lookback
+            if state.watermark is None
+            else state.watermark - self.overlap
+        )
+        orders = await self.client.get_all_orders_async(
+            resolved, from_time, to_time, page_size=self.page_size
+        )
+
+        missing_ids: List[int] = []
+        if self.track_open_orders:
+            seen_ids = {order.orderId for order in orders}
+            open_ids = [
+                order_id
+                for order_id, order in state.orders.items()
+                if order_id not in seen_ids and is_open_order(order)
+            ]
+            if len(open_ids) > 0:
+                refreshed = await self.client.get_orders_by_ids_async(
+                    resolved, open_ids
+                )
+                orders += [order for order in refreshed.values() if order is not None]
+                missing_ids = [
+                    order_id for order_id, order in refreshed.items() if order is None
+                ]
+
+        changes: List[OrderChange] = []
+        for order in orders:
+            if order.orderId is None:
+                continue
+            order_changes = diff_order(state.orders.get(order.orderId), order)
+            state.orders[order.orderId] = order
+            changes += order_changes
+        for order_id in missing_ids:
+            # otherwise it stays open here and is re-read on every sync
+            last_known = state.orders.pop(order_id)
+            changes.append(OrderChange(OrderChangeType.Removed, last_known, last_known))
+
+        state.watermark = to_time
+        if self.on_change is not None:
+            for change in changes:
+                self.on_change(change)
+        return changes
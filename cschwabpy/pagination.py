@@ -0,0 +1,89 @@
+"""Time-window bisection for endpoints that cap results per request, e.g. GET orders with maxResults."""
+from datetime import datetime, timedelta
+from typing import (
+    AsyncIterator,
+    Awaitable,
+    Callable,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    TypeVar,
+)
+import asyncio
+
+DEFAULT_ORDERS_PAGE_SIZE = 1000
+# the API takes whole seconds, so a window this narrow is not split further even if its page is full
+MIN_WINDOW = timedelta(seconds=1)
+
+T = TypeVar("T")
+TimeWindow = Tuple[datetime, datetime]
+
+
+def split_window(from_time: datetime, to_time: datetime) -> Optional[List[TimeWindow]]:
+    """Halves of the window at a whole second, None when the window cannot be split."""
+    if to_time - from_time <= MIN_WINDOW:
+        return None
+    middle = from_time + (to_time - from_time) / 2
+    middle = middle.replace(microsecond=0)
+    if middle <= from_time:
+        middle += MIN_WINDOW
+    return [(from_time, middle), (middle, to_time)]
+
+
+def iter_bisected_windows(
+    fetch: Callable[[datetime, datetime], List[T]],
+    from_time: datetime,
+    to_time: datetime,
+    page_size: int,
+) -> Iterator[List[T]]:
+    """
+    Calls fetch(from, to) and yields its page unless it is full, in which case the window is halved and
+    each half fetched instead. Halves share their boundary second, so callers de-duplicate.
+    """
+    windows: List[TimeWindow] = [(from_time, to_time)]
+    while len(windows) > 0:
+        window = windows.pop()
+        items = fetch(*window)
+        halves = split_window(*window) if len(items) >= page_size else None
+        if halves is None:
+            yield items
+        else:
+            windows += reversed(halves)
+
+
+async def iter_bisected_windows_async(
+    fetch: Callable[[datetime, datetime], Awaitable[List[T]]],
+    from_time: datetime,
+    to_time: datetime,
+    page_size: int,
+    max_concurrency: int,
+) -> AsyncIterator[List[T]]:
+    """iter_bisected_windows with sub-windows fetched concurrently, pages yielded as they complete."""
+    if max_concurrency < 1:
+        raise ValueError("max_concurrency must be at least 1")
+    semaphore = asyncio.Semaphore(max_concurrency)
+
+    async def run(window: TimeWindow) -> Tuple[TimeWindow, List[T]]:
+        async with semaphore:
+            return window, await fetch(*window)
+
+    pending: Set[asyncio.Future] = {asyncio.ensure_future(run((from_time, to_time)))}
+    try:
+        while len(pending) > 0:
+            done, pending = await asyncio.wait(
+                pending, return_when=asyncio.FIRST_COMPLETED
+            )
+            for task in done:
+                window, items = task.result()
+                halves = split_window(*window) if len(items) >= page_size else None
+                if halves is None:
+                    yield items
+                else:
+                    pending |= {asyncio.ensure_future(run(half)) for half in halves}
+    finally:
+        for task in pending:
+            task.cancel()
+        if len(pending) > 0:
+            await asyncio.gather(*pending, return_exceptions=True)
@@ -0,0 +1,186 @@
+"""Positions indexed by account and instrument, with change detection between snapshots."""
+from cschwabpy.models.trade_models import Account, AccountsSnapshot, Position
+from dataclasses import dataclass, field
+from enum import Enum
+from typing import Any, Iterable, List, Mapping, MutableMapping, Optional, Tuple
+
+# (account number, instrument symbol or "cusip:<cusip>")
+PositionKey = Tuple[str, str]
+
+
+def _instrument_field(instrument: Any, name: str) -> Optional[Any]:
+    """Position.instrument is the raw JSON dict, or a model when built in code."""
+    if instrument is None:
+        return None
+    if isinstance(instrument, Mapping):
+        return instrument.get(name)
+    return getattr(instrument, name, None)
+
+
+def instrument_key(position: Position) -> Optional[str]:
+    """Stable key of a position's instrument: upper-cased symbol, else cusip, None if it has neither."""
+    symbol = _instrument_field(position.instrument, "symbol")
+    if symbol:
+        return str(symbol).upper()
+    cusip = _instrument_field(position.instrument, "cusip")
+    if cusip:
+        return f"cusip:{cusip}"
+    return None
+
+
+def net_quantity(position: Position) -> float:
+    return (position.longQuantity or 0) - (position.shortQuantity or 0)
+
+
+def open_profit_loss(position: Position) -> float:
+    return (position.longOpenProfitLoss or 0) + (position.shortOpenProfitLoss or 0)
+
+
+class PositionChangeType(str, Enum):
+    Added = "ADDED"
+    Removed = "REMOVED"
+    QuantityChanged = "QUANTITY_CHANGED"
+    ProfitLossChanged = "PROFIT_LOSS_CHANGED"
+
+
+@dataclass
+class PositionChange:
+    change_type: PositionChangeType
+    key: PositionKey
+    position: Optional[Position] = None  # None when removed
+    previous: Optional[Position] = None  # None when added
+
+
+@dataclass
+class PositionDiff:
+    added: List[PositionChange] = field(default_factory=list)
+    removed: List[PositionChange] = field(default_factory=list)
+    quantity_changed: List[PositionChange] = field(default_factory=list)
+    profit_loss_changed: List[PositionChange] = field(default_factory=list)
+
+    @property
+    def changes(self) -> List[PositionChange]:
+        return (
+            self.added + self.removed + self.quantity_changed + self.profit_loss_changed
+        )
+
+    @property
+    def changed_keys(self) -> List[PositionKey]:
+        return list(dict.fromkeys(change.key for change in self.changes))
+
+    def __bool__(self) -> bool:
+        return len(self.changes) > 0
+
+
+class PositionIndex(object):
+    """
+    Positions of one or more accounts keyed by (account number, instrument key).
+    Net quantity and open P&L are computed once per row when the index is built, so diffing two
+    indexes compares plain floats and only builds PositionChange objects for rows that changed.
+    """
+
+    def __init__(self) -> None:
+        self.__positions: MutableMapping[PositionKey, Position] = {}
+        self.__values: MutableMapping[PositionKey, Tuple[float, float]] = {}
+
+    @classmethod
+    def from_accounts(cls, accounts: Iterable[Account]) -> "PositionIndex":
+        index = cls()
+        for account in accounts:
+            index.add_account(account)
+        return index
+
+    @classmethod
+    def from_snapshot(
+        cls, snapshot: AccountsSnapshot, previous: Optional["PositionIndex"] = None
+    ) -> "PositionIndex":
+        """
+        Positions of the snapshot's accounts. Entries without positions (fetched without them, or failed)
+        are skipped, so they do not show up as closed positions; their rows are carried over from previous.
+        """
+        index = cls()
+        for account_number, entry in snapshot.entries.items():
+            if entry.ok and entry.positions_fetched_at is not None:
+                index.add_account(entry.account)
+            elif previous is not None:
+                index.__copy_account_rows(previous, account_number)
+        return index
+
+    def __len__(self) -> int:
+        return len(self.__positions)
+
+    def __contains__(self, key: PositionKey) -> bool:
+        return key in self.__positions
+
+    def keys(self) -> List[PositionKey]:
+        return list(self.__positions.keys())
+
+    def get(self, account_number: str, key: str) -> Optional[Position]:
+        """Position by account number and symbol (any case) or "cusip:<cusip>"."""
+        if not key.startswith("cusip:"):
+            key = key.upper()
+        return self.__positions.get((account_number, key))
+
+    def add_account(self, account: Account) -> None:
+        """Adds (or replaces) the positions of an account; positions without symbol and cusip are skipped."""
+        for position in account.positions:
+            key = instrument_key(position)
+            if key is None:
+                continue
+            row_key = (account.accountNumber, key)
+            self.__positions[row_key] = position
+            self.__values[row_key] = (
+                net_quantity(position),
+                open_profit_loss(position),
+            )
+
+    def __copy_account_rows(self, other: "PositionIndex", account_number: str) -> None:
+        for row_key, position in other.__positions.items():
+            if row_key[0] == account_number:
+                self.__positions[row_key] = position
+                self.__values[row_key] = other.__values[row_key]
+
+    def diff(self, newer: "PositionIndex", pnl_threshold: float = 0.0) -> PositionDiff:
+        """
+        Changes from this index to a newer one.
+        @param pnl_threshold: open P&L changes of at most this absolute amount are ignored.
+        """
+        result = PositionDiff()
+        newer_values = newer.__values
+        for key, (quantity, pnl) in newer_values.items():
+            previous_values = self.__values.get(key)
+            if previous_values is None:
+                result.added.append(
+                    PositionChange(
+                        PositionChangeType.Added, key, newer.__positions[key], None
+                    )
+                )
+                continue
+            if previous_values[0] != quantity:
+                result.quantity_changed.append(
+                    PositionChange(
+                        PositionChangeType.QuantityChanged,
+                        key,
+                        newer.__positions[key],
+                        self.__positions[key],
+                    )
+                )
+            if abs(pnl - previous_values[1]) > pnl_threshold:
+                result.profit_loss_changed.append(
+                    PositionChange(
+                        PositionChangeType.ProfitLossChanged,
+                        key,
+                        newer.__positions[key],
+                        self.__positions[key],
+                    )
+                )
+
+        for key in self.__values.keys():
+            if key in newer_values:
+                continue
+            result.removed.append(
+                PositionChange(
+                    PositionChangeType.Removed, key, None, self.__positions[key]
+                )
+            )
+        return result
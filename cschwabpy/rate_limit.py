@@ -0,0 +1,127 @@
+"""Client-side token-bucket rate limiting aligned with Schwab per-app request quotas."""
+from cschwabpy.costants import (
+    SCHWAB_MARKET_DATA_API_BASE_URL,
+    SCHWAB_TRADER_API_BASE_URL,
+)
+from dataclasses import dataclass
+from typing import Mapping, MutableMapping, Optional, Protocol
+import asyncio
+import threading
+import time
+
+TRADER_REQUESTS_PER_MINUTE = 120
+MARKET_DATA_REQUESTS_PER_MINUTE = 120
+DEFAULT_BURST = 10
+
+TRADER_BUCKET = "trader"
+MARKET_DATA_BUCKET = "market_data"
+
+
+@dataclass
+class RateLimiterStats:
+    """Queue time metrics of one bucket."""
+
+    requests: int = 0
+    delayed_requests: int = 0
+    total_wait_seconds: float = 0.0
+    max_wait_seconds: float = 0.0
+
+    @property
+    def avg_wait_seconds(self) -> float:
+        return self.total_wait_seconds / self.requests if self.requests > 0 else 0.0
+
+    def record(self, wait_seconds: float) -> None:
+        self.requests += 1
+        if wait_seconds > 0:
+            self.delayed_requests += 1
+            self.total_wait_seconds += wait_seconds
+            self.max_wait_seconds = max(self.max_wait_seconds, wait_seconds)
+
+
+class TokenBucket(object):
+    """Thread-safe token bucket refilled at `rate` tokens per second up to `capacity` (the burst size).
+
+    `reserve()` takes a token immediately and returns how long the caller must wait before using it,
+    so the same bucket works for sync callers (time.sleep) and async callers (asyncio.sleep).
+    """
+
+    def __init__(self, rate: float, capacity: float) -> None:
+        if rate <= 0 or capacity < 1:
+            raise ValueError("rate must be positive and capacity at least 1")
+        self.rate = rate
+        self.capacity = capacity
+        self.stats = RateLimiterStats()
+        self.__tokens = capacity
+        self.__updated_at = time.monotonic()
+        self.__lock = threading.Lock()
+
+    @classmethod
+    def per_minute(cls, requests_per_minute: float, burst: float) -> "TokenBucket":
+        return cls(rate=requests_per_minute / 60.0, capacity=burst)
+
+    def reserve(self, tokens: float = 1) -> float:
+        with self.__lock:
+            now = time.monotonic()
+            self.__tokens = min(
+                self.capacity, self.__tokens + (now - self.__updated_at) * self.rate
+            )
+            self.__updated_at = now
+            self.__tokens -= tokens
+            wait_seconds = 0.0 if self.__tokens >= 0 else -self.__tokens / self.rate
+            self.stats.record(wait_seconds)
+            return wait_seconds
+
+
+class IRateLimiter(Protocol):
+    def acquire(self, url: str) -> float:
+        """Blocks until a request to url may be sent, returns seconds waited."""
+        pass
+
+    async def acquire_async(self, url: str) -> float:
+        """Waits without blocking the event loop until a request to url may be sent, returns seconds waited."""
+        pass
+
+
+class SchwabRateLimiter(IRateLimiter):
+    """Separate buckets for trader and market data endpoints; other urls (e.g. oauth) are not throttled.
+
+    Share one instance between SchwabClient and SchwabAsyncClient objects of the same app.
+    """
+
+    def __init__(
+        self,
+        trader_requests_per_minute: float = TRADER_REQUESTS_PER_MINUTE,
+        market_data_requests_per_minute: float = MARKET_DATA_REQUESTS_PER_MINUTE,
+        burst: float = DEFAULT_BURST,
+    ) -> None:
+        self.buckets: MutableMapping[str, TokenBucket] = {
+            TRADER_BUCKET: TokenBucket.per_minute(trader_requests_per_minute, burst),
+            MARKET_DATA_BUCKET: TokenBucket.per_minute(
+                market_data_requests_per_minute, burst
+            ),
+        }
+
+    @property
+    def stats(self) -> Mapping[str, RateLimiterStats]:
+        return {name: bucket.stats for name, bucket in self.buckets.items()}
+
+    def bucket_for(self, url: str) -> Optional[TokenBucket]:
+        if url.startswith(SCHWAB_TRADER_API_BASE_URL):
+            return self.buckets[TRADER_BUCKET]
+        if url.startswith(SCHWAB_MARKET_DATA_API_BASE_URL):
+            return self.buckets[MARKET_DATA_BUCKET]
+        return None
+
+    def acquire(self, url: str) -> float:
+        bucket = self.bucket_for(url)
+        wait_seconds = 0.0 if bucket is None else bucket.reserve()
+        if wait_seconds > 0:
+            time.sleep(wait_seconds)
+        return wait_seconds
+
+    async def acquire_async(self, url: str) -> float:
+        bucket = self.bucket_for(url)
+        wait_seconds = 0.0 if bucket is None else bucket.reserve()
+        if wait_seconds > 0:
+            await asyncio.sleep(wait_seconds)
+        return wait_seconds
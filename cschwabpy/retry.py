@@ -0,0 +1,80 @@
+"""Retry policy for Schwab API requests."""
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from email.utils import parsedate_to_datetime
+from typing import FrozenSet, Optional
+import httpx
+import random
+
+RETRYABLE_STATUS_CODES = frozenset({429, 500, 502, 503, 504})
+IDEMPOTENT_METHODS = frozenset({"GET", "HEAD", "OPTIONS", "DELETE"})
+# the request never reached Schwab, so even non-idempotent calls (e.g. placing an order) are safe to resend
+NOT_SENT_EXCEPTIONS = (httpx.ConnectError, httpx.ConnectTimeout, httpx.PoolTimeout)
+
+
+def parse_retry_after(value: Optional[str]) -> Optional[float]:
+    """Seconds to wait from a Retry-After header given in seconds or as an HTTP date."""
+    if value is None:
+        return None
+    value = value.strip()
+    try:
+        return max(float(value), 0.0)
+    except ValueError:
+        pass
+    try:
+        retry_at = parsedate_to_datetime(value)
+    except (TypeError, ValueError):
+        return None
+    if retry_at.tzinfo is None:
+        retry_at = retry_at.replace(tzinfo=timezone.utc)
+    return max((retry_at - datetime.now(timezone.utc)).total_seconds(), 0.0)
+
+
+@dataclass(frozen=True)
+class RetryPolicy:
+    """Retries idempotent requests on 429/5xx and transport errors with jittered exponential backoff.
+
+    Non-idempotent requests (POST, e.g. place_order) are only resent when the connection could not be made.
+    Use `RetryPolicy(max_attempts=1)` to disable retries.
+    """
+
+    max_attempts: int = 3
+    base_delay: float = 0.5
+    max_delay: float = 30.0
+    retry_status_codes: FrozenSet[int] = RETRYABLE_STATUS_CODES
+    idempotent_methods: FrozenSet[str] = IDEMPOTENT_METHODS
+    respect_retry_after: bool = True
+
+    def is_idempotent(self, method: str) -> bool:
+        return method.upper() in self.idempotent_methods
+
+    def should_retry_response(
+        self, method: str, response: httpx.Response, attempt: int
+    ) -> bool:
+        """attempt is zero based."""
+        return (
+            attempt + 1 < self.max_attempts
+            and self.is_idempotent(method)
+            and response.status_code in self.retry_status_codes
+        )
+
+    def should_retry_exception(
+        self, method: str, exception: Exception, attempt: int
+    ) -> bool:
+        if attempt + 1 >= self.max_attempts:
+            return False
+        if isinstance(exception, NOT_SENT_EXCEPTIONS):
+            return True
+        return self.is_idempotent(method) and isinstance(
+            exception, httpx.TransportError
+        )
+
+    def delay_for(
+        self, attempt: int, response: Optional[httpx.Response] = None
+    ) -> float:
+        """Retry-After when the server sends one, full-jitter exponential backoff otherwise."""
+        if self.respect_retry_after and response is not None:
+            retry_after = parse_retry_after(response.headers.get("Retry-After"))
+            if retry_after is not None:
+                return min(retry_after, self.max_delay)
+        return random.uniform(0, min(self.max_delay, self.base_delay * (2**attempt)))
@@ -0,0 +1,135 @@
+"""Pooled HTTP transport shared by SchwabClient and SchwabAsyncClient."""
+from dataclasses import dataclass, field
+from types import MappingProxyType
+from typing import Mapping, Optional, Union
+import importlib.util
+import httpx
+
+DEFAULT_MAX_CONNECTIONS = 20
+DEFAULT_MAX_KEEPALIVE_CONNECTIONS = 10
+DEFAULT_KEEPALIVE_EXPIRY_SECONDS = 30.0
+DEFAULT_TIMEOUT_SECONDS = 30.0
+
+EMPTY_HEADERS: Mapping[str, str] = MappingProxyType({})
+JSON_CONTENT_TYPE_HEADER: Mapping[str, str] = MappingProxyType(
+    {"Content-Type": "application/json"}
+)
+
+
+def is_http2_available() -> bool:
+    """Whether the optional `h2` package is installed, which httpx needs for HTTP/2."""
+    return importlib.util.find_spec("h2") is not None
+
+
+@dataclass(frozen=True)
+class PoolConfig:
+    """Connection pool settings for the http client owned by a Schwab client.
+
+    Args:
+        max_connections: upper bound of concurrent connections in the pool.
+        max_keepalive_connections: idle connections kept open for reuse.
+        keepalive_expiry: seconds an idle connection stays in the pool.
+        http2: use HTTP/2 when the `h2` package is installed, HTTP/1.1 otherwise.
+        timeout: request timeout in seconds.
+    """
+
+    max_connections: int = DEFAULT_MAX_CONNECTIONS
+    max_keepalive_connections: int = DEFAULT_MAX_KEEPALIVE_CONNECTIONS
+    keepalive_expiry: float = DEFAULT_KEEPALIVE_EXPIRY_SECONDS
+    http2: bool = True
+    timeout: float = DEFAULT_TIMEOUT_SECONDS
+
+    @property
+    def limits(self) -> httpx.Limits:
+        return httpx.Limits(
+            max_connections=self.max_connections,
+            max_keepalive_connections=self.max_keepalive_connections,
+            keepalive_expiry=self.keepalive_expiry,
+        )
+
+    @property
+    def use_http2(self) -> bool:
+        return self.http2 and is_http2_available()
+
+    def create_client(
+        self, headers: Optional[Mapping[str, str]] = None
+    ) -> httpx.Client:
+        return httpx.Client(
+            limits=self.limits,
+            http2=self.use_http2,
+            timeout=self.timeout,
+            headers=headers,
+        )
+
+    def create_async_client(
+        self, headers: Optional[Mapping[str, str]] = None
+    ) -> httpx.AsyncClient:
+        return httpx.AsyncClient(
+            limits=self.limits,
+            http2=self.use_http2,
+            timeout=self.timeout,
+            headers=headers,
+        )
+
+
+@dataclass(frozen=True)
+class AuthHeaders:
+    """Immutable pre-rendered auth headers, rebuilt only when tokens change."""
+
+    default: Mapping[str, str]
+    json_content: Mapping[str, str]
+
+    @classmethod
+    def render(cls, token_type: str, access_token: str) -> "AuthHeaders":
+        default = {
+            "Authorization": f"{token_type} {access_token}",
+            "Accept": "application/json",
+        }
+        return cls(
+            default=MappingProxyType(default),
+            json_content=MappingProxyType({**default, **JSON_CONTENT_TYPE_HEADER}),
+        )
+
+
+@dataclass
+class PoolStats:
+    """Snapshot of the transport usage of a Schwab client.
+
+    `clients_created` counts underlying http clients (each one pays its own TCP+TLS handshakes);
+    in pooled mode it stays at 1 for the lifetime of the Schwab client.
+    """
+
+    pooled: bool = False
+    http2: bool = False
+    clients_created: int = 0
+    requests_sent: int = 0
+    retries: int = 0
+    open_connections: int = 0
+    idle_connections: int = 0
+    max_connections: Optional[int] = None
+    max_keepalive_connections: Optional[int] = None
+    http_versions: dict = field(default_factory=dict)
+
+    def record_response(self, response: httpx.Response) -> None:
+        self.requests_sent += 1
+        version = response.http_version
+        self.http_versions[version] = self.http_versions.get(version, 0) + 1
+
+
+def read_connection_counts(
+    client: Optional[Union[httpx.Client, httpx.AsyncClient]]
+) -> tuple:
+    """Returns (open, idle) connection counts of the client's connection pool, (0, 0) if unknown."""
+    if client is None or client.is_closed:
+        return 0, 0
+    # httpx does not expose pool internals publicly; read httpcore's pool when present.
+    pool = getattr(getattr(client, "_transport", None), "_pool", None)
+    connections = getattr(pool, "connections", None)
+    if connections is None:
+        return 0, 0
+    idle = 0
+    for connection in connections:
+        is_idle = getattr(connection, "is_idle", None)
+        if callable(is_idle) and is_idle():
+            idle += 1
+    return len(connections), idle
@@ -1,6 +1,11 @@
 from datetime import datetime, date
 import pytz
-from typing import Optional
+from typing import List, Optional, Sequence, TypeVar, Union, TYPE_CHECKING
+
+if TYPE_CHECKING:
+    import pandas as pd
+
+T = TypeVar("T")
 
 eastern_tz: pytz.BaseTzInfo = pytz.timezone("US/Eastern")
 YMD_FMT = "%Y-%m-%d"
@@ -28,6 +33,34 @@ def ts_to_datetime(
     return datetime.fromtimestamp(ts, tz)
 
 
+def as_aware_datetime(
+    moment: Optional[Union[datetime, float]] = None, tz: pytz.BaseTzInfo = eastern_tz
+) -> datetime:
+    """datetime or unix timestamp (seconds or milliseconds) to tz-aware datetime, default now.
+    Naive datetimes are taken to be in tz."""
+    if moment is None:
+        return now(tz)
+    if isinstance(moment, datetime):
+        return moment if moment.tzinfo is not None else tz.localize(moment)
+    return ts_to_datetime(moment, tz)  # type: ignore
+
+
+def ts_array_to_datetime_index(
+    ts_values: Sequence[Optional[float]], tz: pytz.BaseTzInfo = eastern_tz
+) -> "pd.DatetimeIndex":
+    """Vectorized ts_to_datetime: seconds or milliseconds timestamps, None becomes NaT."""
+    import numpy as np
+    import pandas as pd
+
+    ts_array = np.array(ts_values, dtype=float)
+    too_large = ts_array > 1e10
+    while too_large.any():
+        ts_array[too_large] /= 1000
+        too_large = ts_array > 1e10
+    # microsecond unit to match datetime.fromtimestamp precision
+    return pd.to_datetime(np.round(ts_array * 1e6), unit="us", utc=True).tz_convert(tz)
+
+
 def ts_to_date_string(
     ts: Optional[float] = None, tz: pytz.BaseTzInfo = eastern_tz
 ) -> Optional[str]:
@@ -49,3 +82,10 @@ def today_str(tz: pytz.BaseTzInfo = eastern_tz) -> str:  # type: ignore
 
 def date_to_str(date: date, date_format: str = YMD_FMT) -> str:
     return date.strftime(date_format)
+
+
+def chunked(items: Sequence[T], size: int) -> List[List[T]]:
+    """Splits items into consecutive lists of at most size items."""
+    if size < 1:
+        raise ValueError("size must be at least 1")
+    return [list(items[i : i + size]) for i in range(0, len(items), size)]
@@ -0,0 +1,92 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.account_cache import AccountHashCache, AccountNotFoundError
+from cschwabpy.models.token import AsyncLocalTokenStore, LocalTokenStore
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+account_numbers_url = "https://api.schwabapi.com/trader/v1/accounts/accountNumbers"
+
+
+def test_account_hash_cache() -> None:
+    cache = AccountHashCache()
+    cache.update(
+        AccountNumberWithHashID(**account_json)
+        for account_json in get_mock_response()["account_numbers"]
+    )
+    assert cache.get("123456789").hashValue == "hash1"
+    assert cache.get("hash2").accountNumber == "987654321"
+    assert cache.get("000") is None
+
+    cache.invalidate("123456789")
+    assert cache.get("123456789") is None
+    assert cache.get("hash1") is None
+    assert len(cache) == 1
+    cache.invalidate()
+    assert len(cache) == 0
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_async_client_resolves_plain_account_numbers(
+    httpx_mock: HTTPXMock,
+) -> None:
+    httpx_mock.add_response(
+        url=account_numbers_url,
+        json=get_mock_response()["account_numbers"],
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/hash1/orders/1",
+        json=get_mock_response()["filled_order"],
+        is_reusable=True,
+    )
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    for _ in range(3):
+        order = await cschwab_client.get_order_by_id_async("123456789", 1)
+        assert order is not None
+    assert len(httpx_mock.get_requests(url=account_numbers_url)) == 1
+
+    await cschwab_client.get_order_by_id_async("hash1", 1)
+    assert len(httpx_mock.get_requests(url=account_numbers_url)) == 1
+
+    with pytest.raises(AccountNotFoundError):
+        await cschwab_client.resolve_account_async("555")
+    assert len(httpx_mock.get_requests(url=account_numbers_url)) == 2
+
+    cschwab_client.invalidate_account_hashes()
+    resolved = await cschwab_client.resolve_account_async("987654321")
+    assert resolved.hashValue == "hash2"
+    assert len(httpx_mock.get_requests(url=account_numbers_url)) == 3
+
+
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+def test_sync_client_resolves_plain_account_numbers(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url=account_numbers_url, json=get_mock_response()["account_numbers"]
+    )
+    httpx_mock.add_response(
+        method="DELETE",
+        url="https://api.schwabapi.com/trader/v1/accounts/hash2/orders/7",
+        is_reusable=True,
+    )
+    cschwab_client = SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+    )
+    assert cschwab_client.cancel_order("987654321", 7)
+    assert cschwab_client.cancel_order("987654321", 7)
+    assert len(httpx_mock.get_requests(url=account_numbers_url)) == 1
@@ -0,0 +1,109 @@
+import copy
+import httpx
+import pytest
+import re
+from pytest_httpx import HTTPXMock
+from cschwabpy.account_cache import AccountNotFoundError
+from cschwabpy.models.token import AsyncLocalTokenStore
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from cschwabpy.retry import RetryPolicy
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+account_url = re.compile(r".*/trader/v1/accounts/(hash\d)(\?fields=positions)?$")
+account_numbers = {"hash1": "123456789", "hash2": "987654321"}
+
+
+def account_response(request: httpx.Request) -> httpx.Response:
+    hash_value = account_url.match(str(request.url)).group(1)
+    if hash_value not in account_numbers:
+        return httpx.Response(500)
+    account_json = copy.deepcopy(get_mock_response()["single_account"])
+    account_json["securitiesAccount"]["accountNumber"] = account_numbers[hash_value]
+    if "fields" not in request.url.params:
+        del account_json["securitiesAccount"]["positions"]
+    return httpx.Response(200, json=account_json)
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_get_accounts_snapshot_async(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/accountNumbers",
+        json=get_mock_response()["account_numbers"],
+    )
+    httpx_mock.add_callback(account_response, url=account_url, is_reusable=True)
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    unknown_account = AccountNumberWithHashID(accountNumber="555", hashValue="hash3")
+    snapshot = await cschwab_client.get_accounts_snapshot_async(
+        ["987654321", "123456789", unknown_account], max_concurrency=2
+    )
+    assert list(snapshot.entries.keys()) == ["987654321", "123456789", "555"]
+    assert [account.accountNumber for account in snapshot.accounts] == [
+        "987654321",
+        "123456789",
+    ]
+    assert [entry.account_number.hashValue for entry in snapshot.failed] == ["hash3"]
+    first_entry = snapshot.entries["123456789"]
+    assert snapshot.started_at <= first_entry.fetched_at <= snapshot.completed_at
+    assert first_entry.positions_fetched_at == first_entry.fetched_at
+    assert len(snapshot.get("123456789").positions) == 1
+
+    refreshed = await cschwab_client.get_accounts_snapshot_async(
+        ["123456789", "987654321"], balances_only=["123456789"], previous=snapshot
+    )
+    requests = httpx_mock.get_requests(url=account_url)
+    assert [str(request.url).rsplit("/", 1)[-1] for request in requests[-2:]] in (
+        ["hash1", "hash2?fields=positions"],
+        ["hash2?fields=positions", "hash1"],
+    )
+    carried_over = refreshed.entries["123456789"]
+    assert carried_over.fetched_at > first_entry.fetched_at
+    assert carried_over.positions_fetched_at == first_entry.positions_fetched_at
+    assert len(carried_over.account.positions) == 1
+
+    balances = await cschwab_client.get_accounts_snapshot_async(
+        ["hash2"], include_positions=False
+    )
+    assert balances.get("987654321").positions == []
+    assert balances.entries["987654321"].positions_fetched_at is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_accounts_snapshot_records_unlinked_accounts(
+    httpx_mock: HTTPXMock,
+) -> None:
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/accountNumbers",
+        json=get_mock_response()["account_numbers"],
+        is_reusable=True,
+    )
+    httpx_mock.add_callback(account_response, url=account_url, is_reusable=True)
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    snapshot = await cschwab_client.get_accounts_snapshot_async(
+        ["111", "123456789", "hash1", "hash2"],
+        balances_only=["222", "hash2"],
+    )
+    assert list(snapshot.entries.keys()) == ["111", "123456789", "987654321"]
+    failed_entry = snapshot.entries["111"]
+    assert isinstance(failed_entry.error, AccountNotFoundError)
+    assert failed_entry.account_number.hashValue == ""
+    assert snapshot.failed == [failed_entry]
+    assert snapshot.entries["123456789"].positions_fetched_at is not None
+    assert snapshot.entries["987654321"].positions_fetched_at is None
@@ -0,0 +1,71 @@
+import copy
+import json
+import pytest
+from pathlib import Path
+from cschwabpy.models import (
+    CompactOptionChain,
+    OptionChain,
+    OptionChainDeltaTracker,
+    diff_option_chains,
+)
+
+chain_file_path = Path(Path(__file__).resolve().parent, "data", "AAPL_options.json")
+expiration_key = "2024-09-06:3"
+
+
+def load_chain_json():
+    return json.loads(chain_file_path.read_text())
+
+
+def next_snapshot_json():
+    """AAPL mock a minute later: two re-quoted calls, one removed put and one new call strike."""
+    chain_json = load_chain_json()
+    calls = chain_json["callExpDateMap"][expiration_key]
+    calls["220.0"][0]["bid"] += 0.05
+    calls["220.0"][0]["totalVolume"] += 10
+    calls["225.0"][0]["openInterest"] = None
+    calls["230.0"][0]["delta"] = 0.5  # not a quote field
+    del chain_json["putExpDateMap"][expiration_key]["290.0"]
+    new_call = copy.deepcopy(calls["290.0"][0])
+    new_call["symbol"] = "AAPL  240906C00295000"
+    new_call["strikePrice"] = 295.0
+    calls["295.0"] = [new_call]
+    return chain_json
+
+
+def test_diff_option_chains() -> None:
+    previous = OptionChain(**load_chain_json())
+    current = OptionChain(**next_snapshot_json())
+    delta = diff_option_chains(previous, current)
+
+    assert [contract.symbol for contract in delta.added] == ["AAPL  240906C00295000"]
+    assert [contract.symbol for contract in delta.removed] == ["AAPL  240906P00290000"]
+    changes = {change.symbol: change for change in delta.changed}
+    assert set(changes.keys()) == {"AAPL  240906C00220000", "AAPL  240906C00225000"}
+    assert changes["AAPL  240906C00220000"].fields == ("bid", "totalVolume")
+    old_bid, new_bid = changes["AAPL  240906C00220000"].values("bid")
+    assert new_bid == pytest.approx(old_bid + 0.05)
+    assert changes["AAPL  240906C00225000"].fields == ("openInterest",)
+    assert changes["AAPL  240906C00225000"].contract.openInterest is None
+    assert len(delta) == 4 and len(delta.changed_symbols) == 4
+
+    with_delta = diff_option_chains(previous, current, fields=("delta",))
+    assert [change.symbol for change in with_delta.changed] == ["AAPL  240906C00230000"]
+    assert not diff_option_chains(previous, CompactOptionChain.from_chain(previous))
+    with pytest.raises(ValueError):
+        diff_option_chains(previous, current, fields=("symbol",))
+
+
+def test_option_chain_delta_tracker() -> None:
+    tracker = OptionChainDeltaTracker()
+    first = tracker.update(OptionChain(**load_chain_json()))
+    assert len(first.added) == 80 and not first.removed and not first.changed
+    assert tracker.previous("aapl") is not None
+
+    second = tracker.update(OptionChain(**next_snapshot_json()))
+    assert len(second) == 4
+    assert not tracker.update(OptionChain(**next_snapshot_json()))
+
+    tracker.reset("AAPL")
+    assert tracker.previous("AAPL") is None
+    assert len(tracker.update(OptionChain(**load_chain_json())).added) == 80
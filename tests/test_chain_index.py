@@ -0,0 +1,131 @@
+import json
+import numpy as np
+import pytest
+from pathlib import Path
+from cschwabpy.models import (
+    IndexedOptionChain,
+    OptionChain,
+    merge_option_chains,
+)
+
+chain_file_path = Path(Path(__file__).resolve().parent, "data", "AAPL_options.json")
+expiration = "2024-09-06"
+next_expiration = "2024-09-13"
+
+
+def load_chain() -> OptionChain:
+    return OptionChain(**json.loads(chain_file_path.read_text()))
+
+
+def two_expiration_chain() -> OptionChain:
+    """AAPL mock plus a copy of it a week later without the 150-195 puts."""
+    chain_json = json.loads(chain_file_path.read_text())
+    later_json = json.loads(
+        chain_file_path.read_text().replace(expiration, next_expiration)
+    )
+    later_json["callExpDateMap"] = {
+        f"{next_expiration}:10": later_json["callExpDateMap"][f"{next_expiration}:3"]
+    }
+    later_puts = later_json["putExpDateMap"][f"{next_expiration}:3"]
+    later_json["putExpDateMap"] = {
+        f"{next_expiration}:10": {
+            strike: contracts
+            for strike, contracts in later_puts.items()
+            if float(strike) >= 200
+        }
+    }
+    return merge_option_chains([OptionChain(**later_json), OptionChain(**chain_json)])
+
+
+def test_strike_lookups() -> None:
+    chain = load_chain()
+    index = IndexedOptionChain.from_chain(chain)
+    assert index.expirations == [expiration]
+    calls = chain.callExpDateMap[f"{expiration}:3"]
+    strikes = index.strikes(expiration)
+    assert list(strikes) == sorted(float(strike) for strike in calls)
+    assert np.all(np.diff(strikes) > 0)
+
+    assert index.get(expiration, 202.5) == calls["202.5"][0]
+    assert index.get(f"{expiration}:3", 202.5, "PUT") == (
+        chain.putExpDateMap[f"{expiration}:3"]["202.5"][0]
+    )
+    assert index.get(expiration, 203.0) is None
+
+    for target in (0.0, 149.0, 201.0, 201.25, 203.9, 221.3, 287.5, 400.0):
+        nearest = index.nearest_strike(expiration, target)
+        assert abs(nearest.strikePrice - target) == min(
+            abs(strike - target) for strike in strikes
+        )
+    assert index.nearest_strike(expiration, 201.25).strikePrice == 200.0
+
+    between = index.strikes_between(expiration, 200, 210, "PUT")
+    assert [contract.strikePrice for contract in between] == [
+        200.0,
+        202.5,
+        205.0,
+        207.5,
+        210.0,
+    ]
+    assert all(contract.putCall == "PUT" for contract in between)
+    with pytest.raises(KeyError):
+        index.strikes("2030-01-18")
+
+
+def test_exact_strike_lookup_on_high_strikes() -> None:
+    chain_json = json.loads(chain_file_path.read_text())
+    call = chain_json["callExpDateMap"][f"{expiration}:3"]["290.0"][0]
+    call["strikePrice"] = 10000.0
+    index = IndexedOptionChain.from_chain(OptionChain(**chain_json))
+    assert index.get(expiration, 10000.0).symbol == call["symbol"]
+    # within the default relative tolerance of np.isclose, but not the listed strike
+    assert index.get(expiration, 10000.1) is None
+    assert index.get(expiration, 9999.9) is None
+
+
+def test_delta_lookups() -> None:
+    chain = load_chain()
+    index = IndexedOptionChain.from_chain(chain)
+    all_calls = [
+        contracts[0] for contracts in chain.callExpDateMap[f"{expiration}:3"].values()
+    ]
+    for target in (0.25, 0.5, 0.05, 0.99):
+        nearest = index.nearest_delta(expiration, target)
+        assert abs(nearest.delta - target) == min(
+            abs(call.delta - target) for call in all_calls
+        )
+    assert index.nearest_delta(expiration, 0.25).strikePrice == 227.5
+    assert index.nearest_delta(expiration, -0.25, "PUT").strikePrice == 217.5
+
+    bucket = index.deltas_between(expiration, 0.2, 0.4)
+    assert sorted(contract.delta for contract in bucket) == sorted(
+        call.delta for call in all_calls if 0.2 <= call.delta <= 0.4
+    )
+    assert [contract.delta for contract in bucket] == [0.216, 0.361]
+
+
+def test_call_put_alignment() -> None:
+    index = IndexedOptionChain.from_chain(two_expiration_chain())
+    assert index.expirations == [expiration, next_expiration]
+
+    aligned = index.aligned_by_strike(next_expiration)
+    assert len(aligned) == 40
+    assert list(aligned.strikes) == list(index.strikes(next_expiration))
+    missing_puts = aligned.put_rows < 0
+    assert list(aligned.strikes[missing_puts]) == [
+        150.0,
+        155.0,
+        160.0,
+        165.0,
+        170.0,
+        175.0,
+        180.0,
+        185.0,
+        190.0,
+        195.0,
+    ]
+    assert (aligned.call_rows >= 0).all()
+    for strike, call, put in aligned.pairs():
+        assert call.strikePrice == strike
+        assert call.expirationDate.startswith(next_expiration)
+        assert put is None or put.strikePrice == strike
@@ -0,0 +1,89 @@
+import json
+import numpy as np
+import pytest
+import tracemalloc
+from pathlib import Path
+from cschwabpy.models import (
+    CompactOptionChain,
+    CompactOptionContract,
+    OptionChain,
+    OptionContractColumns,
+)
+
+chain_file_path = Path(Path(__file__).resolve().parent, "data", "AAPL_options.json")
+
+
+def load_chain() -> OptionChain:
+    return OptionChain(**json.loads(chain_file_path.read_text()))
+
+
+def test_compact_chain_round_trip() -> None:
+    chain = load_chain()
+    compact = CompactOptionChain.from_chain(chain)
+    assert len(compact) == sum(
+        len(contracts)
+        for exp_date_map in (chain.callExpDateMap, chain.putExpDateMap)
+        for strikes in exp_date_map.values()
+        for contracts in strikes.values()
+    )
+    assert compact.to_option_chain() == chain
+    assert compact.symbol == chain.symbol
+    assert compact.underlying == chain.underlying
+    assert list(compact.putExpDateMap.keys()) == list(chain.putExpDateMap.keys())
+
+    expiration = next(iter(chain.callExpDateMap))
+    strike = next(iter(chain.callExpDateMap[expiration]))
+    contract = chain.callExpDateMap[expiration][strike][0]
+    compact_contract = compact.callExpDateMap[expiration][strike][0]
+    assert compact_contract == contract
+    assert compact_contract.symbol == contract.symbol
+    assert compact_contract.bid == contract.bid
+    assert compact_contract.totalVolume == contract.totalVolume
+    assert isinstance(compact_contract.totalVolume, int)
+    assert compact_contract.isIndex is None and contract.isIndex is None
+    assert compact_contract.to_dataframe_row() == contract.to_dataframe_row()
+
+
+def test_compact_contracts_are_read_only_columns() -> None:
+    chain = load_chain()
+    compact = CompactOptionChain.from_chain(chain)
+    contract = compact.contracts[0]
+    with pytest.raises(AttributeError):
+        contract.bid = 1.0
+    with pytest.raises(AttributeError):
+        contract.not_a_field
+    with pytest.raises(ValueError):
+        compact.contracts.column("bid")[0] = 1.0
+
+    strikes = compact.contracts.column("strikePrice")
+    assert strikes.dtype == np.float64
+    assert strikes[0] == contract.strikePrice
+    assert not compact.contracts.null_mask("strikePrice").any()
+    assert compact.contracts.null_mask("isIndex").all()
+
+    calls = compact.contracts.take(compact.contracts.column("putCall") == "CALL")
+    assert len(calls) == sum(
+        len(contracts)
+        for strikes in chain.callExpDateMap.values()
+        for contracts in strikes.values()
+    )
+    assert all(isinstance(call, CompactOptionContract) for call in calls)
+    assert OptionContractColumns.from_contracts(list(calls)).to_contracts() == [
+        call.to_option_contract() for call in calls
+    ]
+
+
+def test_compact_chain_memory() -> None:
+    tracemalloc.start()
+    try:
+        chain = load_chain()
+        chain_size = tracemalloc.get_traced_memory()[0]
+        compact = CompactOptionChain.from_chain(chain)
+        compact_size = tracemalloc.get_traced_memory()[0] - chain_size
+    finally:
+        tracemalloc.stop()
+    assert compact_size * 5 < chain_size
+
+    # strings are interned, so snapshots share them
+    other = CompactOptionChain.from_chain(load_chain())
+    assert other.contracts.column("symbol")[0] is compact.contracts.column("symbol")[0]
@@ -0,0 +1,212 @@
+import asyncio
+import httpx
+import re
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.concurrency import iter_bounded
+from cschwabpy.models import OptionExpirationChainResponse, expiration_windows
+from cschwabpy.models.token import AsyncLocalTokenStore
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+
+
+@pytest.mark.asyncio
+async def test_iter_bounded_limits_concurrency() -> None:
+    in_flight = 0
+    max_in_flight = 0
+
+    async def fetch(item: int) -> int:
+        nonlocal in_flight, max_in_flight
+        in_flight += 1
+        max_in_flight = max(max_in_flight, in_flight)
+        await asyncio.sleep(0.001 * (item % 3))
+        in_flight -= 1
+        return item * 2
+
+    results = {}
+    async for item, result in iter_bounded(range(20), fetch, max_concurrency=3):
+        results[item] = result
+
+    assert results == {i: i * 2 for i in range(20)}
+    assert max_in_flight == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_get_orders_by_ids(httpx_mock: HTTPXMock) -> None:
+    single_order_json = get_mock_response()["single_order"]
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/hash1/orders/404",
+        status_code=404,
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url=re.compile(r".*/orders/(?!404)\d+"),
+        json=single_order_json,
+        is_reusable=True,
+    )
+    account = AccountNumberWithHashID(accountNumber="123", hashValue="hash1")
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    orders = await cschwab_client.get_orders_by_ids_async(
+        account, [1, 2, 404, 3, 2], max_concurrency=2, requests_per_second=1000
+    )
+    assert list(orders.keys()) == [1, 2, 404, 3]
+    assert orders[404] is None
+    assert orders[1].orderId == 456
+    # the batch shares one pooled connection set which is closed afterwards
+    assert cschwab_client.pool_stats.clients_created == 1
+    assert not cschwab_client.is_pooled
+
+    streamed = {}
+    async for order_id, order in cschwab_client.iter_orders_by_ids_async(
+        account, [7, 404]
+    ):
+        streamed[order_id] = order
+    assert streamed[404] is None
+    assert streamed[7].orderId == 456
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_concurrent_batches_share_temporary_pool(httpx_mock: HTTPXMock) -> None:
+    single_order_json = get_mock_response()["single_order"]
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/hash1/orders/5",
+        status_code=503,
+        headers={"Retry-After": "0.2"},
+    )
+    httpx_mock.add_response(
+        url=re.compile(r".*/orders/\d+"), json=single_order_json, is_reusable=True
+    )
+    account = AccountNumberWithHashID(accountNumber="123", hashValue="hash1")
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    # the first batch finishes while the second waits to retry order 5 on the shared client
+    first, second = await asyncio.gather(
+        cschwab_client.get_orders_by_ids_async(account, [1]),
+        cschwab_client.get_orders_by_ids_async(account, [5]),
+    )
+    assert first[1].orderId == 456
+    assert second[5].orderId == 456
+    assert cschwab_client.pool_stats.clients_created == 1
+    assert cschwab_client.pool_stats.retries == 1
+    assert not cschwab_client.is_pooled
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_download_option_chains(httpx_mock: HTTPXMock) -> None:
+    chain_json = get_mock_response()["option_chain_resp"]
+    httpx_mock.add_response(
+        url=re.compile(r".*/chains\?symbol=BAD.*"), status_code=400, is_reusable=True
+    )
+    httpx_mock.add_response(
+        url=re.compile(r".*/chains\?symbol=(?!BAD).*"),
+        json=chain_json,
+        is_reusable=True,
+    )
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    symbols = ["$SPX", "BAD", "QQQ", "SPY"]
+    results = {}
+    async for result in cschwab_client.download_option_chains_async(
+        symbols, "2024-07-01", "2024-07-01", max_concurrency=2
+    ):
+        results[result.symbol] = result
+
+    assert set(results.keys()) == set(symbols)
+    assert not results["BAD"].ok
+    assert results["BAD"].chain is None
+    assert results["SPY"].ok
+    assert results["SPY"].chain.status == "SUCCESS"
+    assert cschwab_client.pool_stats.clients_created == 1
+
+    async for result in cschwab_client.download_option_chains_async(
+        ["QQQ"], "2024-07-01", "2024-07-01", as_frames=True
+    ):
+        assert result.ok
+        assert len(result.frames) == len(chain_json["callExpDateMap"])
+
+
+def test_expiration_windows() -> None:
+    expirations = OptionExpirationChainResponse(
+        **get_mock_response()["option_expirations_list"]
+    ).expirationList
+    assert expiration_windows(expirations, "2022-01-10", "2022-02-05") == [
+        ("2022-01-14", "2022-01-14"),
+        ("2022-01-21", "2022-01-21"),
+        ("2022-01-28", "2022-01-28"),
+        ("2022-02-04", "2022-02-04"),
+    ]
+    assert expiration_windows(expirations, "2022-01-01", "2022-02-05", 3) == [
+        ("2022-01-07", "2022-01-21"),
+        ("2022-01-28", "2022-02-04"),
+    ]
+    assert expiration_windows(expirations, "2023-01-01", "2023-02-01") == []
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_download_option_chain_chunked(httpx_mock: HTTPXMock) -> None:
+    chain_json = get_mock_response()["option_chain_resp"]
+
+    def chain_for_window(request: httpx.Request) -> httpx.Response:
+        from_date = request.url.params["fromDate"]
+        window_chain = {
+            **chain_json,
+            "callExpDateMap": {
+                f"{from_date}:1": strikes
+                for strikes in chain_json["callExpDateMap"].values()
+            },
+            "putExpDateMap": {
+                f"{from_date}:1": strikes
+                for strikes in chain_json["putExpDateMap"].values()
+            },
+        }
+        return httpx.Response(200, json=window_chain)
+
+    httpx_mock.add_response(
+        url=re.compile(r".*/expirationchain.*"),
+        json=get_mock_response()["option_expirations_list"],
+    )
+    httpx_mock.add_callback(
+        chain_for_window, url=re.compile(r".*/chains.*"), is_reusable=True
+    )
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    merged_chain = await cschwab_client.download_option_chain_chunked_async(
+        "$SPX", "2022-01-01", "2022-01-31", max_concurrency=2
+    )
+    assert list(merged_chain.callExpDateMap.keys()) == [
+        "2022-01-07:1",
+        "2022-01-14:1",
+        "2022-01-21:1",
+        "2022-01-28:1",
+    ]
+    assert list(merged_chain.putExpDateMap.keys()) == list(
+        merged_chain.callExpDateMap.keys()
+    )
+    assert merged_chain.numberOfContracts == 4 * chain_json["numberOfContracts"]
+    assert len(httpx_mock.get_requests(url=re.compile(r".*/chains.*"))) == 4
@@ -0,0 +1,108 @@
+import pytest
+from datetime import date
+from pytest_httpx import HTTPXMock
+from cschwabpy.expiration_cache import OptionExpirationCache
+from cschwabpy.models import ExpirationType, OptionExpirationChainResponse
+from cschwabpy.models.token import AsyncLocalTokenStore, LocalTokenStore
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+as_of = date(2022, 1, 10)
+
+
+def mock_expirations():
+    return OptionExpirationChainResponse(
+        **get_mock_response()["option_expirations_list"]
+    ).expirationList
+
+
+def test_expiration_schedule_lookups() -> None:
+    cache = OptionExpirationCache()
+    schedule = cache.put("spy", reversed(mock_expirations()))
+    assert cache.get("SPY") is schedule
+    assert schedule.dates == sorted(schedule.dates)
+
+    next_two = schedule.next(2, as_of=as_of)
+    assert [exp.expirationDate for exp in next_two] == ["2022-01-14", "2022-01-21"]
+
+    standard_monthlies = schedule.by_type(ExpirationType.S, as_of=as_of)
+    assert len(standard_monthlies) > 0
+    assert all(exp.expirationType == "S" for exp in standard_monthlies)
+    assert "2022-01-21" in [exp.expirationDate for exp in standard_monthlies]
+
+    within_month = schedule.by_days_to_expiration(5, 30, as_of=as_of)
+    assert [exp.expirationDate for exp in within_month] == [
+        "2022-01-21",
+        "2022-01-28",
+        "2022-02-04",
+    ]
+
+
+def test_expiration_cache_ttl() -> None:
+    cache = OptionExpirationCache(ttl_seconds=0)
+    cache.put("SPY", mock_expirations())
+    assert cache.get("SPY") is None
+    assert cache.missing(["spy", "SPY", "QQQ"]) == ["SPY", "QQQ"]
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_warm_option_expirations(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=get_mock_response()["option_expirations_list"], is_reusable=True
+    )
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    schedules = await cschwab_client.warm_option_expirations_async(
+        ["SPY", "qqq", "IWM", "spy"], max_concurrency=2
+    )
+    assert list(schedules.keys()) == ["SPY", "QQQ", "IWM"]
+    assert len(httpx_mock.get_requests()) == 3
+
+    await cschwab_client.warm_option_expirations_async(["SPY", "QQQ"])
+    expirations = await cschwab_client.get_option_expirations_async("IWM")
+    assert expirations[0].expirationDate == "2022-01-07"
+    assert len(httpx_mock.get_requests()) == 3
+
+    await cschwab_client.get_option_expirations_async("IWM", use_cache=False)
+    assert len(httpx_mock.get_requests()) == 4
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_expiration_schedule_errors_raise(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=401, json={"errors": ["unauthorized"]})
+    httpx_mock.add_response(status_code=401, json={"errors": ["unauthorized"]})
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    with pytest.raises(Exception, match="Failed to get option expirations"):
+        await cschwab_client.get_option_expiration_schedule_async("SPY")
+    assert cschwab_client.expiration_cache.get("SPY") is None
+
+    # a failed symbol is left out of the warmed schedules
+    schedules = await cschwab_client.warm_option_expirations_async(["SPY"])
+    assert schedules == {}
+
+    sync_client = SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+    )
+    httpx_mock.add_response(status_code=403, text="forbidden")
+    with pytest.raises(Exception, match="Failed to get option expirations"):
+        sync_client.get_option_expiration_schedule("SPY")
+    assert sync_client.expiration_cache.get("SPY") is None
@@ -0,0 +1,39 @@
+import subprocess
+import sys
+
+HEAVY_MODULES = ("pandas", "numpy", "dateutil", "aiofiles")
+IMPORT_TIME_BUDGET_SECONDS = 2.0
+
+
+def run_in_fresh_interpreter(code: str) -> str:
+    return subprocess.run(
+        [sys.executable, "-c", code], capture_output=True, text=True, check=True
+    ).stdout.strip()
+
+
+def test_client_import_skips_heavy_dependencies() -> None:
+    loaded = run_in_fresh_interpreter(
+        "import sys\n"
+        "import cschwabpy.SchwabAsyncClient, cschwabpy.SchwabClient\n"
+        f"print(','.join(m for m in {HEAVY_MODULES!r} if m in sys.modules))"
+    )
+    assert loaded == ""
+
+
+def test_dataframe_helpers_load_on_first_use() -> None:
+    loaded = run_in_fresh_interpreter(
+        "import sys\n"
+        "from cschwabpy.models import option_chain_json_to_dataframe_pairs\n"
+        "print('pandas' in sys.modules)"
+    )
+    assert loaded == "True"
+
+
+def test_client_import_time_budget() -> None:
+    elapsed = run_in_fresh_interpreter(
+        "import time\n"
+        "started = time.perf_counter()\n"
+        "import cschwabpy.SchwabAsyncClient\n"
+        "print(time.perf_counter() - started)"
+    )
+    assert float(elapsed) < IMPORT_TIME_BUDGET_SECONDS
@@ -0,0 +1,103 @@
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.instrument_cache import (
+    InstrumentCache,
+    INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST,
+)
+from cschwabpy.models.token import AsyncLocalTokenStore, LocalTokenStore
+from cschwabpy.models.trade_models import AccountInstrument, InstrumentProjection
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+
+from .test_token import mock_tokens
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+
+
+def mock_instrument(symbol: str, instrument_id: int = 0) -> AccountInstrument:
+    return AccountInstrument(
+        assetType="EQUITY",
+        symbol=symbol,
+        cusip=f"CUSIP{symbol}",
+        instrumentId=instrument_id,
+        description=f"{symbol} Inc",
+    )
+
+
+def instruments_response(request: httpx.Request) -> httpx.Response:
+    symbols = request.url.params["symbol"].split(",")
+    instruments = [
+        mock_instrument(symbol).to_json() for symbol in symbols if symbol != "NOPE"
+    ]
+    return httpx.Response(status_code=200, json={"instruments": instruments})
+
+
+def test_instrument_cache_indexes_and_eviction() -> None:
+    cache = InstrumentCache(max_size=2)
+    cache.put(mock_instrument("AAPL", 1))
+    cache.put(mock_instrument("MSFT", 2))
+    assert cache.get("aapl").symbol == "AAPL"  # AAPL becomes most recently used
+    cache.put(mock_instrument("IBM", 3))
+
+    assert len(cache) == 2
+    assert cache.get("MSFT") is None
+    assert cache.get_by_cusip("CUSIPMSFT") is None
+    assert cache.get_by_cusip("CUSIPAAPL").symbol == "AAPL"
+    assert cache.get_by_instrument_id(3).symbol == "IBM"
+    assert cache.get("IBM", InstrumentProjection.SymbolSearch) is None
+    assert cache.missing(["ibm", "MSFT", "msft"]) == ["MSFT"]
+
+    expired_cache = InstrumentCache(ttl_seconds=0)
+    expired_cache.put(mock_instrument("AAPL", 1))
+    assert expired_cache.get("AAPL") is None
+    assert expired_cache.get_by_instrument_id(1) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_get_instruments_by_symbols_async(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_callback(instruments_response, is_reusable=True)
+    symbols = [f"S{i}" for i in range(2 * INSTRUMENTS_MAX_SYMBOLS_PER_REQUEST + 10)]
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    instruments = await cschwab_client.get_instruments_by_symbols_async(
+        symbols + ["NOPE"], max_concurrency=2
+    )
+    assert list(instruments.keys()) == symbols
+    assert len(httpx_mock.get_requests()) == 3
+
+    warm = await cschwab_client.get_instruments_by_symbols_async(
+        [symbol.lower() for symbol in symbols[:5]]
+    )
+    assert list(warm.keys()) == symbols[:5]
+    assert len(httpx_mock.get_requests()) == 3
+    assert cschwab_client.instrument_cache.get_by_cusip("CUSIPS7").symbol == "S7"
+
+    with pytest.raises(ValueError):
+        await cschwab_client.get_instruments_by_symbols_async(
+            ["A"], projection=InstrumentProjection.DescSearch
+        )
+
+
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+def test_get_instruments_by_symbols(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_callback(instruments_response, is_reusable=True)
+    cschwab_client = SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+    )
+    instruments = cschwab_client.get_instruments_by_symbols(["AAPL", "MSFT", "NOPE"])
+    assert list(instruments.keys()) == ["AAPL", "MSFT"]
+    request = httpx_mock.get_request()
+    assert request.url.params["symbol"] == "AAPL,MSFT,NOPE"
+
+    cschwab_client.get_instruments_by_symbols(["AAPL", "IBM"])
+    assert httpx_mock.get_requests()[-1].url.params["symbol"] == "IBM"
@@ -0,0 +1,91 @@
+import json
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.json_codec import (
+    JSON_CODECS,
+    StdlibJsonCodec,
+    default_json_codec,
+    get_json_codec,
+    set_default_json_codec,
+)
+from cschwabpy.models.token import LocalTokenStore
+from cschwabpy.models.trade_models import Order
+from cschwabpy.SchwabClient import SchwabClient
+
+from .test_models import get_mock_response, mock_account
+from .test_token import mock_tokens
+
+
+def installed_codecs():
+    codecs = []
+    for name in JSON_CODECS:
+        try:
+            codecs.append(get_json_codec(name))
+        except ImportError:
+            continue
+    return codecs
+
+
+class CountingCodec(StdlibJsonCodec):
+    def __init__(self) -> None:
+        self.loads_count = 0
+
+    def loads(self, data):
+        self.loads_count += 1
+        return super().loads(data)
+
+
+def test_codec_selection() -> None:
+    assert get_json_codec("json").name == "json"
+    assert get_json_codec().name in JSON_CODECS
+    with pytest.raises(ValueError):
+        get_json_codec("yaml")
+
+    set_default_json_codec("json")
+    try:
+        assert default_json_codec().name == "json"
+    finally:
+        set_default_json_codec(None)
+    assert default_json_codec() is default_json_codec()
+
+
+@pytest.mark.parametrize("codec", installed_codecs(), ids=lambda codec: codec.name)
+def test_order_payloads_are_codec_independent(codec) -> None:
+    mock_responses = get_mock_response()
+    for key in ("single_order", "filled_order"):
+        order = Order(**mock_responses[key])
+        payload = codec.dumps(order.to_json())
+        # values, not bytes: float formatting differs between codecs and pydantic
+        assert codec.loads(payload) == codec.loads(order.to_json_bytes())
+        assert codec.loads(payload) == order.to_json()
+
+    value = {
+        "symbol": "SPY  240621C00450000",
+        "description": "café",
+        "strikes": [1.5, 1e20, 2.5e-7],
+    }
+    assert codec.loads(codec.dumps(value, pretty=True)) == value
+
+
+def test_client_and_token_store_use_codec(tmp_path, httpx_mock: HTTPXMock) -> None:
+    codec = CountingCodec()
+    token_store = LocalTokenStore(
+        file_path=str(tmp_path / "tokens.json"), json_codec=codec
+    )
+    tokens = mock_tokens()
+    token_store.save_tokens(tokens)
+    assert json.loads((tmp_path / "tokens.json").read_text()) == tokens.to_json()
+    assert token_store.get_tokens() == tokens
+    assert codec.loads_count == 1
+
+    httpx_mock.add_response(json=[mock_account().to_json()])
+    cschwab_client = SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=tokens,
+        json_codec=codec,
+    )
+    account_numbers = cschwab_client.get_account_numbers()
+    assert account_numbers == [mock_account()]
+    assert codec.loads_count == 2
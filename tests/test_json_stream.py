@@ -0,0 +1,128 @@
+import json
+import pytest
+from datetime import datetime, timedelta
+from pathlib import Path
+from pytest_httpx import HTTPXMock, IteratorStream
+from cschwabpy.json_stream import JsonStreamDecoder, iter_json_items
+from cschwabpy.models import OPTION_CHAIN_EXP_DATE_MAP_KEYS, OptionChain
+from cschwabpy.models.token import AsyncLocalTokenStore
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+
+from .test_models import get_mock_response, mock_account
+from .test_token import mock_tokens
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+chain_bytes = Path(
+    Path(__file__).resolve().parent, "data", "AAPL_options.json"
+).read_bytes()
+
+
+def chunked(data: bytes, size: int):
+    return [data[i : i + size] for i in range(0, len(data), size)]
+
+
+def mock_client() -> SchwabAsyncClient:
+    return SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+
+
+def test_decoder_splits_option_chain_by_expiration() -> None:
+    expected = json.loads(chain_bytes)
+    for size in (1, 777, 65536):
+        decoded = {}
+        for path, value in iter_json_items(
+            chunked(chain_bytes, size), split_keys=OPTION_CHAIN_EXP_DATE_MAP_KEYS
+        ):
+            if len(path) == 2:
+                decoded.setdefault(path[0], {})[path[1]] = value
+            else:
+                decoded[path[0]] = value
+        assert decoded == expected
+
+
+def test_decoder_items_across_chunk_boundaries() -> None:
+    document = '[12345, -2.5e-3, "café \\"x\\"", {"a": [1, null]}, true]'
+    for size in (1, 2, 3):
+        items = list(iter_json_items(chunked(document.encode(), size)))
+        assert items == [
+            ((0,), 12345),
+            ((1,), -2.5e-3),
+            ((2,), 'café "x"'),
+            ((3,), {"a": [1, None]}),
+            ((4,), True),
+        ]
+
+    decoder = JsonStreamDecoder()
+    assert decoder.feed(b"[1, 2") == [((0,), 1)]
+    assert decoder.feed(b"3]") == [((1,), 23)]
+    assert decoder.done
+
+
+def test_decoder_rejects_invalid_or_incomplete_documents() -> None:
+    for document in (b'[{"a": 1}', b'{"a" 1}', b"[1] 2", b'{"a": 1,}', b"[tru"):
+        with pytest.raises(json.JSONDecodeError):
+            list(iter_json_items([document]))
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_stream_option_chain_async(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        stream=IteratorStream(chunked(chain_bytes, 4096)), is_reusable=True
+    )
+    cschwab_client = mock_client()
+    expirations = []
+    async for expiration in cschwab_client.stream_option_chain_async(
+        "AAPL", "2024-07-01", "2024-09-01"
+    ):
+        expirations.append(expiration)
+
+    chain = OptionChain(**json.loads(chain_bytes))
+    assert len(expirations) == len(chain.callExpDateMap) + len(chain.putExpDateMap)
+    calls = [exp for exp in expirations if exp.put_call == "CALL"]
+    assert [exp.expiration for exp in calls] == list(chain.callExpDateMap.keys())
+    first = calls[0]
+    assert first.underlying_symbol == "AAPL"
+    assert first.expiration_date == first.expiration.split(":")[0]
+    assert first.days_to_expiration == int(first.expiration.split(":")[1])
+    assert first.contracts == chain.callExpDateMap[first.expiration]
+
+    streamed_chain = await cschwab_client.download_option_chain_async(
+        "AAPL", "2024-07-01", "2024-09-01", streaming=True
+    )
+    assert streamed_chain == chain
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_stream_orders_async(httpx_mock: HTTPXMock) -> None:
+    mock_responses = get_mock_response()
+    orders_json = [
+        mock_responses["single_order"],
+        mock_responses["filled_order"],
+    ]
+    httpx_mock.add_response(
+        stream=IteratorStream(chunked(json.dumps(orders_json).encode(), 100))
+    )
+    cschwab_client = mock_client()
+    to_time = datetime.now()
+    orders = [
+        order
+        async for order in cschwab_client.stream_orders_async(
+            mock_account(), to_time - timedelta(days=1), to_time
+        )
+    ]
+    assert [order.orderId for order in orders] == [
+        order_json["orderId"] for order_json in orders_json
+    ]
+
+    httpx_mock.add_response(status_code=400, json={"message": "bad request"})
+    with pytest.raises(Exception):
+        async for _ in cschwab_client.stream_orders_async(
+            mock_account(), to_time - timedelta(days=1), to_time
+        ):
+            pass
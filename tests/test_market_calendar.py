@@ -0,0 +1,126 @@
+import pytest
+from datetime import date, datetime, timedelta
+from pytest_httpx import HTTPXMock
+from cschwabpy.market_calendar import MarketHoursCache, end_of_day_ts
+from cschwabpy.models import MarketHourInfo, MarketType, us_eastern_timezone
+from cschwabpy.models.token import AsyncLocalTokenStore, LocalTokenStore
+from cschwabpy.retry import RetryPolicy
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+import cschwabpy.util as util
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+market_date = date(2022, 4, 14)
+
+
+def mock_market_hour_info() -> MarketHourInfo:
+    return MarketHourInfo(**get_mock_response()["all_market_resp"])
+
+
+def test_market_hour_info_open_checks() -> None:
+    info = mock_market_hour_info()
+    regular_market = info.equity_regular_market_hours[0]
+    assert regular_market.start_at.tzinfo is not None
+    assert regular_market.open_window()[0].hour == 9
+
+    assert info.is_open_at(datetime(2022, 4, 14, 10, 0))
+    assert not info.is_open_at(datetime(2022, 4, 14, 8, 0))
+    assert info.is_open_at(datetime(2022, 4, 14, 8, 0), include_extended=True)
+    # index options trade until 16:15, equities close at 16:00
+    assert info.is_open_at(datetime(2022, 4, 14, 16, 10), MarketType.Option)
+    assert not info.is_open_at(datetime(2022, 4, 14, 16, 10), MarketType.Equity)
+    after_close_ts = us_eastern_timezone.localize(
+        datetime(2022, 4, 14, 16, 5)
+    ).timestamp()
+    assert not info.is_open_at(after_close_ts * 1000, MarketType.Equity)
+
+    next_open = info.next_open(datetime(2022, 4, 14, 6, 0))
+    assert next_open == us_eastern_timezone.localize(datetime(2022, 4, 14, 9, 30))
+    assert info.next_open(datetime(2022, 4, 14, 12, 0)) is None
+
+
+def test_market_hours_cache_expiry_and_persistence(tmp_path) -> None:
+    cache = MarketHoursCache()
+    cache.put(mock_market_hour_info(), MarketType.Equity, market_date)
+    # hours of a past date are expired as soon as they are cached
+    assert cache.get(MarketType.Equity, market_date) is None
+
+    today = util.now().date()
+    assert end_of_day_ts(today) > util.now_unix_ts()
+    cache_file = tmp_path / "market_hours.json"
+    cache = MarketHoursCache(file_path=str(cache_file))
+    cache.put(mock_market_hour_info(), MarketType.Equity)
+    assert cache.get(MarketType.Equity, today) is not None
+    assert cache.get(MarketType.Option, today) is None
+    assert cache.get(MarketType.Equity, today + timedelta(days=1)) is None
+
+    restored_cache = MarketHoursCache(file_path=str(cache_file))
+    assert len(restored_cache) == 1
+    restored_info = restored_cache.get(MarketType.Equity, today)
+    assert restored_info == mock_market_hour_info()
+
+    restored_cache.invalidate(MarketType.Equity)
+    assert MarketHoursCache(file_path=str(cache_file)).get(MarketType.Equity) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_client_serves_market_hours_from_cache(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=get_mock_response()["all_market_resp"], is_reusable=True
+    )
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    for _ in range(3):
+        market_info = await cschwab_client.get_market_hour_info_async(MarketType.Equity)
+        assert market_info.is_equity_market_open
+    assert len(httpx_mock.get_requests()) == 1
+    assert cschwab_client.market_hours_cache.hits == 2
+
+    await cschwab_client.get_market_hour_info_async(MarketType.Equity, use_cache=False)
+    assert len(httpx_mock.get_requests()) == 2
+
+    # the mocked hours are of 2022-04-14, so no time today is within them
+    assert not await cschwab_client.is_market_open_at_async()
+    assert len(httpx_mock.get_requests()) == 2
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_client_does_not_cache_market_hours_errors(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=500, json={"message": "server error"})
+    httpx_mock.add_response(json=get_mock_response()["all_market_resp"])
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    with pytest.raises(Exception):
+        await cschwab_client.is_market_open_at_async()
+    assert len(cschwab_client.market_hours_cache) == 0
+
+    market_info = await cschwab_client.get_market_hour_info_async()
+    assert market_info.is_equity_market_open
+    assert len(cschwab_client.market_hours_cache) == 1
+    assert len(httpx_mock.get_requests()) == 2
+
+    sync_client = SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=LocalTokenStore(json_file_name="test_tokens.json"),
+        tokens=mock_tokens(),
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    httpx_mock.add_response(status_code=401, json={"message": "unauthorized"})
+    with pytest.raises(Exception):
+        sync_client.get_market_hour_info(MarketType.Equity)
+    assert len(sync_client.market_hours_cache) == 0
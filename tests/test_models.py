@@ -1,12 +1,17 @@
+import copy
 import json
+import math
 import os
 import typing
 import httpx
 import pytest
+import pandas as pd
 from datetime import datetime, timedelta
 from pytest_httpx import HTTPXMock
 from pathlib import Path
+from pydantic import ValidationError
 from cschwabpy.models import (
+    OptionChain_Headers,
     OptionChain,
     OptionContract,
     OptionContractType,
@@ -17,6 +22,7 @@ from cschwabpy.models import (
     MarketType,
     OptionMarket,
     EquityMarket,
+    option_chain_json_to_dataframe_pairs,
 )
 from cschwabpy.models.trade_models import (
     AccountNumberWithHashID,
@@ -166,6 +172,62 @@ def test_option_chain_parsing() -> None:
         print(df.put_df.head(5))
 
 
+def test_option_chain_dataframe_matches_contract_rows() -> None:
+    opt_chain_result = OptionChain(**get_mock_response()["option_chain_resp"])
+    opt_df_pairs = opt_chain_result.to_dataframe_pairs_by_expiration(strip_space=True)
+    call_df = opt_df_pairs[0].call_df
+    contracts = [
+        contract
+        for contracts in list(opt_chain_result.callExpDateMap.values())[0].values()
+        for contract in contracts
+    ]
+    assert list(call_df.columns) == OptionChain_Headers
+    assert len(call_df) == len(contracts)
+    for row_idx, contract in enumerate(contracts):
+        expected_row = [opt_chain_result.underlying.mark] + contract.to_dataframe_row(
+            strip_space=True
+        )
+        actual_row = call_df.iloc[row_idx].tolist()
+        assert actual_row[:8] == expected_row[:8]
+        assert actual_row[8] == expected_row[8]  # bid_date
+        assert actual_row[9] == expected_row[9]  # volume
+        assert actual_row[11:] == expected_row[11:]
+
+
+def test_option_chain_json_fast_path_matches_models() -> None:
+    opt_chain_api_resp = get_mock_response()["option_chain_resp"]
+    aapl_chain_json = get_mock_response("AAPL_options.json")
+    for chain_json in (opt_chain_api_resp, aapl_chain_json):
+        for use_compression in (False, True):
+            expected_pairs = OptionChain(**chain_json).to_dataframe_pairs_by_expiration(
+                use_compression=use_compression
+            )
+            fast_pairs = option_chain_json_to_dataframe_pairs(
+                chain_json, use_compression=use_compression, strict=True
+            )
+            assert [pair.expiration for pair in fast_pairs] == [
+                pair.expiration for pair in expected_pairs
+            ]
+            for fast_pair, expected_pair in zip(fast_pairs, expected_pairs):
+                assert fast_pair.underlying_symbol == expected_pair.underlying_symbol
+                pd.testing.assert_frame_equal(
+                    fast_pair.call_df.drop(columns=["updated_at"]),
+                    expected_pair.call_df.drop(columns=["updated_at"]),
+                )
+                pd.testing.assert_frame_equal(
+                    fast_pair.put_df.drop(columns=["updated_at"]),
+                    expected_pair.put_df.drop(columns=["updated_at"]),
+                )
+
+    broken_chain_json = copy.deepcopy(opt_chain_api_resp)
+    for strike_map in broken_chain_json["callExpDateMap"].values():
+        for contracts in strike_map.values():
+            del contracts[0]["symbol"]
+    option_chain_json_to_dataframe_pairs(broken_chain_json, strict=False)
+    with pytest.raises(ValidationError):
+        option_chain_json_to_dataframe_pairs(broken_chain_json, strict=True)
+
+
 def test_parsing_securities_account():
     json_mock = get_mock_response()["securities_account"]
     accounts: typing.List[SecuritiesAccount] = []
@@ -324,6 +386,13 @@ async def test_place_order(httpx_mock: HTTPXMock):
         )
         assert new_order_id2 == order_id
 
+    for request in httpx_mock.get_requests():
+        assert json.loads(request.content) == opt_order1.to_json()
+    assert (
+        opt_order1.to_json_bytes()
+        == opt_order1.model_dump_json(by_alias=True, exclude_none=True).encode()
+    )
+
 
 @pytest.mark.asyncio
 @pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
@@ -537,6 +606,13 @@ async def test_download_option_chain(httpx_mock: HTTPXMock):
         assert opt_chain_result is not None
         assert opt_chain_result.status == "SUCCESS"
 
+        opt_frame_pairs = await cschwab_client.download_option_chain_frame_async(
+            underlying_symbol=symbol, from_date="2025-01-03", to_date="2025-01-03"
+        )
+        assert len(opt_frame_pairs) == len(opt_chain_result.callExpDateMap)
+        assert opt_frame_pairs[0].underlying_symbol == symbol
+        assert len(opt_frame_pairs[0].call_df) > 0
+
         opt_df_pairs = opt_chain_result.to_dataframe_pairs_by_expiration(
             use_compression=True
         )
@@ -564,6 +640,11 @@ async def test_download_option_chain(httpx_mock: HTTPXMock):
         assert opt_chain_result2 is not None
         assert opt_chain_result2.status == "SUCCESS"
 
+        opt_frame_pairs2 = cschwab_client2.download_option_chain_frame(
+            underlying_symbol=symbol, from_date="2025-01-03", to_date="2025-01-03"
+        )
+        assert len(opt_frame_pairs2) == len(opt_chain_result2.callExpDateMap)
+
         opt_df_pairs = opt_chain_result2.to_dataframe_pairs_by_expiration(
             use_compression=True
         )
@@ -683,3 +764,22 @@ async def test_get_account_numbers(httpx_mock: HTTPXMock):
         assert account_numbers2[0].hashValue == "hash1"
         assert account_numbers2[1].accountNumber == "987654321"
         assert account_numbers2[1].hashValue == "hash2"
+
+
+def test_to_json_semantics() -> None:
+    market_info = MarketHourInfo(**get_mock_response()["all_market_resp"])
+    market_json = market_info.to_json()
+    assert market_json["equity"]["EQ"]["date"] == "2022-04-14"
+    assert market_json["equity"]["EQ"]["marketType"] == "EQUITY"
+    assert "exchange" not in market_json["equity"]["EQ"]
+    assert "exchange" in market_info.to_json(drop_null_value=False)["equity"]["EQ"]
+    assert MarketHourInfo(**json.loads(market_info.to_json_bytes())) == market_info
+
+    chain_json = copy.deepcopy(get_mock_response("AAPL_options.json"))
+    first_contract = next(
+        iter(next(iter(chain_json["callExpDateMap"].values())).values())
+    )[0]
+    first_contract["volatility"] = "NaN"
+    contract = OptionContract(**first_contract)
+    assert math.isnan(contract.to_json()["volatility"])
+    assert b'"volatility":NaN' in contract.to_json_bytes()
@@ -0,0 +1,149 @@
+import copy
+import httpx
+import pytest
+import re
+from datetime import datetime, timedelta
+from pytest_httpx import HTTPXMock
+from cschwabpy.models.token import AsyncLocalTokenStore
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from cschwabpy.order_sync import OrderChangeType, OrderSync
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+import cschwabpy.util as util
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+account = AccountNumberWithHashID(accountNumber="123456789", hashValue="hash1")
+sync_time = util.eastern_tz.localize(datetime(2024, 6, 25, 12, 0, 0))
+orders_url = re.compile(r".*/accounts/hash1/orders\?.*")
+order_by_id_url = re.compile(r".*/accounts/hash1/orders/(\d+)$")
+
+
+class MockOrderBook(object):
+    """Serves GET orders (newest first, capped at maxResults) and GET order by ID from an in-memory list."""
+
+    def __init__(self) -> None:
+        self.orders = {}
+
+    def add(self, order_id: int, entered: datetime, status: str = "FILLED") -> dict:
+        order_json = copy.deepcopy(get_mock_response()["filled_order"])
+        order_json.update(
+            orderId=order_id,
+            status=status,
+            filledQuantity=1 if status == "FILLED" else 0,
+            enteredTime=util.to_iso8601_str(entered),
+        )
+        self.orders[order_id] = order_json
+        return order_json
+
+    def list_orders(self, request: httpx.Request) -> httpx.Response:
+        params = request.url.params
+        matched = sorted(
+            (
+                order_json
+                for order_json in self.orders.values()
+                if params["fromEnteredTime"]
+                <= order_json["enteredTime"]
+                <= params["toEnteredTime"]
+            ),
+            key=lambda order_json: order_json["enteredTime"],
+            reverse=True,
+        )
+        return httpx.Response(200, json=matched[: int(params["maxResults"])])
+
+    def get_order(self, request: httpx.Request) -> httpx.Response:
+        order_id = int(order_by_id_url.match(str(request.url)).group(1))
+        if order_id not in self.orders:
+            return httpx.Response(404)
+        return httpx.Response(200, json=self.orders[order_id])
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_order_sync_emits_changes_from_delta_windows(
+    httpx_mock: HTTPXMock,
+) -> None:
+    book = MockOrderBook()
+    httpx_mock.add_callback(book.list_orders, url=orders_url, is_reusable=True)
+    httpx_mock.add_callback(book.get_order, url=order_by_id_url, is_reusable=True)
+    for order_id in range(1, 6):
+        book.add(order_id, sync_time - timedelta(days=order_id))
+    book.add(6, sync_time - timedelta(days=3, hours=1), status="WORKING")
+
+    events = []
+    order_sync = OrderSync(
+        SchwabAsyncClient(
+            app_client_id="fake_id",
+            app_secret="fake_secret",
+            token_store=async_token_store,
+            tokens=mock_tokens(),
+        ),
+        page_size=2,
+        on_change=events.append,
+    )
+    changes = await order_sync.sync_async(account, to_time=sync_time)
+    assert sorted(change.order.orderId for change in changes) == [1, 2, 3, 4, 5, 6]
+    assert all(change.change_type == OrderChangeType.New for change in changes)
+    assert len(events) == 6
+    assert order_sync.state("123456789").watermark == sync_time
+
+    # the open order fills and a new order arrives after the watermark
+    book.add(6, sync_time - timedelta(days=3, hours=1), status="FILLED")
+    book.add(7, sync_time + timedelta(minutes=30), status="WORKING")
+    requests_before = len(httpx_mock.get_requests())
+    changes = await order_sync.sync_async(
+        account, to_time=sync_time + timedelta(hours=1)
+    )
+    assert sorted((change.order.orderId, change.change_type) for change in changes) == [
+        (6, OrderChangeType.FilledQuantityChanged),
+        (6, OrderChangeType.StatusChanged),
+        (7, OrderChangeType.New),
+    ]
+    # one delta window plus one refresh of the open order, no re-download of history
+    assert len(httpx_mock.get_requests()) - requests_before == 2
+    delta_request = httpx_mock.get_requests(url=orders_url)[-1]
+    assert delta_request.url.params["fromEnteredTime"] == util.to_iso8601_str(
+        sync_time - order_sync.overlap
+    )
+
+    assert (
+        await order_sync.sync_async(account, to_time=sync_time + timedelta(hours=2))
+        == []
+    )
+    assert len(order_sync.orders("123456789")) == 7
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_order_sync_drops_open_orders_no_longer_found(
+    httpx_mock: HTTPXMock,
+) -> None:
+    book = MockOrderBook()
+    httpx_mock.add_callback(book.list_orders, url=orders_url, is_reusable=True)
+    httpx_mock.add_callback(book.get_order, url=order_by_id_url, is_reusable=True)
+    book.add(1, sync_time - timedelta(days=1), status="WORKING")
+    order_sync = OrderSync(
+        SchwabAsyncClient(
+            app_client_id="fake_id",
+            app_secret="fake_secret",
+            token_store=async_token_store,
+            tokens=mock_tokens(),
+        )
+    )
+    await order_sync.sync_async(account, to_time=sync_time)
+    assert list(order_sync.orders("123456789").keys()) == [1]
+
+    del book.orders[1]
+    changes = await order_sync.sync_async(
+        account, to_time=sync_time + timedelta(hours=1)
+    )
+    assert [(change.order.orderId, change.change_type) for change in changes] == [
+        (1, OrderChangeType.Removed)
+    ]
+    assert order_sync.orders("123456789") == {}
+
+    # no longer re-read by ID
+    assert len(httpx_mock.get_requests(url=order_by_id_url)) == 1
+    await order_sync.sync_async(account, to_time=sync_time + timedelta(hours=2))
+    assert len(httpx_mock.get_requests(url=order_by_id_url)) == 1
@@ -0,0 +1,84 @@
+import pytest
+from datetime import timedelta
+from pytest_httpx import HTTPXMock
+from cschwabpy.models.token import AsyncLocalTokenStore, LocalTokenStore
+from cschwabpy.pagination import split_window
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+import cschwabpy.util as util
+
+from .test_token import mock_tokens
+from .test_order_sync import MockOrderBook, account, orders_url, sync_time
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+from_time = sync_time - timedelta(days=30)
+
+
+def mock_order_book() -> MockOrderBook:
+    book = MockOrderBook()
+    for order_id in range(1, 41):
+        book.add(order_id, sync_time - timedelta(hours=17 * order_id))
+    # same second, can only be returned together
+    book.add(41, sync_time - timedelta(hours=17))
+    return book
+
+
+def test_split_window() -> None:
+    halves = split_window(from_time, sync_time)
+    assert halves[0][0] == from_time and halves[1][1] == sync_time
+    assert halves[0][1] == halves[1][0]
+    assert halves[0][1].microsecond == 0
+    assert split_window(sync_time, sync_time + timedelta(seconds=1)) is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_get_all_orders_async_bisects_full_pages(httpx_mock: HTTPXMock) -> None:
+    book = mock_order_book()
+    httpx_mock.add_callback(book.list_orders, url=orders_url, is_reusable=True)
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    truncated = await cschwab_client.get_orders_async(
+        account, from_time, sync_time, max_count=5
+    )
+    assert len(truncated) == 5
+
+    orders = await cschwab_client.get_all_orders_async(
+        account, from_time, sync_time, page_size=5, max_concurrency=4
+    )
+    order_ids = [order.orderId for order in orders]
+    assert sorted(order_ids) == list(range(1, 42))
+    assert len(httpx_mock.get_requests(url=orders_url)) > 2
+
+    streamed = []
+    async for order in cschwab_client.iter_all_orders_async(
+        account, from_time, sync_time, page_size=5
+    ):
+        streamed.append(order.orderId)
+        if len(streamed) == 3:
+            break
+    assert len(set(streamed)) == 3
+
+
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+def test_get_all_orders_bisects_full_pages(httpx_mock: HTTPXMock) -> None:
+    book = mock_order_book()
+    httpx_mock.add_callback(book.list_orders, url=orders_url, is_reusable=True)
+    with SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+    ) as cschwab_client:
+        orders = cschwab_client.get_all_orders(
+            account, from_time, sync_time, page_size=5
+        )
+    assert sorted(order.orderId for order in orders) == list(range(1, 42))
+    assert util.to_iso8601_str(from_time) == (
+        httpx_mock.get_requests(url=orders_url)[0].url.params["fromEnteredTime"]
+    )
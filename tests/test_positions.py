@@ -0,0 +1,131 @@
+from datetime import datetime
+from cschwabpy.models.trade_models import (
+    Account,
+    AccountNumberWithHashID,
+    AccountSnapshotEntry,
+    AccountsSnapshot,
+    Position,
+)
+from cschwabpy.positions import PositionChangeType, PositionIndex, instrument_key
+
+
+def mock_position(
+    symbol: str = None,
+    cusip: str = None,
+    long_quantity: float = 0,
+    short_quantity: float = 0,
+    open_pnl: float = 0,
+) -> Position:
+    return Position(
+        instrument={"symbol": symbol, "cusip": cusip, "assetType": "EQUITY"},
+        longQuantity=long_quantity,
+        shortQuantity=short_quantity,
+        longOpenProfitLoss=open_pnl,
+    )
+
+
+def mock_account(account_number: str, positions) -> Account:
+    return Account(accountNumber=account_number, positions=positions)
+
+
+def test_instrument_key() -> None:
+    assert instrument_key(mock_position("spy")) == "SPY"
+    assert instrument_key(mock_position(cusip="912828")) == "cusip:912828"
+    assert instrument_key(Position()) is None
+
+
+def test_position_index_diff() -> None:
+    before = PositionIndex.from_accounts(
+        [
+            mock_account(
+                "1",
+                [
+                    mock_position("AAPL", long_quantity=10, open_pnl=50),
+                    mock_position("MSFT", long_quantity=5, open_pnl=20),
+                    mock_position("TSLA", short_quantity=3, open_pnl=-10),
+                ],
+            ),
+            mock_account("2", [mock_position("AAPL", long_quantity=1)]),
+        ]
+    )
+    after = PositionIndex.from_accounts(
+        [
+            mock_account(
+                "1",
+                [
+                    mock_position("AAPL", long_quantity=10, open_pnl=50.5),
+                    mock_position("MSFT", long_quantity=7, open_pnl=80),
+                    mock_position("IBM", long_quantity=2),
+                    Position(instrument=None, longQuantity=1),
+                ],
+            ),
+            mock_account("2", [mock_position("AAPL", long_quantity=1)]),
+        ]
+    )
+    assert len(after) == 4
+    assert after.get("1", "msft").longQuantity == 7
+
+    diff = after.diff(after)
+    assert not diff
+
+    diff = before.diff(after, pnl_threshold=1.0)
+    assert [change.key for change in diff.added] == [("1", "IBM")]
+    assert [change.key for change in diff.removed] == [("1", "TSLA")]
+    assert diff.removed[0].position is None
+    assert [change.key for change in diff.quantity_changed] == [("1", "MSFT")]
+    assert diff.quantity_changed[0].previous.longQuantity == 5
+    # AAPL moved by 0.5, below the threshold
+    assert [change.key for change in diff.profit_loss_changed] == [("1", "MSFT")]
+    assert diff.changed_keys == [("1", "IBM"), ("1", "TSLA"), ("1", "MSFT")]
+    assert {change.change_type for change in diff.changes} == set(PositionChangeType)
+
+    assert [change.key for change in before.diff(after).profit_loss_changed] == [
+        ("1", "AAPL"),
+        ("1", "MSFT"),
+    ]
+
+
+def mock_snapshot(*entries: AccountSnapshotEntry) -> AccountsSnapshot:
+    now = datetime.now()
+    return AccountsSnapshot(
+        started_at=now,
+        completed_at=now,
+        entries={entry.account_number.accountNumber: entry for entry in entries},
+    )
+
+
+def mock_entry(account_number: str, positions, with_positions: bool = True):
+    now = datetime.now()
+    return AccountSnapshotEntry(
+        account_number=AccountNumberWithHashID(
+            accountNumber=account_number, hashValue=f"hash{account_number}"
+        ),
+        account=mock_account(account_number, positions),
+        fetched_at=now,
+        positions_fetched_at=now if with_positions else None,
+    )
+
+
+def test_position_index_from_snapshot_skips_entries_without_positions() -> None:
+    before = PositionIndex.from_snapshot(
+        mock_snapshot(
+            mock_entry("1", [mock_position("AAPL", long_quantity=10)]),
+            mock_entry("2", [mock_position("MSFT", long_quantity=5)]),
+        )
+    )
+    snapshot = mock_snapshot(
+        mock_entry("1", [mock_position("AAPL", long_quantity=12)]),
+        mock_entry("2", [], with_positions=False),
+    )
+    failed_entry = mock_entry("3", [mock_position("IBM", long_quantity=1)])
+    failed_entry.error = Exception("boom")
+    snapshot.entries["3"] = failed_entry
+
+    after = PositionIndex.from_snapshot(snapshot)
+    assert after.keys() == [("1", "AAPL")]
+
+    after = PositionIndex.from_snapshot(snapshot, previous=before)
+    assert after.keys() == [("1", "AAPL"), ("2", "MSFT")]
+    diff = before.diff(after)
+    assert not diff.removed
+    assert diff.changed_keys == [("1", "AAPL")]
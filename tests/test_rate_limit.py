@@ -0,0 +1,78 @@
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.costants import (
+    SCHWAB_API_BASE_URL,
+    SCHWAB_MARKET_DATA_API_BASE_URL,
+    SCHWAB_TRADER_API_BASE_URL,
+)
+from cschwabpy.models.token import LocalTokenStore, AsyncLocalTokenStore
+from cschwabpy.rate_limit import (
+    TokenBucket,
+    SchwabRateLimiter,
+    TRADER_BUCKET,
+    MARKET_DATA_BUCKET,
+)
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+
+from .test_token import mock_tokens
+from .test_models import get_mock_response
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+
+
+def test_token_bucket_burst_then_wait() -> None:
+    bucket = TokenBucket(rate=10, capacity=3)
+    assert [bucket.reserve() for _ in range(3)] == [0.0, 0.0, 0.0]
+    wait_seconds = bucket.reserve()
+    assert 0.05 < wait_seconds <= 0.1
+    # reservations queue up behind each other
+    assert bucket.reserve() > wait_seconds
+    assert bucket.stats.requests == 5
+    assert bucket.stats.delayed_requests == 2
+    assert bucket.stats.max_wait_seconds > wait_seconds
+
+
+def test_rate_limiter_buckets_by_endpoint() -> None:
+    limiter = SchwabRateLimiter()
+    assert limiter.bucket_for(f"{SCHWAB_TRADER_API_BASE_URL}/accounts") is (
+        limiter.buckets[TRADER_BUCKET]
+    )
+    assert limiter.bucket_for(f"{SCHWAB_MARKET_DATA_API_BASE_URL}/chains") is (
+        limiter.buckets[MARKET_DATA_BUCKET]
+    )
+    assert limiter.bucket_for(f"{SCHWAB_API_BASE_URL}/oauth/token") is None
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_rate_limiter_shared_by_clients(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=get_mock_response()["account_numbers"], is_reusable=True
+    )
+    limiter = SchwabRateLimiter(trader_requests_per_minute=6000, burst=2)
+    async with SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        rate_limiter=limiter,
+    ) as cschwab_client:
+        for _ in range(3):
+            await cschwab_client.get_account_numbers_async()
+
+    with SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+        rate_limiter=limiter,
+    ) as cschwab_client2:
+        cschwab_client2.get_account_numbers()
+
+    trader_stats = limiter.stats[TRADER_BUCKET]
+    assert trader_stats.requests == 4
+    assert trader_stats.delayed_requests >= 1
+    assert trader_stats.avg_wait_seconds > 0
+    assert limiter.stats[MARKET_DATA_BUCKET].requests == 0
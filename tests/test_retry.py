@@ -0,0 +1,102 @@
+import httpx
+import pytest
+from pytest_httpx import HTTPXMock
+from cschwabpy.models.token import AsyncLocalTokenStore, TokensNotAvailableError
+from cschwabpy.models.trade_models import (
+    AccountNumberWithHashID,
+    Order,
+    Session,
+    Duration,
+    OrderType,
+)
+from cschwabpy.retry import RetryPolicy, parse_retry_after
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+
+from .test_token import mock_tokens, CountingAsyncTokenStore
+from .test_models import get_mock_response
+
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+
+
+def mock_client(**kwargs) -> SchwabAsyncClient:
+    return SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        **kwargs,
+    )
+
+
+def test_parse_retry_after() -> None:
+    assert parse_retry_after(None) is None
+    assert parse_retry_after("2") == 2.0
+    assert parse_retry_after("Wed, 21 Oct 2015 07:28:00 GMT") == 0.0
+    assert parse_retry_after("soon") is None
+
+
+def test_retry_policy_decisions() -> None:
+    policy = RetryPolicy(max_attempts=3)
+    too_many = httpx.Response(429, headers={"Retry-After": "7"})
+    assert policy.should_retry_response("GET", too_many, attempt=0)
+    assert not policy.should_retry_response("GET", too_many, attempt=2)
+    assert not policy.should_retry_response("POST", too_many, attempt=0)
+    assert not policy.should_retry_response("GET", httpx.Response(404), attempt=0)
+    assert policy.delay_for(0, too_many) == 7.0
+    assert 0 <= policy.delay_for(3) <= 4.0
+
+    assert policy.should_retry_exception("POST", httpx.ConnectError("down"), 0)
+    assert not policy.should_retry_exception("POST", httpx.ReadTimeout("slow"), 0)
+    assert policy.should_retry_exception("GET", httpx.ReadTimeout("slow"), 0)
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_retry_honors_retry_after(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=429, headers={"Retry-After": "0"})
+    httpx_mock.add_response(status_code=503)
+    httpx_mock.add_response(json=get_mock_response()["account_numbers"])
+    cschwab_client = mock_client(retry_policy=RetryPolicy(base_delay=0.001))
+    account_numbers = await cschwab_client.get_account_numbers_async()
+    assert len(account_numbers) == 2
+    assert cschwab_client.pool_stats.retries == 2
+    assert len(httpx_mock.get_requests()) == 3
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_place_order_is_not_retried(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(status_code=503, is_reusable=True)
+    cschwab_client = mock_client(retry_policy=RetryPolicy(base_delay=0.001))
+    order = Order(
+        session=Session.NORMAL,
+        duration=Duration.DAY,
+        orderType=OrderType.LIMIT,
+        price=1.0,
+    )
+    with pytest.raises(Exception):
+        await cschwab_client.place_order_async(
+            AccountNumberWithHashID(accountNumber="123", hashValue="hash1"), order
+        )
+    assert len(httpx_mock.get_requests()) == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_connection_error_is_retried(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_exception(httpx.ConnectError("connection refused"))
+    httpx_mock.add_response(json=get_mock_response()["account_numbers"])
+    cschwab_client = mock_client(retry_policy=RetryPolicy(base_delay=0.001))
+    account_numbers = await cschwab_client.get_account_numbers_async()
+    assert len(account_numbers) == 2
+
+
+@pytest.mark.asyncio
+async def test_missing_tokens_are_not_retried() -> None:
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=CountingAsyncTokenStore(),
+    )
+    with pytest.raises(TokensNotAvailableError):
+        await cschwab_client._ensure_valid_access_token()
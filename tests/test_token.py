@@ -1,11 +1,22 @@
 # to run: python -m pytest -s tests/test_token.py
 
+import asyncio
 import pytest
 import os
 from typing import Optional
 from datetime import datetime, timedelta
 from pathlib import Path
-from cschwabpy.models.token import Tokens, LocalTokenStore, ITokenStore
+from pytest_httpx import HTTPXMock
+from cschwabpy.models.token import (
+    Tokens,
+    LocalTokenStore,
+    ITokenStore,
+    IAsyncTokenStore,
+    get_shared_refresh_lock,
+)
+from cschwabpy.models.trade_models import AccountNumberWithHashID
+from cschwabpy.retry import RetryPolicy
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
 
 
 def mock_tokens(created_at: Optional[datetime] = None) -> Tokens:
@@ -69,3 +80,204 @@ def test_token_store() -> None:
     assert retrieved_token.id_token == mocked_token1.id_token
     assert retrieved_token.scope == mocked_token1.scope
     os.remove(local_store.token_output_path)  # clean up after tests
+
+
+class CountingAsyncTokenStore(IAsyncTokenStore):
+    def __init__(self, tokens: Optional[Tokens] = None) -> None:
+        self.tokens = tokens
+        self.save_count = 0
+
+    async def get_tokens(self) -> Optional[Tokens]:
+        return self.tokens
+
+    async def save_tokens(self, tokens: Tokens) -> None:
+        self.save_count += 1
+        self.tokens = tokens
+
+
+class SlowAsyncTokenStore(CountingAsyncTokenStore):
+    async def save_tokens(self, tokens: Tokens) -> None:
+        await asyncio.sleep(0.01)
+        await super().save_tokens(tokens)
+
+
+def test_tokens_expiry_margin() -> None:
+    tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=1790))
+    assert tokens.is_access_token_valid
+    assert tokens.expires_within(60)
+    assert not mock_tokens().expires_within(60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_single_flight_token_refresh(httpx_mock: HTTPXMock) -> None:
+    fresh_tokens = mock_tokens()
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        json=fresh_tokens.to_json(),
+        is_reusable=True,
+    )
+    httpx_mock.add_response(method="DELETE", is_reusable=True)
+    store = CountingAsyncTokenStore()
+    expired_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=3600))
+    async with SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=store,
+        tokens=expired_tokens,
+    ) as cschwab_client:
+        account = AccountNumberWithHashID(accountNumber="123", hashValue="hash1")
+        results = await asyncio.gather(
+            *[cschwab_client.cancel_order_async(account, i) for i in range(50)]
+        )
+        assert all(results)
+
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert store.save_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_shared_token_refresh_across_clients(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        json=mock_tokens().to_json(),
+        is_reusable=True,
+    )
+    expired_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=3600))
+    store = CountingAsyncTokenStore(tokens=expired_tokens)
+    clients = [
+        SchwabAsyncClient(
+            app_client_id="fake_id",
+            app_secret="fake_secret",
+            token_store=store,
+            share_refresh_across_clients=True,
+        )
+        for _ in range(5)
+    ]
+    results = await asyncio.gather(
+        *[client._ensure_valid_access_token() for client in clients]
+    )
+    assert all(results)
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert store.save_count == 1
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_background_token_refresh(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        json=mock_tokens().to_json(),
+        is_reusable=True,
+    )
+    expiring_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=1790))
+    store = CountingAsyncTokenStore(tokens=expiring_tokens)
+    async with SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=store,
+        tokens=expiring_tokens,
+        refresh_margin_seconds=60,
+    ) as cschwab_client:
+        # still valid, so the caller is not blocked while the refresh runs in background
+        assert await cschwab_client._ensure_valid_access_token()
+        for _ in range(10):
+            if store.save_count > 0:
+                break
+            await asyncio.sleep(0.01)
+
+    assert store.save_count == 1
+    assert not store.tokens.expires_within(60)
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_failed_token_refresh_is_shared(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        status_code=400,
+        json={"error": "invalid_grant"},
+        is_reusable=True,
+    )
+    expired_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=3600))
+    store = CountingAsyncTokenStore(tokens=expired_tokens)
+    cschwab_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=store,
+        tokens=expired_tokens,
+        retry_policy=RetryPolicy(max_attempts=1),
+    )
+    results = await asyncio.gather(
+        *[cschwab_client._ensure_valid_access_token() for _ in range(50)]
+    )
+    assert results == [False] * 50
+    assert len(httpx_mock.get_requests(method="POST")) == 1
+    assert store.save_count == 0
+
+    # a later caller tries again
+    assert not await cschwab_client._ensure_valid_access_token()
+    assert len(httpx_mock.get_requests(method="POST")) == 2
+
+
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+def test_token_refresh_across_event_loops(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        json=mock_tokens().to_json(),
+        is_reusable=True,
+    )
+    httpx_mock.add_response(
+        url="https://api.schwabapi.com/trader/v1/accounts/accountNumbers",
+        json=[{"accountNumber": "123", "hashValue": "hash1"}],
+        is_reusable=True,
+    )
+    expired_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=3600))
+    store = SlowAsyncTokenStore(tokens=expired_tokens)
+    clients = [
+        SchwabAsyncClient(
+            app_client_id="fake_id",
+            app_secret="fake_secret",
+            token_store=store,
+            tokens=expired_tokens,
+            share_refresh_across_clients=True,
+        )
+        for _ in range(2)
+    ]
+
+    async def refresh_and_resolve() -> None:
+        # concurrent callers make the refresh and account number locks wait, which binds them to the loop
+        assert all(
+            await asyncio.gather(
+                *[
+                    cschwab_client._ensure_valid_access_token(force_refresh=True)
+                    for cschwab_client in clients
+                ]
+            )
+        )
+        for cschwab_client in clients:
+            cschwab_client.account_hash_cache.invalidate()
+            accounts = await asyncio.gather(
+                *[cschwab_client.resolve_account_async("123") for _ in range(5)]
+            )
+            assert all(account.hashValue == "hash1" for account in accounts)
+
+    async def wait_on_shared_lock() -> None:
+        lock = get_shared_refresh_lock(store)
+        async with lock:
+            waiter = asyncio.ensure_future(lock.acquire())
+            await asyncio.sleep(0)
+        await waiter
+        lock.release()
+
+    # every asyncio.run is a new loop; locks used on the first one must not be reused
+    for _ in range(2):
+        asyncio.run(wait_on_shared_lock())
+        asyncio.run(refresh_and_resolve())
+    assert store.save_count >= 2
@@ -0,0 +1,126 @@
+import pytest
+from datetime import datetime, timedelta
+from pytest_httpx import HTTPXMock
+from cschwabpy.models.token import LocalTokenStore, AsyncLocalTokenStore
+from cschwabpy.SchwabAsyncClient import SchwabAsyncClient
+from cschwabpy.SchwabClient import SchwabClient
+from cschwabpy.transport import PoolConfig, AuthHeaders
+
+from .test_token import CountingAsyncTokenStore, mock_tokens
+from .test_models import get_mock_response
+
+token_store = LocalTokenStore(json_file_name="test_tokens.json")
+async_token_store = AsyncLocalTokenStore(json_file_name="test_tokens_async.json")
+
+
+def test_pool_config_limits() -> None:
+    config = PoolConfig(max_connections=5, max_keepalive_connections=2, http2=False)
+    assert config.limits.max_connections == 5
+    assert config.limits.max_keepalive_connections == 2
+    assert not config.use_http2
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_async_client_pooled_transport(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=get_mock_response()["account_numbers"], is_reusable=True
+    )
+    async with SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+        pool_config=PoolConfig(max_connections=4),
+    ) as cschwab_client:
+        assert cschwab_client.is_pooled
+        for _ in range(3):
+            account_numbers = await cschwab_client.get_account_numbers_async()
+            assert len(account_numbers) == 2
+
+        stats = cschwab_client.pool_stats
+        assert stats.pooled
+        assert stats.clients_created == 1
+        assert stats.requests_sent == 3
+        assert stats.max_connections == 4
+
+    assert not cschwab_client.is_pooled
+
+    one_off_client = SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=async_token_store,
+        tokens=mock_tokens(),
+    )
+    for _ in range(2):
+        await one_off_client.get_account_numbers_async()
+    assert not one_off_client.pool_stats.pooled
+    assert one_off_client.pool_stats.clients_created == 2
+
+
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+def test_sync_client_pooled_transport(httpx_mock: HTTPXMock) -> None:
+    httpx_mock.add_response(
+        json=get_mock_response()["account_numbers"], is_reusable=True
+    )
+    with SchwabClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=token_store,
+        tokens=mock_tokens(),
+    ) as cschwab_client:
+        for _ in range(3):
+            account_numbers = cschwab_client.get_account_numbers()
+            assert len(account_numbers) == 2
+
+        stats = cschwab_client.pool_stats
+        assert stats.pooled
+        assert stats.clients_created == 1
+        assert stats.requests_sent == 3
+
+    assert not cschwab_client.is_pooled
+
+
+def test_auth_headers_render() -> None:
+    headers = AuthHeaders.render("Bearer", "access_token")
+    assert headers.default["Authorization"] == "Bearer access_token"
+    assert headers.json_content["Content-Type"] == "application/json"
+    assert "Content-Type" not in headers.default
+    with pytest.raises(TypeError):
+        headers.default["Authorization"] = "changed"
+
+
+@pytest.mark.asyncio
+@pytest.mark.httpx_mock(assert_all_requests_were_expected=False)
+async def test_pooled_client_auth_headers_swap_on_refresh(
+    httpx_mock: HTTPXMock,
+) -> None:
+    refreshed_tokens = mock_tokens()
+    refreshed_tokens.access_token = "refreshed_access_token"
+    httpx_mock.add_response(
+        method="POST",
+        url="https://api.schwabapi.com/v1/oauth/token",
+        json=refreshed_tokens.to_json(),
+    )
+    httpx_mock.add_response(
+        method="GET", json=get_mock_response()["account_numbers"], is_reusable=True
+    )
+    expired_tokens = mock_tokens(created_at=datetime.now() - timedelta(seconds=3600))
+    store = CountingAsyncTokenStore(tokens=expired_tokens)
+    async with SchwabAsyncClient(
+        app_client_id="fake_id",
+        app_secret="fake_secret",
+        token_store=store,
+        tokens=expired_tokens,
+    ) as cschwab_client:
+        await cschwab_client.get_account_numbers_async()
+        await cschwab_client.get_account_numbers_async()
+
+    assert store.tokens.access_token == "refreshed_access_token"
+
+    get_requests = httpx_mock.get_requests(method="GET")
+    assert len(get_requests) == 2
+    for request in get_requests:
+        assert request.headers["Authorization"] == "Bearer refreshed_access_token"
+    token_request = httpx_mock.get_request(method="POST")
+    assert token_request.headers["Authorization"].startswith("Basic ")